@@ -3,32 +3,96 @@ Certification state API endpoints.
 FIXES Issue #5: State persistence.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import Dict
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session, undefer_group
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, Callable, Dict
+import orjson
 
-from app.database import get_db
+from app.database import get_db, get_async_db, AsyncSessionLocal
+from app.models import (
+    bump_poll_version,
+    get_certification_graph_json_async,
+    stream_poll_participants_async
+)
 from app.models.certification_state import CertificationState
 from app.services.ppe_assignment_service import get_assignment_service
+from app.services.graph_expansion_service import expansion_service
+from app.schemas.certification import dump_certification_states
 
 router = APIRouter(prefix="/api/polls/{poll_id}/certification", tags=["certification"])
 
 
+async def _record_ppe_result(
+    db: AsyncSession,
+    poll_id: str,
+    user_id: str,
+    statement,
+    apply: Callable[[CertificationState], None]
+) -> CertificationState:
+    """
+    Apply a PPE completion/failure to a user's certification state.
+    
+    On SQLite the change is a single UPDATE ... RETURNING; other databases
+    load the row and apply the change in Python.
+    
+    Args:
+        db: Database session
+        poll_id: Poll identifier
+        user_id: User whose state changes
+        statement: UPDATE ... RETURNING statement built by CertificationState
+        apply: ORM-side equivalent of the statement
+        
+    Returns:
+        Updated certification state
+    """
+    query = (
+        select(CertificationState)
+        .filter_by(user_id=user_id, poll_id=poll_id)
+        .options(undefer_group("ppe_history"))
+    )
+    use_returning = db.bind.dialect.name == "sqlite"
+    
+    if use_returning:
+        cert_state = (await db.execute(statement)).scalar_one_or_none()
+        if cert_state is None:
+            # Either no state, or this PPE was already recorded
+            cert_state = (await db.execute(query)).scalar_one_or_none()
+    else:
+        cert_state = (await db.execute(query)).scalar_one_or_none()
+        if cert_state:
+            apply(cert_state)
+    
+    if not cert_state:
+        raise HTTPException(status_code=404, detail="Certification state not found")
+    
+    await db.commit()
+    if not use_returning:
+        await db.refresh(cert_state)
+    
+    # Certification graph changed (the UPDATE bypasses the ORM's change tracking)
+    expansion_service.invalidate_metrics(poll_id)
+    bump_poll_version(poll_id)
+    
+    return cert_state
+
+
 @router.get("/state")
 async def get_certification_state(
     poll_id: str,
     user_id: str,  # TODO: Get from auth
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get user's certification state.
     
     FIXES Issue #5: Frontend can restore state on refresh.
     """
-    cert_state = db.query(CertificationState).filter_by(
-        user_id=user_id,
-        poll_id=poll_id
-    ).first()
+    cert_state = (await db.execute(
+        select(CertificationState).filter_by(user_id=user_id, poll_id=poll_id)
+    )).scalar_one_or_none()
     
     if not cert_state:
         return {
@@ -42,8 +106,54 @@ async def get_certification_state(
     }
 
 
+@router.get("/states")
+async def list_certification_states(
+    poll_id: str,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get every participant's certification state for a poll."""
+    states = (await db.execute(
+        select(CertificationState).filter_by(poll_id=poll_id)
+    )).scalars().all()
+    
+    return {
+        "poll_id": poll_id,
+        "states": dump_certification_states(states),
+        "count": len(states)
+    }
+
+
+@router.get("/graph")
+async def get_certification_graph(
+    poll_id: str,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get the poll's certification graph (JSON is built by the database)."""
+    return Response(
+        content=await get_certification_graph_json_async(db, poll_id),
+        media_type="application/json"
+    )
+
+
+@router.get("/participants")
+async def stream_participants(poll_id: str):
+    """
+    Stream every participant with their certification summary as NDJSON.
+    
+    One JSON object per line, written as rows arrive from the database.
+    """
+    async def ndjson() -> AsyncIterator[bytes]:
+        # The session must outlive the handler, so it is opened here rather
+        # than injected with Depends
+        async with AsyncSessionLocal() as db:
+            async for participant in stream_poll_participants_async(db, poll_id):
+                yield orjson.dumps(participant) + b"\n"
+    
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.get("/assignments")
-async def get_ppe_assignments(
+def get_ppe_assignments(
     poll_id: str,
     user_id: str,  # TODO: Get from auth
     db: Session = Depends(get_db)
@@ -66,19 +176,14 @@ async def complete_ppe(
     partner_id: str,
     ppe_id: str,
     signature: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Record PPE completion."""
-    cert_state = db.query(CertificationState).filter_by(
-        user_id=user_id,
-        poll_id=poll_id
-    ).first()
-    
-    if not cert_state:
-        raise HTTPException(status_code=404, detail="Certification state not found")
-    
-    cert_state.add_completed_ppe(ppe_id, partner_id, signature)
-    db.commit()
+    cert_state = await _record_ppe_result(
+        db, poll_id, user_id,
+        CertificationState.completed_ppe_update(user_id, poll_id, ppe_id, partner_id, signature),
+        lambda state: state.add_completed_ppe(ppe_id, partner_id, signature)
+    )
     
     return {
         "success": True,
@@ -91,19 +196,14 @@ async def fail_ppe(
     poll_id: str,
     user_id: str,
     ppe_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Record PPE failure."""
-    cert_state = db.query(CertificationState).filter_by(
-        user_id=user_id,
-        poll_id=poll_id
-    ).first()
-    
-    if not cert_state:
-        raise HTTPException(status_code=404, detail="Certification state not found")
-    
-    cert_state.add_failed_ppe(ppe_id)
-    db.commit()
+    cert_state = await _record_ppe_result(
+        db, poll_id, user_id,
+        CertificationState.failed_ppe_update(user_id, poll_id, ppe_id),
+        lambda state: state.add_failed_ppe(ppe_id)
+    )
     
     return {
         "success": True,
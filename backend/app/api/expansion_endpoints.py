@@ -4,66 +4,151 @@ API endpoints for graph expansion metrics.
 
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional, Tuple
 import networkx as nx
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix
 import logging
 
 from app.models.graph_metrics import GraphExpansionMetrics
 from app.services.graph_expansion_service import expansion_service
-# Note: Update this import path based on your actual database setup
-# from app.database import get_db
-from app.models import get_certification_graph, get_poll_participants
-
-# Temporary placeholder for database dependency
-# Replace with your actual database session dependency
-def get_db():
-    """Placeholder for database session dependency"""
-    pass
+from app.utils.cache import TTLCache
+from app.utils.responses import model_response
+from app.database import get_db
+from app.models import (
+    get_poll_user_ids,
+    get_certification_edges,
+    get_certification_graph_signature
+)
 
 router = APIRouter(prefix="/api/expansion", tags=["expansion"])
 logger = logging.getLogger(__name__)
 
+# Built graphs: {poll_id: (graph_signature, graph)}. Entries are checked
+# against the current signature, so the TTL only bounds idle memory.
+_graph_cache = TTLCache(maxsize=128, ttl=300)
+
 
-def get_poll_graph(db: Session, poll_id: str) -> nx.Graph:
+def _build_csr(user_ids: List[str], edges) -> csr_matrix:
+    """
+    Build a symmetric CSR adjacency matrix for a certification graph.
+    
+    Args:
+        user_ids: Node IDs; row/column i corresponds to user_ids[i]
+        edges: Sized, re-iterable collection of unique undirected
+               (user_id, peer_id) edges (e.g. a graph's EdgeView)
+        
+    Returns:
+        n x n CSR adjacency matrix
+    """
+    index = {user_id: i for i, user_id in enumerate(user_ids)}
+    n = len(user_ids)
+    
+    sources = np.fromiter((index[u] for u, _ in edges), dtype=np.int64, count=len(edges))
+    targets = np.fromiter((index[v] for _, v in edges), dtype=np.int64, count=len(edges))
+    rows = np.concatenate([sources, targets])
+    cols = np.concatenate([targets, sources])
+    data = np.ones(len(rows), dtype=np.float64)
+    
+    return coo_matrix((data, (rows, cols)), shape=(n, n)).tocsr()
+
+
+def get_poll_graph(db: Session, poll_id: str, signature: Optional[Tuple] = None) -> nx.Graph:
     """
     Get certification graph as NetworkX graph for expansion analysis.
     
     Args:
         db: Database session
         poll_id: Poll identifier
+        signature: The poll's graph signature, if the caller already read it
         
     Returns:
-        NetworkX graph with certification edges
+        NetworkX graph with certification edges. The matching CSR
+        adjacency matrix is stored in graph.graph["adjacency"].
     """
-    # Get participants and certifications
-    participants = get_poll_participants(db, poll_id)
-    edges = get_certification_graph(db, poll_id)
+    # Reuse the last built graph if nothing changed since (one scalar query)
+    if signature is None:
+        signature = get_certification_graph_signature(db, poll_id)
+    cached = _graph_cache.get(poll_id)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    # One projected query each for node IDs and certification edges
+    user_ids = get_poll_user_ids(db, poll_id)
     
-    if not participants:
+    if not user_ids:
         raise HTTPException(status_code=404, detail=f"Poll {poll_id} not found or has no participants")
     
+    node_set = set(user_ids)
+    
     # Build NetworkX graph
     G = nx.Graph()
     
-    # Add nodes with attributes
-    for participant in participants:
-        G.add_node(
-            participant.user_id,
-            honest=True,  # Assume all registered participants are honest initially
-            deleted=False  # Track if node was deleted due to failed certifications
-        )
+    # Assume all registered participants are honest initially; 'deleted'
+    # tracks nodes removed due to failed certifications
+    G.add_nodes_from(user_ids, honest=True, deleted=False)
     
     # Add edges (successful PPE certifications)
-    for user_id, peer_id in edges:
-        if G.has_node(user_id) and G.has_node(peer_id):
-            G.add_edge(user_id, peer_id)
+    G.add_edges_from(
+        (user_id, peer_id)
+        for user_id, peer_id in get_certification_edges(db, poll_id)
+        if user_id in node_set and peer_id in node_set
+    )
+    
+    # Nodes were added in user_ids order, so matrix rows line up with G.nodes()
+    G.graph["adjacency"] = _build_csr(user_ids, G.edges())
     
     logger.info(f"Built graph for poll {poll_id}: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
+    
+    _graph_cache.set(poll_id, (signature, G))
+    
     return G
 
 
+def _get_metrics(
+    db: Session,
+    poll_id: str,
+    attack_edges: Optional[int] = None,
+    recalculate: bool = False
+) -> GraphExpansionMetrics:
+    """
+    Get expansion metrics for a poll, computing them only on a cache miss.
+    
+    All expansion endpoints share this, so a dashboard hitting several of
+    them builds the graph and runs the analysis once.
+    
+    Args:
+        db: Database session
+        poll_id: Poll identifier
+        attack_edges: Adversary's attack edges (optional, will be estimated)
+        recalculate: Skip the cache and recompute
+        
+    Returns:
+        Complete GraphExpansionMetrics
+    """
+    # Metrics are keyed on the graph signature, so any change to the poll's
+    # users or certification states (from any process) misses the cache
+    signature = get_certification_graph_signature(db, poll_id)
+    if not recalculate:
+        metrics = expansion_service.get_cached_metrics(poll_id, attack_edges, signature)
+        if metrics is not None:
+            return metrics
+    
+    graph = get_poll_graph(db, poll_id, signature)
+    
+    metrics = expansion_service.compute_metrics(
+        graph=graph,
+        poll_id=poll_id,
+        attack_edges=attack_edges,
+        adjacency=graph.graph.get("adjacency")
+    )
+    expansion_service.cache_metrics(poll_id, metrics, attack_edges, signature)
+    
+    return metrics
+
+
 @router.get("/{poll_id}/metrics", response_model=GraphExpansionMetrics)
-async def get_expansion_metrics(
+def get_expansion_metrics(
     poll_id: str,
     attack_edges: Optional[int] = None,
     recalculate: bool = False,
@@ -85,20 +170,7 @@ async def get_expansion_metrics(
         Complete expansion metrics including Sybil bound
     """
     try:
-        # Get certification graph for poll
-        graph = get_poll_graph(db, poll_id)
-        
-        if graph.number_of_nodes() == 0:
-            raise HTTPException(status_code=404, detail=f"Poll {poll_id} has no participants")
-        
-        # Compute metrics
-        metrics = expansion_service.compute_all_metrics(
-            graph=graph,
-            poll_id=poll_id,
-            attack_edges=attack_edges
-        )
-        
-        return metrics
+        return model_response(_get_metrics(db, poll_id, attack_edges, recalculate), GraphExpansionMetrics)
         
     except HTTPException:
         raise
@@ -108,7 +180,7 @@ async def get_expansion_metrics(
 
 
 @router.get("/{poll_id}/sybil-bound")
-async def get_sybil_bound(
+def get_sybil_bound(
     poll_id: str, 
     attack_edges: Optional[int] = None,
     db: Session = Depends(get_db)
@@ -120,16 +192,7 @@ async def get_sybil_bound(
         Sybil bound information
     """
     try:
-        graph = get_poll_graph(db, poll_id)
-        
-        if graph.number_of_nodes() == 0:
-            raise HTTPException(status_code=404, detail="Poll has no participants")
-        
-        metrics = expansion_service.compute_all_metrics(
-            graph=graph,
-            poll_id=poll_id,
-            attack_edges=attack_edges
-        )
+        metrics = _get_metrics(db, poll_id, attack_edges)
         
         return {
             "poll_id": poll_id,
@@ -145,12 +208,10 @@ async def get_sybil_bound(
 
 
 @router.get("/{poll_id}/expansion/vertex")
-async def get_vertex_expansion(poll_id: str, db: Session = Depends(get_db)):
+def get_vertex_expansion(poll_id: str, db: Session = Depends(get_db)):
     """Get vertex expansion only."""
     try:
-        graph = get_poll_graph(db, poll_id)
-        metrics = expansion_service.compute_all_metrics(graph, poll_id)
-        return metrics.vertex_expansion
+        return _get_metrics(db, poll_id).vertex_expansion
     except HTTPException:
         raise
     except Exception as e:
@@ -159,12 +220,10 @@ async def get_vertex_expansion(poll_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/{poll_id}/expansion/edge")
-async def get_edge_expansion(poll_id: str, db: Session = Depends(get_db)):
+def get_edge_expansion(poll_id: str, db: Session = Depends(get_db)):
     """Get edge expansion (conductance) only."""
     try:
-        graph = get_poll_graph(db, poll_id)
-        metrics = expansion_service.compute_all_metrics(graph, poll_id)
-        return metrics.edge_expansion
+        return _get_metrics(db, poll_id).edge_expansion
     except HTTPException:
         raise
     except Exception as e:
@@ -173,12 +232,10 @@ async def get_edge_expansion(poll_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/{poll_id}/expansion/spectral")
-async def get_spectral_gap(poll_id: str, db: Session = Depends(get_db)):
+def get_spectral_gap(poll_id: str, db: Session = Depends(get_db)):
     """Get spectral gap only."""
     try:
-        graph = get_poll_graph(db, poll_id)
-        metrics = expansion_service.compute_all_metrics(graph, poll_id)
-        return metrics.spectral_gap
+        return _get_metrics(db, poll_id).spectral_gap
     except HTTPException:
         raise
     except Exception as e:
@@ -187,11 +244,10 @@ async def get_spectral_gap(poll_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/{poll_id}/lse-property")
-async def get_lse_property(poll_id: str, db: Session = Depends(get_db)):
+def get_lse_property(poll_id: str, db: Session = Depends(get_db)):
     """Get LSE property verification only."""
     try:
-        graph = get_poll_graph(db, poll_id)
-        metrics = expansion_service.compute_all_metrics(graph, poll_id)
+        metrics = _get_metrics(db, poll_id)
         return {
             "poll_id": poll_id,
             "is_lse": metrics.is_lse,
@@ -202,4 +258,43 @@ async def get_lse_property(poll_id: str, db: Session = Depends(get_db)):
         raise
     except Exception as e:
         logger.error(f"Error computing LSE property: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{poll_id}/all")
+def get_expansion_bundle(
+    poll_id: str,
+    attack_edges: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Get every expansion result in one response.
+    
+    Clients that display vertex, edge, spectral, LSE and Sybil results
+    together should use this instead of one request per metric.
+    
+    Args:
+        poll_id: Poll identifier
+        attack_edges: Adversary's attack edges (optional, will be estimated)
+        db: Database session
+        
+    Returns:
+        Expansion, LSE and Sybil bound results
+    """
+    try:
+        metrics = _get_metrics(db, poll_id, attack_edges)
+        return {
+            "poll_id": poll_id,
+            "vertex_expansion": metrics.vertex_expansion,
+            "edge_expansion": metrics.edge_expansion,
+            "spectral_gap": metrics.spectral_gap,
+            "is_lse": metrics.is_lse,
+            "lse_parameters": metrics.lse_parameters,
+            "sybil_bound": metrics.sybil_bound,
+            "verification_passed": metrics.verification_passed
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error computing expansion bundle: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
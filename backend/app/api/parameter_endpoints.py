@@ -3,11 +3,14 @@ Parameter validation and configuration API endpoints.
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Dict, Any, Tuple
+from functools import lru_cache
 import logging
 
-from app.database import get_db
+from app.database import get_async_db
 from app.models.poll_parameters import (
     ParameterConstraints,
     ParameterValidationResult,
@@ -16,11 +19,100 @@ from app.models.poll_parameters import (
 )
 from app.services.parameter_validator import get_validator
 from app.services.parameter_calculator import get_calculator
-from app.config.parameter_presets import get_preset, get_all_presets
+from app.config.parameter_presets import SECURITY_PRESETS_DUMPED, get_preset_dict
+from app.utils.cache import TTLCache
 
 router = APIRouter(prefix="/api/parameters", tags=["parameters"])
 logger = logging.getLogger(__name__)
 
+# custom_constraints keys used by ParameterCalculator.calculate_for_security_level
+_CONSTRAINT_KEYS = ("d", "kappa", "eta_v", "eta_e")
+
+# The calculation endpoints are pure functions of their inputs, so their
+# responses are memoized (the returned dicts are shared and not mutated).
+@lru_cache(maxsize=4096)
+def _calculate(
+    m: int,
+    security_level: str,
+    constraints: Optional[Tuple[Tuple[str, float], ...]]
+) -> Dict[str, Any]:
+    """Calculate and validate parameters for a security level."""
+    params = get_calculator().calculate_for_security_level(
+        m=m,
+        security_level=security_level,
+        custom_constraints=dict(constraints) if constraints is not None else None
+    )
+    validation = get_validator().validate_all(params)
+    
+    return {
+        "parameters": params.dict(),
+        "validation": validation.dict()
+    }
+
+
+@lru_cache(maxsize=4096)
+def _optimize_for_effort(
+    m: int,
+    max_ppes_per_user: int,
+    min_security_level: float
+) -> Dict[str, Any]:
+    """Calculate and validate effort-optimized parameters."""
+    params = get_calculator().optimize_for_user_effort(
+        m=m,
+        max_ppes_per_user=max_ppes_per_user,
+        min_security_level=min_security_level
+    )
+    validation = get_validator().validate_all(params)
+    
+    return {
+        "parameters": params.dict(),
+        "validation": validation.dict()
+    }
+
+
+@lru_cache(maxsize=4096)
+def _minimum_participants(d: float, kappa: int, eta_v: float) -> int:
+    """Minimum participants for a given degree."""
+    return get_calculator().calculate_minimum_participants(d, kappa, eta_v)
+
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+# PollParameters.to_dict() by poll_id; invalidated by save_poll_parameters
+_poll_parameters_cache = TTLCache(1024, ttl=60)
+
+
+async def _fetch_parameters(db: AsyncSession, poll_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a poll's stored parameters as a dict, served from cache when fresh.
+    
+    Args:
+        db: Database session
+        poll_id: Poll identifier
+        
+    Returns:
+        PollParameters.to_dict() for the poll, or None if none are stored
+    """
+    cached = _poll_parameters_cache.get(poll_id)
+    if cached is not None:
+        return cached
+    
+    params = (await db.execute(
+        select(PollParameters).filter_by(poll_id=poll_id)
+    )).scalar_one_or_none()
+    
+    if not params:
+        return None
+    
+    params_dict = params.to_dict()
+    _poll_parameters_cache.set(poll_id, params_dict)
+    return params_dict
+
 
 @router.post("/validate", response_model=ParameterValidationResult)
 async def validate_parameters(params: ParameterConstraints):
@@ -58,23 +150,16 @@ async def calculate_parameters(
         Calculated parameters and validation result
     """
     try:
-        calculator = get_calculator()
-        validator = get_validator()
-        
-        # Calculate parameters
-        params = calculator.calculate_for_security_level(
-            m=m,
-            security_level=security_level,
-            custom_constraints=custom_constraints
+        # Key only on the constraints the calculator reads, so unrelated
+        # (possibly unhashable) values don't break the cache lookup
+        constraints = (
+            tuple(
+                (key, float(custom_constraints[key]))
+                for key in _CONSTRAINT_KEYS if key in custom_constraints
+            )
+            if custom_constraints is not None else None
         )
-        
-        # Validate calculated parameters
-        validation = validator.validate_all(params)
-        
-        return {
-            "parameters": params.dict(),
-            "validation": validation.dict()
-        }
+        return _calculate(m, security_level, constraints)
         
     except Exception as e:
         logger.error(f"Parameter calculation error: {e}")
@@ -84,18 +169,14 @@ async def calculate_parameters(
 @router.get("/presets")
 async def get_security_presets():
     """Get all security level presets."""
-    presets = get_all_presets()
-    return {
-        "presets": {name: preset.dict() for name, preset in presets.items()}
-    }
+    return {"presets": SECURITY_PRESETS_DUMPED}
 
 
 @router.get("/presets/{security_level}")
 async def get_security_preset(security_level: str):
     """Get specific security level preset."""
     try:
-        preset = get_preset(security_level)
-        return preset.dict()
+        return get_preset_dict(security_level)
     except:
         raise HTTPException(status_code=404, detail=f"Preset {security_level} not found")
 
@@ -118,21 +199,7 @@ async def optimize_for_effort(
         Optimized parameters
     """
     try:
-        calculator = get_calculator()
-        validator = get_validator()
-        
-        params = calculator.optimize_for_user_effort(
-            m=m,
-            max_ppes_per_user=max_ppes_per_user,
-            min_security_level=min_security_level
-        )
-        
-        validation = validator.validate_all(params)
-        
-        return {
-            "parameters": params.dict(),
-            "validation": validation.dict()
-        }
+        return _optimize_for_effort(m, max_ppes_per_user, min_security_level)
         
     except Exception as e:
         logger.error(f"Effort optimization error: {e}")
@@ -151,8 +218,7 @@ async def estimate_minimum_participants(
     Useful for: "I want each user to do d PPEs, how many participants do I need?"
     """
     try:
-        calculator = get_calculator()
-        min_m = calculator.calculate_minimum_participants(d, kappa, eta_v)
+        min_m = _minimum_participants(d, kappa, eta_v)
         
         return {
             "minimum_participants": min_m,
@@ -168,22 +234,22 @@ async def estimate_minimum_participants(
 @router.get("/poll/{poll_id}/parameters")
 async def get_poll_parameters(
     poll_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get stored parameters for a poll."""
-    params = db.query(PollParameters).filter_by(poll_id=poll_id).first()
+    params = await _fetch_parameters(db, poll_id)
     
     if not params:
         raise HTTPException(status_code=404, detail="Poll parameters not found")
     
-    return params.to_dict()
+    return params
 
 
 @router.post("/poll/{poll_id}/parameters")
 async def save_poll_parameters(
     poll_id: str,
     params: ParameterConstraints,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Save and validate parameters for a poll.
@@ -201,7 +267,7 @@ async def save_poll_parameters(
             }
         
         # Save to database
-        poll_params = PollParameters(
+        values = dict(
             poll_id=poll_id,
             m=params.m,
             d=params.d,
@@ -214,8 +280,20 @@ async def save_poll_parameters(
             validation_result=validation.dict()
         )
         
-        db.merge(poll_params)  # Use merge to update if exists
-        db.commit()
+        insert = _UPSERT_INSERTS.get(db.bind.dialect.name)
+        if insert is not None:
+            # Single INSERT ... ON CONFLICT DO UPDATE instead of SELECT + write
+            statement = insert(PollParameters).values(**values)
+            statement = statement.on_conflict_do_update(
+                index_elements=[PollParameters.poll_id],
+                set_={key: statement.excluded[key] for key in values if key != "poll_id"}
+            ).returning(PollParameters)
+            poll_params = (await db.execute(statement)).scalar_one()
+        else:
+            poll_params = await db.merge(PollParameters(**values))
+        
+        await db.commit()
+        _poll_parameters_cache.pop(poll_id)
         
         return {
             "success": True,
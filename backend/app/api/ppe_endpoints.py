@@ -3,13 +3,16 @@ Enhanced PPE API endpoints with support for multiple PPE types.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import Optional, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, List, Tuple, Dict, Any
 import logging
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.models.ppe_types import PPEType, PPEConfig, PPEExecution
 from app.services.ppe_executor import get_ppe_executor
+from app.services.ppe_integration import ppe_config_cache
 from app.schemas.ppe import (
     InitiatePPERequest,
     InitiatePPEResponse,
@@ -20,9 +23,70 @@ from app.schemas.ppe import (
 router = APIRouter(prefix="/api/ppe", tags=["ppe"])
 logger = logging.getLogger(__name__)
 
+# Static descriptions of the certification PPE types, built once at import
+_PPE_TYPE_CATALOG = {
+    PPEType.SYMMETRIC_CAPTCHA: {
+        "type": PPEType.SYMMETRIC_CAPTCHA,
+        "name": "Symmetric CAPTCHA",
+        "description": "Both users solve CAPTCHAs",
+        "effort": "Medium",
+        "security": "High"
+    },
+    PPEType.PROOF_OF_STORAGE: {
+        "type": PPEType.PROOF_OF_STORAGE,
+        "name": "Proof of Storage",
+        "description": "Verify access to cloud storage",
+        "effort": "Low",
+        "security": "Medium-High"
+    },
+    PPEType.COMPUTATIONAL: {
+        "type": PPEType.COMPUTATIONAL,
+        "name": "Computational",
+        "description": "Proof-of-work puzzle",
+        "effort": "Variable",
+        "security": "Very High"
+    },
+    PPEType.SOCIAL_DISTANCE: {
+        "type": PPEType.SOCIAL_DISTANCE,
+        "name": "Social Network Distance",
+        "description": "Reduced effort for social connections",
+        "effort": "Variable (based on connection)",
+        "security": "High"
+    }
+}
+
+_PPE_TYPE_LIST_RESPONSE = {"types": list(_PPE_TYPE_CATALOG.values())}
+
+
+async def _fetch_config(db: AsyncSession, poll_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a poll's PPE config as a dict, served from cache when fresh.
+    
+    Args:
+        db: Database session
+        poll_id: Poll identifier
+        
+    Returns:
+        PPEConfig.to_dict() for the poll, or None if it has no config
+    """
+    cached = ppe_config_cache.get(poll_id)
+    if cached is not None:
+        return cached
+    
+    config = (await db.execute(
+        select(PPEConfig).filter_by(poll_id=poll_id)
+    )).scalar_one_or_none()
+    
+    if not config:
+        return None
+    
+    config_dict = config.to_dict()
+    ppe_config_cache.set(poll_id, config_dict)
+    return config_dict
+
 
 @router.post("/initiate", response_model=InitiatePPEResponse)
-async def initiate_ppe(
+def initiate_ppe(
     request: InitiatePPERequest,
     db: Session = Depends(get_db)
 ):
@@ -58,7 +122,7 @@ async def initiate_ppe(
 
 
 @router.post("/submit/{execution_id}")
-async def submit_ppe_response(
+def submit_ppe_response(
     execution_id: str,
     response: dict,
     db: Session = Depends(get_db)
@@ -86,10 +150,19 @@ async def submit_ppe_response(
 @router.get("/status/{execution_id}", response_model=PPEStatusResponse)
 async def get_ppe_status(
     execution_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get status of PPE execution."""
-    execution = db.query(PPEExecution).filter_by(id=execution_id).first()
+    # Only the columns the response needs (challenge/response JSON is skipped)
+    execution = (await db.execute(
+        select(
+            PPEExecution.id,
+            PPEExecution.status,
+            PPEExecution.result,
+            PPEExecution.failure_reason,
+            PPEExecution.duration_seconds
+        ).where(PPEExecution.id == execution_id)
+    )).one_or_none()
     
     if not execution:
         raise HTTPException(status_code=404, detail="PPE execution not found")
@@ -104,17 +177,17 @@ async def get_ppe_status(
 
 
 @router.get("/active/{poll_id}/{user_id}")
-async def get_active_ppes(
+def get_active_ppes(
     poll_id: str,
     user_id: str,
     db: Session = Depends(get_db)
 ):
     """Get all active PPEs for a user in a poll."""
     executor = get_ppe_executor(db)
-    active = executor.get_active_ppes(user_id, poll_id)
+    active = executor.get_active_ppe_summaries(user_id, poll_id)
     
     return {
-        "active_ppes": [exec.to_dict() for exec in active],
+        "active_ppes": active,
         "count": len(active)
     }
 
@@ -122,56 +195,25 @@ async def get_active_ppes(
 @router.get("/config/{poll_id}")
 async def get_ppe_config(
     poll_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get PPE configuration for a poll."""
-    config = db.query(PPEConfig).filter_by(poll_id=poll_id).first()
+    config = await _fetch_config(db, poll_id)
     
     if not config:
         raise HTTPException(status_code=404, detail="PPE config not found")
     
-    return config.to_dict()
+    return config
 
 
 @router.get("/types")
 async def list_ppe_types():
     """List all available PPE types with descriptions."""
-    return {
-        "types": [
-            {
-                "type": PPEType.SYMMETRIC_CAPTCHA,
-                "name": "Symmetric CAPTCHA",
-                "description": "Both users solve CAPTCHAs",
-                "effort": "Medium",
-                "security": "High"
-            },
-            {
-                "type": PPEType.PROOF_OF_STORAGE,
-                "name": "Proof of Storage",
-                "description": "Verify access to cloud storage",
-                "effort": "Low",
-                "security": "Medium-High"
-            },
-            {
-                "type": PPEType.COMPUTATIONAL,
-                "name": "Computational",
-                "description": "Proof-of-work puzzle",
-                "effort": "Variable",
-                "security": "Very High"
-            },
-            {
-                "type": PPEType.SOCIAL_DISTANCE,
-                "name": "Social Network Distance",
-                "description": "Reduced effort for social connections",
-                "effort": "Variable (based on connection)",
-                "security": "High"
-            }
-        ]
-    }
+    return _PPE_TYPE_LIST_RESPONSE
 
 
 @router.post("/cleanup/{poll_id}")
-async def cleanup_expired_ppes(
+def cleanup_expired_ppes(
     poll_id: str,
     db: Session = Depends(get_db)
 ):
@@ -186,51 +228,25 @@ async def cleanup_expired_ppes(
 @router.get("/available-types/{poll_id}")
 async def get_available_ppe_types(
     poll_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get PPE types available for a specific poll."""
-    config = db.query(PPEConfig).filter_by(poll_id=poll_id).first()
+    config = await _fetch_config(db, poll_id)
     
     if not config:
         raise HTTPException(status_code=404, detail="PPE config not found")
     
-    all_types = {
-        PPEType.SYMMETRIC_CAPTCHA: {
-            "name": "Symmetric CAPTCHA",
-            "description": "Both users solve CAPTCHAs",
-            "effort": "Medium",
-            "security": "High"
-        },
-        PPEType.PROOF_OF_STORAGE: {
-            "name": "Proof of Storage",
-            "description": "Verify access to cloud storage",
-            "effort": "Low",
-            "security": "Medium-High"
-        },
-        PPEType.COMPUTATIONAL: {
-            "name": "Computational",
-            "description": "Proof-of-work puzzle",
-            "effort": "Variable",
-            "security": "Very High"
-        },
-        PPEType.SOCIAL_DISTANCE: {
-            "name": "Social Network Distance",
-            "description": "Reduced effort for social connections",
-            "effort": "Variable (based on connection)",
-            "security": "High"
-        }
-    }
-    
     available = []
-    for ppe_type in config.allowed_certification_types:
-        if ppe_type in all_types:
-            type_info = all_types[ppe_type].copy()
-            type_info["type"] = ppe_type
-            type_info["is_default"] = (ppe_type == config.default_certification_type)
-            available.append(type_info)
+    for ppe_type in config["allowed_certification_types"]:
+        type_info = _PPE_TYPE_CATALOG.get(ppe_type)
+        if type_info is not None:
+            available.append({
+                **type_info,
+                "is_default": ppe_type == config["default_certification_type"]
+            })
     
     return {
         "poll_id": poll_id,
         "available_types": available,
-        "default_type": config.default_certification_type
+        "default_type": config["default_certification_type"]
     }
\ No newline at end of file
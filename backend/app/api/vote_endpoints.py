@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.post("", response_model=VoteResponse)
-async def cast_vote(
+def cast_vote(
     poll_id: str,
     vote_request: VoteRequest,
     db: Session = Depends(get_db)
@@ -30,36 +30,35 @@ async def cast_vote(
     """
     user_id = vote_request.user_id  # TODO: Get from auth token
     
-    # CRITICAL FIX: Use state machine to check if user can vote
-    state_machine = get_state_machine(db)
-    can_vote, reason = state_machine.can_user_vote(user_id, poll_id)
-    
-    if not can_vote:
-        logger.warning(f"Vote denied for user {user_id}: {reason}")
-        raise HTTPException(
-            status_code=403,
-            detail=f"Cannot vote: {reason}"
+    # Eligibility check, vote row and has_voted flag share one transaction;
+    # any exception raised inside the block rolls all of it back.
+    with db.begin():
+        # CRITICAL FIX: Use state machine to check if user can vote
+        state_machine = get_state_machine(db)
+        can_vote, reason = state_machine.can_user_vote(user_id, poll_id)
+        
+        if not can_vote:
+            logger.warning(f"Vote denied for user {user_id}: {reason}")
+            raise HTTPException(
+                status_code=403,
+                detail=f"Cannot vote: {reason}"
+            )
+        
+        # Validate vote content
+        # ... (your existing validation logic)
+        
+        # Record the vote
+        vote = Vote(
+            user_id=user_id,
+            poll_id=poll_id,
+            response=vote_request.response,
+            signature=vote_request.signature
         )
-    
-    # Validate vote content
-    # ... (your existing validation logic)
-    
-    # Record the vote
-    vote = Vote(
-        user_id=user_id,
-        poll_id=poll_id,
-        response=vote_request.response,
-        signature=vote_request.signature
-    )
-    db.add(vote)
-    
-    # CRITICAL: Mark user as voted in state machine
-    success = state_machine.record_vote(user_id, poll_id)
-    if not success:
-        db.rollback()
-        raise HTTPException(status_code=500, detail="Failed to record vote")
-    
-    db.commit()
+        db.add(vote)
+        
+        # CRITICAL: Mark user as voted in state machine
+        if not state_machine.record_vote(user_id, poll_id, commit=False):
+            raise HTTPException(status_code=500, detail="Failed to record vote")
     
     logger.info(f"Vote recorded for user {user_id} in poll {poll_id}")
     
@@ -71,7 +70,7 @@ async def cast_vote(
 
 
 @router.get("/status")
-async def get_vote_status(
+def get_vote_status(
     poll_id: str,
     user_id: str,  # TODO: Get from auth
     db: Session = Depends(get_db)
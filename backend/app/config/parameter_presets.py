@@ -2,7 +2,7 @@
 Parameter presets for common security levels.
 """
 
-from typing import Dict
+from typing import Any, Dict
 from app.models.poll_parameters import SecurityLevel
 
 
@@ -52,6 +52,11 @@ SECURITY_PRESETS: Dict[str, SecurityLevel] = {
     )
 }
 
+# Serialized presets for API responses, dumped once at import
+SECURITY_PRESETS_DUMPED: Dict[str, Dict[str, Any]] = {
+    name: preset.model_dump() for name, preset in SECURITY_PRESETS.items()
+}
+
 
 def get_preset(security_level: str) -> SecurityLevel:
     """Get security level preset."""
@@ -60,4 +65,9 @@ def get_preset(security_level: str) -> SecurityLevel:
 
 def get_all_presets() -> Dict[str, SecurityLevel]:
     """Get all available presets."""
-    return SECURITY_PRESETS
\ No newline at end of file
+    return SECURITY_PRESETS
+
+
+def get_preset_dict(security_level: str) -> Dict[str, Any]:
+    """Get serialized security level preset (same fallback as get_preset)."""
+    return SECURITY_PRESETS_DUMPED.get(security_level, SECURITY_PRESETS_DUMPED["medium"])
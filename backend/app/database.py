@@ -2,25 +2,119 @@
 Database configuration and setup.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 import os
 
 # Database URL from environment or default to SQLite
 DATABASE_URL = os.getenv(
-    "DATABASE_URL", 
+    "DATABASE_URL",
     "sqlite:///./ppe_polls.db"
 )
 
-# Create engine
+
+def _to_async_url(url: str) -> str:
+    """Map a sync database URL onto its async driver equivalent."""
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if url.startswith("postgresql:"):
+        return url.replace("postgresql:", "postgresql+asyncpg:", 1)
+    return url
+
+
+# Connection pool settings (defaults of 5 + 10 overflow exhaust quickly under load)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# Compiled-SQL cache entries per engine (SQLAlchemy default is 500). Only
+# select()/update() constructs are cache keys; legacy Query objects built
+# with ad-hoc text or reflected filters recompile on every call.
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+# Server-side prepared statements kept per asyncpg connection
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+
+# Rows per multi-row INSERT ... VALUES when executemany() inserts (SQLAlchemy
+# default is 1000). Fewer, larger statements cut round-trips on bulk loads.
+DB_INSERT_PAGE_SIZE = int(os.getenv("DB_INSERT_PAGE_SIZE", "10000"))
+# Statements per psycopg2 execute_batch() round-trip for UPDATE/DELETE executemany
+DB_BATCH_PAGE_SIZE = int(os.getenv("DB_BATCH_PAGE_SIZE", "500"))
+
+_is_sqlite = DATABASE_URL.startswith("sqlite")
+
+# psycopg2 (the default PostgreSQL driver) only batches INSERTs unless
+# told to also batch other executemany() statements
+_executemany_args = {
+    "executemany_mode": "values_plus_batch",
+    "executemany_batch_page_size": DB_BATCH_PAGE_SIZE,
+} if DATABASE_URL.startswith(("postgresql:", "postgresql+psycopg2:")) else {}
+
+# In-memory SQLite uses a singleton pool that doesn't accept sizing options
+_pool_args = {} if ":memory:" in DATABASE_URL else {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+}
+
+# Create engine (used by init scripts and the sync service layer)
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+    pool_pre_ping=True,
+    connect_args={"check_same_thread": False, "timeout": 30} if _is_sqlite else {},
+    query_cache_size=DB_QUERY_CACHE_SIZE,
+    insertmanyvalues_page_size=DB_INSERT_PAGE_SIZE,
+    **_executemany_args,
+    **_pool_args
 )
 
+
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """
+    Tune each new SQLite connection for write throughput.
+    
+    WAL lets readers proceed alongside a writer, and synchronous=NORMAL
+    (safe under WAL) fsyncs at checkpoints rather than on every commit.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+if _is_sqlite:
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for request handlers, so SQL round-trips don't block the event loop
+_async_url = _to_async_url(DATABASE_URL)
+async_engine = create_async_engine(
+    _async_url,
+    pool_pre_ping=True,
+    connect_args=(
+        {"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+        if "+asyncpg" in _async_url else {}
+    ),
+    query_cache_size=DB_QUERY_CACHE_SIZE,
+    insertmanyvalues_page_size=DB_INSERT_PAGE_SIZE,
+    **_pool_args
+)
+
+if _is_sqlite:
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
 # Create base class for models
 from sqlalchemy.orm import declarative_base
 Base = declarative_base()
@@ -31,4 +125,10 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# Dependency to get an async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,24 +1,58 @@
+import os
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+
+from .database import DB_POOL_SIZE, DB_MAX_OVERFLOW
+from .services.graph_expansion_service import expansion_service
+from .utils.preflight import PreflightCORSMiddleware
 
 # Import the routers
 from .routes import polls, ws, health, graph, registration, ppe, proof_graph, verification, ppe_config
 from .api import expansion_endpoints, ppe_endpoints, parameter_endpoints
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync (def) handlers run in the threadpool; size it to the DB pool so
+    # blocking endpoints can use every available connection.
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = DB_POOL_SIZE + DB_MAX_OVERFLOW
+    
+    # Expansion metrics are CPU-bound; compute them in worker processes
+    # (EXPANSION_WORKERS=0 computes in-process instead)
+    expansion_workers = int(os.getenv("EXPANSION_WORKERS", str(os.cpu_count() or 1)))
+    if expansion_workers > 0:
+        expansion_service.start_worker_pool(expansion_workers)
+    
+    yield
+    
+    expansion_service.shutdown_worker_pool()
+
+
 app = FastAPI(
     title="PPE Polling System API",
     description="API for the Public Verification of Private Effort polling system.",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# CORSMiddleware with preflight responses prebuilt for the allow-all policy
 app.add_middleware(
-    CORSMiddleware,
+    PreflightCORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Graph and verification payloads repeat the same keys per node/edge and
+# shrink several-fold; level 1 gets most of that for a fraction of the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 @app.get("/", tags=["Root"])
 async def read_root():
     return {"message": "Welcome to the PPE Polling System API!"}
@@ -7,40 +7,240 @@ from .certification_state import CertificationState
 from .proof_graph import ProofGraph, PPECertificationEdge, ParticipantNode, VoteRecord
 from .graph_metrics import GraphExpansionMetrics
 
+from sqlalchemy import event, select, func, text
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Dict, Any, AsyncIterator, Iterator, Tuple
+from itertools import chain
+import orjson
 
-def get_certification_graph(db: Session, poll_id: str) -> Dict[str, Any]:
+from app.utils.cache import TTLCache
+
+# Per-poll change counter, bumped when a commit touches the poll's users or
+# certification states. Participant lists are cached under (poll_id, version),
+# so a bump makes old entries unreachable and they simply age out. The TTL
+# bounds staleness from writes made by other worker processes.
+_poll_versions: Dict[str, int] = {}
+_participants_cache = TTLCache(maxsize=256, ttl=30)
+
+
+def get_poll_version(poll_id: str) -> int:
+    """Get the in-process change counter for a poll."""
+    return _poll_versions.get(poll_id, 0)
+
+
+def bump_poll_version(poll_id: str):
+    """
+    Mark a poll's participants as changed.
+    
+    ORM flushes are tracked automatically; call this after committing
+    bulk UPDATE/INSERT statements that bypass the unit of work.
+    
+    Args:
+        poll_id: Poll identifier
+    """
+    _poll_versions[poll_id] = _poll_versions.get(poll_id, 0) + 1
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_polls(session, flush_context):
+    changed = session.info.setdefault("changed_poll_ids", set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, (User, CertificationState)) and obj.poll_id:
+            changed.add(obj.poll_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_changed_polls(session):
+    # Bump only once committed, so readers can't cache uncommitted rows
+    for poll_id in session.info.pop("changed_poll_ids", ()):
+        bump_poll_version(poll_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_polls(session):
+    session.info.pop("changed_poll_ids", None)
+
+
+def _certification_graph_dict(poll_id: str, user_ids: Tuple[str, ...], total_nodes: int) -> Dict[str, Any]:
+    """Shape the certification graph response for get_certification_graph*."""
+    return {
+        'poll_id': poll_id,
+        'nodes': user_ids,
+        'edges': {},  # Empty for now - would contain actual certification relationships
+        'total_edges': 0,
+        'total_nodes': total_nodes
+    }
+
+
+def _poll_user_ids_query(poll_id: str):
+    return select(User.id).where(User.poll_id == poll_id)
+
+
+def _poll_user_count_query(poll_id: str):
+    return select(func.count()).select_from(User).where(User.poll_id == poll_id)
+
+
+def get_certification_graph(db: Session, poll_id: str, include_nodes: bool = True) -> Dict[str, Any]:
     """
     Get the certification graph for a poll.
     
     Args:
         db: Database session
         poll_id: Poll identifier
+        include_nodes: If False, only count the nodes (nodes is left empty)
         
     Returns:
         Dictionary containing graph structure and metadata
     """
     # For now, return a basic structure since we don't have actual edge tables
     # In a real implementation, this would query the actual certification edges
-    from .user import User
+    if not include_nodes:
+        return _certification_graph_dict(poll_id, (), db.execute(_poll_user_count_query(poll_id)).scalar_one())
     
-    # Get all users for this poll
-    users = db.query(User).filter(User.poll_id == poll_id).all()
+    user_ids = tuple(db.execute(_poll_user_ids_query(poll_id)).scalars())
+    return _certification_graph_dict(poll_id, user_ids, len(user_ids))
+
+
+async def get_certification_graph_async(
+    db: AsyncSession,
+    poll_id: str,
+    include_nodes: bool = True
+) -> Dict[str, Any]:
+    """
+    Async variant of get_certification_graph for AsyncSession callers.
     
-    return {
-        'poll_id': poll_id,
-        'nodes': [user.id for user in users],
-        'edges': {},  # Empty for now - would contain actual certification relationships
-        'total_edges': 0,
-        'total_nodes': len(users)
+    Args:
+        db: Async database session
+        poll_id: Poll identifier
+        include_nodes: If False, only count the nodes (nodes is left empty)
+        
+    Returns:
+        Dictionary containing graph structure and metadata
+    """
+    if not include_nodes:
+        total_nodes = (await db.execute(_poll_user_count_query(poll_id))).scalar_one()
+        return _certification_graph_dict(poll_id, (), total_nodes)
+    
+    user_ids = tuple((await db.execute(_poll_user_ids_query(poll_id))).scalars())
+    return _certification_graph_dict(poll_id, user_ids, len(user_ids))
+
+
+# get_certification_graph's response built entirely in SQL, per dialect
+_CERTIFICATION_GRAPH_JSON_SQL = {
+    "sqlite": text(
+        "SELECT json_object("
+        "'poll_id', :poll_id, 'nodes', json_group_array(id), 'edges', json_object(), "
+        "'total_edges', 0, 'total_nodes', count(*)"
+        ") FROM users WHERE poll_id = :poll_id"
+    ),
+    "postgresql": text(
+        "SELECT json_build_object("
+        "'poll_id', CAST(:poll_id AS text), 'nodes', coalesce(json_agg(id), '[]'::json), "
+        "'edges', '{}'::json, 'total_edges', 0, 'total_nodes', count(*)"
+        ")::text FROM users WHERE poll_id = :poll_id"
+    ),
+}
+
+
+def get_certification_graph_json(db: Session, poll_id: str) -> str:
+    """
+    Get get_certification_graph()'s result as a JSON document.
+    
+    On SQLite and PostgreSQL the database aggregates the node IDs and
+    emits the JSON itself, so no per-user Python objects are created.
+    
+    Args:
+        db: Database session
+        poll_id: Poll identifier
+        
+    Returns:
+        JSON text of the certification graph
+    """
+    statement = _CERTIFICATION_GRAPH_JSON_SQL.get(db.bind.dialect.name)
+    if statement is None:
+        return orjson.dumps(get_certification_graph(db, poll_id)).decode()
+    return db.execute(statement, {"poll_id": poll_id}).scalar_one()
+
+
+async def get_certification_graph_json_async(db: AsyncSession, poll_id: str) -> str:
+    """
+    Async variant of get_certification_graph_json for AsyncSession callers.
+    
+    Args:
+        db: Async database session
+        poll_id: Poll identifier
+        
+    Returns:
+        JSON text of the certification graph
+    """
+    statement = _CERTIFICATION_GRAPH_JSON_SQL.get(db.bind.dialect.name)
+    if statement is None:
+        return orjson.dumps(await get_certification_graph_async(db, poll_id)).decode()
+    return (await db.execute(statement, {"poll_id": poll_id})).scalar_one()
+
+
+def _participants_query(poll_id: str):
+    """Projected users/certification outer join used by get_poll_participants*."""
+    return (
+        select(
+            User.id,
+            User.poll_id,
+            User.registration_order,
+            User.created_at,
+            CertificationState.user_id.label("state_user_id"),
+            CertificationState.required_ppes,
+            CertificationState.completed_ppes,
+            CertificationState.failed_ppes,
+            CertificationState.is_certified,
+            CertificationState.is_excluded,
+            CertificationState.has_voted,
+            CertificationState.completion_percentage.label("completion_percentage"),
+            CertificationState.updated_at
+        )
+        .outerjoin(
+            CertificationState,
+            (User.id == CertificationState.user_id) &
+            (User.poll_id == CertificationState.poll_id)
+        )
+        .where(User.poll_id == poll_id)
+    )
+
+
+def _participant_dict(row) -> Dict[str, Any]:
+    """Build one participant entry from a _participants_query row."""
+    participant_data = {
+        'user_id': row.id,
+        'poll_id': row.poll_id,
+        'registration_order': row.registration_order,
+        'created_at': row.created_at,
+        'certification': None
     }
+    
+    if row.state_user_id is not None:
+        participant_data['certification'] = {
+            'required_ppes': row.required_ppes,
+            'completed_ppes': row.completed_ppes,
+            'failed_ppes': row.failed_ppes,
+            'is_certified': row.is_certified,
+            'is_excluded': row.is_excluded,
+            'has_voted': row.has_voted,
+            'completion_percentage': row.completion_percentage,
+            'last_updated': row.updated_at
+        }
+    
+    return participant_data
 
 
 def get_poll_participants(db: Session, poll_id: str) -> List[Dict[str, Any]]:
     """
     Get all participants for a poll with their certification status.
     
+    Selects only the needed columns in one outer-joined query, so no ORM
+    objects are built per participant. Results are cached until the poll's
+    users or certification states change (see bump_poll_version); callers
+    must not mutate the returned list.
+    
     Args:
         db: Database session
         poll_id: Poll identifier
@@ -48,41 +248,104 @@ def get_poll_participants(db: Session, poll_id: str) -> List[Dict[str, Any]]:
     Returns:
         List of participant information
     """
-    from .user import User
-    from .certification_state import CertificationState
-    
-    # Query users and their certification states
-    participants = db.query(User, CertificationState).outerjoin(
-        CertificationState,
-        (User.id == CertificationState.user_id) & 
-        (User.poll_id == CertificationState.poll_id)
-    ).filter(User.poll_id == poll_id).all()
-    
-    result = []
-    for user, cert_state in participants:
-        participant_data = {
-            'user_id': user.id,
-            'poll_id': user.poll_id,
-            'registration_order': user.registration_order,
-            'created_at': user.created_at.isoformat() if user.created_at else None,
-            'certification': None
-        }
+    key = (poll_id, get_poll_version(poll_id))
+    participants = _participants_cache.get(key)
+    if participants is None:
+        participants = [_participant_dict(row) for row in db.execute(_participants_query(poll_id))]
+        _participants_cache.set(key, participants)
+    return participants
+
+
+async def stream_poll_participants_async(db: AsyncSession, poll_id: str) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream a poll's participants one at a time from a server-side cursor.
+    
+    Same entries as get_poll_participants, but rows are fetched in batches
+    as they are consumed, so memory stays bounded on large polls. Not
+    cached.
+    
+    Args:
+        db: Async database session
+        poll_id: Poll identifier
+        
+    Returns:
+        Async iterator of participant information
+    """
+    rows = await db.stream(_participants_query(poll_id).execution_options(yield_per=500))
+    async for row in rows:
+        yield _participant_dict(row)
+
+
+def get_poll_user_ids(db: Session, poll_id: str) -> List[str]:
+    """
+    Get the IDs of all users registered for a poll.
+    
+    Projects only the id column, so no ORM rows are materialized.
+    
+    Args:
+        db: Database session
+        poll_id: Poll identifier
         
-        if cert_state:
-            participant_data['certification'] = {
-                'required_ppes': cert_state.required_ppes,
-                'completed_ppes': cert_state.completed_ppes,
-                'failed_ppes': cert_state.failed_ppes,
-                'is_certified': cert_state.is_certified,
-                'is_excluded': cert_state.is_excluded,
-                'has_voted': cert_state.has_voted,
-                'completion_percentage': cert_state.completion_percentage,
-                'last_updated': cert_state.last_updated.isoformat() if cert_state.last_updated else None
-            }
+    Returns:
+        List of user IDs
+    """
+    return list(db.execute(_poll_user_ids_query(poll_id)).scalars())
+
+
+def get_certification_edges(db: Session, poll_id: str) -> Iterator[Tuple[str, str]]:
+    """
+    Stream successful PPE certifications for a poll as (user_id, partner_id) pairs.
+    
+    A partner appears in a user's collected signatures once their PPE
+    succeeded, so each certification is read in a single round-trip.
+    Rows are fetched in batches (yield_per) rather than materialized up
+    front, so memory stays bounded on large polls.
+    
+    Args:
+        db: Database session
+        poll_id: Poll identifier
         
-        result.append(participant_data)
+    Returns:
+        Iterator of (user_id, partner_id) edges (both directions may appear)
+    """
+    rows = db.execute(
+        select(CertificationState.user_id, CertificationState.collected_signatures)
+        .where(CertificationState.poll_id == poll_id)
+        .execution_options(yield_per=10_000)
+    )
+    for user_id, signatures in rows:
+        for partner_id in (signatures or {}):
+            yield user_id, partner_id
+
+
+def get_certification_graph_signature(db: Session, poll_id: str) -> Tuple:
+    """
+    Get a cheap signature of a poll's certification graph.
+    
+    The signature changes whenever a user registers or a certification
+    state is created or updated, so it can be used to decide whether a
+    previously built graph is still current without loading it.
+    
+    Args:
+        db: Database session
+        poll_id: Poll identifier
+        
+    Returns:
+        Tuple of (user count, state count, total completed PPEs, last update)
+    """
+    user_count = (
+        select(func.count()).select_from(User)
+        .where(User.poll_id == poll_id)
+        .scalar_subquery()
+    )
+    state_stats = select(
+        func.count(),
+        func.coalesce(func.sum(CertificationState.completed_ppes), 0),
+        func.max(CertificationState.updated_at)
+    ).where(CertificationState.poll_id == poll_id).subquery()
     
-    return result
+    return tuple(db.execute(select(user_count, *state_stats.c)).one())
+
 
 __all__ = [
     'User',
@@ -94,5 +357,14 @@ __all__ = [
     'VoteRecord',
     'GraphExpansionMetrics',
     'get_certification_graph',
-    'get_poll_participants'
+    'get_certification_graph_async',
+    'get_certification_graph_json',
+    'get_certification_graph_json_async',
+    'get_poll_participants',
+    'stream_poll_participants_async',
+    'get_poll_version',
+    'bump_poll_version',
+    'get_poll_user_ids',
+    'get_certification_edges',
+    'get_certification_graph_signature'
 ]
\ No newline at end of file
@@ -3,7 +3,10 @@ Database model for user certification state.
 Persists across page refreshes (Issue #5).
 """
 
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, JSON, Float
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, JSON, Float, Index
+from sqlalchemy import Update, and_, case, cast, exists, select, text, update
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from datetime import datetime, timezone
 from typing import List, Optional
@@ -18,6 +21,18 @@ class CertificationState(Base):
     This solves Issue #5: state persists across refreshes.
     """
     __tablename__ = "certification_states"
+    __table_args__ = (
+        # (user_id, poll_id) lookups use the primary key; poll-wide scans
+        # (certification graph, phase transitions) and the users join need
+        # poll_id first
+        Index("ix_certstate_poll_user", "poll_id", "user_id"),
+        # Certified participants are a small, hot subset once voting opens
+        Index(
+            "ix_certstate_poll_certified", "poll_id",
+            sqlite_where=text("is_certified"),
+            postgresql_where=text("is_certified")
+        ),
+    )
     
     # Primary keys
     user_id = Column(String, primary_key=True)
@@ -36,11 +51,16 @@ class CertificationState(Base):
     
     # PPE tracking
     assigned_ppe_partners = Column(JSON, default=list)  # List of user IDs
-    completed_ppe_ids = Column(JSON, default=list)      # List of completed PPE IDs
-    failed_ppe_ids = Column(JSON, default=list)         # List of failed PPE IDs
+    
+    # Per-PPE history grows with every completion/failure and is only needed
+    # when recording a PPE or listing assignment status, so it is loaded
+    # (and JSON-decoded) on first access rather than with every state.
+    # Async callers must undefer_group("ppe_history") up front.
+    completed_ppe_ids = deferred(Column(JSON, default=list), group="ppe_history")  # List of completed PPE IDs
+    failed_ppe_ids = deferred(Column(JSON, default=list), group="ppe_history")     # List of failed PPE IDs
     
     # Signatures collected (for certification graph)
-    collected_signatures = Column(JSON, default=dict)   # {partner_id: signature}
+    collected_signatures = deferred(Column(JSON, default=dict), group="ppe_history")  # {partner_id: signature}
     
     # Certification status
     is_certified = Column(Boolean, default=False)
@@ -58,22 +78,47 @@ class CertificationState(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
+    user = relationship(
+        "User",
+        primaryjoin="and_(User.id == foreign(CertificationState.user_id), "
+                    "User.poll_id == foreign(CertificationState.poll_id))",
+        back_populates="certification_state",
+        viewonly=True,
+        lazy="raise"
+    )
+    
     def __repr__(self):
         return f"<CertificationState user={self.user_id} poll={self.poll_id} state={self.state}>"
     
-    @property
+    @hybrid_property
     def completion_percentage(self) -> float:
         """Calculate completion percentage."""
         if self.required_ppes == 0:
             return 0.0
         return (self.completed_ppes / self.required_ppes) * 100
     
-    @property
+    @completion_percentage.inplace.expression
+    @classmethod
+    def _completion_percentage_expression(cls):
+        return case(
+            (cls.required_ppes == 0, 0.0),
+            else_=cast(cls.completed_ppes, Float) / cls.required_ppes * 100
+        )
+    
+    @hybrid_property
     def remaining_ppes(self) -> int:
         """Number of PPEs still needed."""
         return max(0, self.required_ppes - self.completed_ppes)
     
-    @property
+    @remaining_ppes.inplace.expression
+    @classmethod
+    def _remaining_ppes_expression(cls):
+        return case(
+            (cls.required_ppes > cls.completed_ppes, cls.required_ppes - cls.completed_ppes),
+            else_=0
+        )
+    
+    @hybrid_property
     def can_still_certify(self) -> bool:
         """
         Check if user can still achieve certification.
@@ -82,6 +127,21 @@ class CertificationState(Base):
         """
         return self.failed_ppes <= self.max_allowed_failures
     
+    @can_still_certify.inplace.expression
+    @classmethod
+    def _can_still_certify_expression(cls):
+        return cls.failed_ppes <= cls.max_allowed_failures
+    
+    @hybrid_property
+    def is_eligible(self) -> bool:
+        """Certified and not excluded, i.e. allowed into the voting phase."""
+        return bool(self.is_certified and not self.is_excluded)
+    
+    @is_eligible.inplace.expression
+    @classmethod
+    def _is_eligible_expression(cls):
+        return and_(cls.is_certified.is_(True), func.coalesce(cls.is_excluded, False).is_(False))
+    
     def update_certification_status(self):
         """
         Update is_certified and is_excluded based on current progress.
@@ -107,20 +167,116 @@ class CertificationState(Base):
     def add_completed_ppe(self, ppe_id: str, partner_id: str, signature: str):
         """Record a successful PPE completion."""
         if ppe_id not in self.completed_ppe_ids:
-            self.completed_ppe_ids.append(ppe_id)
+            # Reassign rather than mutate in place, so the JSON columns are
+            # flagged as changed and written on flush
+            self.completed_ppe_ids = [*self.completed_ppe_ids, ppe_id]
             self.completed_ppes += 1
-            self.collected_signatures[partner_id] = signature
+            self.collected_signatures = {**self.collected_signatures, partner_id: signature}
             self.update_certification_status()
     
     def add_failed_ppe(self, ppe_id: str):
         """Record a failed PPE."""
         if ppe_id not in self.failed_ppe_ids:
-            self.failed_ppe_ids.append(ppe_id)
+            self.failed_ppe_ids = [*self.failed_ppe_ids, ppe_id]
             self.failed_ppes += 1
             self.update_certification_status()
     
+    @classmethod
+    def _status_values(cls, completed, failed) -> dict:
+        """
+        SQL equivalent of update_certification_status() for given counters.
+        
+        Args:
+            completed: SQL expression for the new completed_ppes
+            failed: SQL expression for the new failed_ppes
+        """
+        excluded = failed > cls.max_allowed_failures
+        certified = (~excluded) & (completed >= cls.required_ppes)
+        
+        return {
+            "is_excluded": case((excluded, True), else_=cls.is_excluded),
+            "exclusion_reason": case(
+                (excluded,
+                 "Failed " + cast(failed, String) + "/" + cast(cls.required_ppes, String)
+                 + " PPEs (max allowed: " + cast(cls.max_allowed_failures, String) + ")"),
+                else_=cls.exclusion_reason
+            ),
+            "is_certified": certified,
+            "certified_at": case((certified, datetime.now(timezone.utc)), else_=cls.certified_at),
+        }
+    
+    @classmethod
+    def completed_ppe_update(
+        cls,
+        user_id: str,
+        poll_id: str,
+        ppe_id: str,
+        partner_id: str,
+        signature: str
+    ) -> Update:
+        """
+        Single-statement equivalent of add_completed_ppe() (SQLite JSON1).
+        
+        Appends the PPE and signature in SQL and returns the updated row.
+        No row is returned if the state is missing or the PPE was already
+        recorded.
+        """
+        recorded = func.json_each(cls.completed_ppe_ids).table_valued("value")
+        completed = cls.completed_ppes + 1
+        
+        return (
+            update(cls)
+            .where(
+                cls.user_id == user_id,
+                cls.poll_id == poll_id,
+                ~exists(select(1).select_from(recorded).where(recorded.c.value == ppe_id))
+            )
+            .values(
+                completed_ppes=completed,
+                completed_ppe_ids=func.json_insert(
+                    func.coalesce(cls.completed_ppe_ids, func.json_array()), "$[#]", ppe_id
+                ),
+                collected_signatures=func.json_patch(
+                    func.coalesce(cls.collected_signatures, func.json_object()),
+                    func.json_object(partner_id, signature)
+                ),
+                **cls._status_values(completed, cls.failed_ppes)
+            )
+            .returning(cls)
+            .execution_options(synchronize_session=False)
+        )
+    
+    @classmethod
+    def failed_ppe_update(cls, user_id: str, poll_id: str, ppe_id: str) -> Update:
+        """
+        Single-statement equivalent of add_failed_ppe() (SQLite JSON1).
+        
+        No row is returned if the state is missing or the PPE was already
+        recorded.
+        """
+        recorded = func.json_each(cls.failed_ppe_ids).table_valued("value")
+        failed = cls.failed_ppes + 1
+        
+        return (
+            update(cls)
+            .where(
+                cls.user_id == user_id,
+                cls.poll_id == poll_id,
+                ~exists(select(1).select_from(recorded).where(recorded.c.value == ppe_id))
+            )
+            .values(
+                failed_ppes=failed,
+                failed_ppe_ids=func.json_insert(
+                    func.coalesce(cls.failed_ppe_ids, func.json_array()), "$[#]", ppe_id
+                ),
+                **cls._status_values(cls.completed_ppes, failed)
+            )
+            .returning(cls)
+            .execution_options(synchronize_session=False)
+        )
+    
     def to_dict(self) -> dict:
-        """Convert to dict for API response."""
+        """Convert to dict for API response (datetimes are left to the encoder)."""
         return {
             "user_id": self.user_id,
             "poll_id": self.poll_id,
@@ -137,5 +293,5 @@ class CertificationState(Base):
             "can_still_certify": self.can_still_certify,
             "has_voted": self.has_voted,
             "assigned_partners": len(self.assigned_ppe_partners),
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "updated_at": self.updated_at  # ORJSONResponse encodes datetimes as ISO-8601
         }
\ No newline at end of file
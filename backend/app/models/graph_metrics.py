@@ -139,6 +139,7 @@ class GraphExpansionMetrics(BaseModel):
     failure_reasons: List[str] = Field(default_factory=list)
     
     class Config:
+        populate_by_name = True
         json_schema_extra = {
             "example": {
                 "poll_id": "poll_123",
@@ -1,21 +1,60 @@
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Set
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Dict, Any, ClassVar, FrozenSet, Optional, Set, Tuple
 import uuid
 
+from ..utils.graph_utils import participant_fingerprint
+
 class PollCreate(BaseModel):
     question: str
     options: List[str]
 
-class Vote(BaseModel):
+# Plain slotted dataclass rather than a model: polls hold one per voter,
+# and pydantic-core validates/serializes dataclass fields without building
+# a model instance for each
+@dataclass(slots=True, frozen=True)
+class Vote:
     publicKey: Dict[str, Any]
     option: str
     signature: str
 
 class UserVerification(BaseModel):
-    verified_by: Set[str] = Field(default_factory=set)
-    has_verified: Set[str] = Field(default_factory=set)
+    # Append-only, so stored as tuples (cheaper to validate and serialize
+    # than sets); membership checks go through the cached *_set views
+    verified_by: Tuple[str, ...] = ()
+    has_verified: Tuple[str, ...] = ()
+    
+    # Cached view derived from each field, dropped whenever it is reassigned
+    _SET_VIEWS: ClassVar[Dict[str, str]] = {'verified_by': 'verified_by_set', 'has_verified': 'has_verified_set'}
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        view = self._SET_VIEWS.get(name)
+        if view is not None:
+            self.__dict__.pop(view, None)
+    
+    @cached_property
+    def verified_by_set(self) -> FrozenSet[str]:
+        return frozenset(self.verified_by)
+    
+    @cached_property
+    def has_verified_set(self) -> FrozenSet[str]:
+        return frozenset(self.has_verified)
+    
+    def add_verified_by(self, verifier_id: str) -> None:
+        """Record that verifier_id verified this user."""
+        if verifier_id not in self.verified_by_set:
+            self.verified_by = (*self.verified_by, verifier_id)
+    
+    def add_has_verified(self, verified_id: str) -> None:
+        """Record that this user verified verified_id."""
+        if verified_id not in self.has_verified_set:
+            self.has_verified = (*self.has_verified, verified_id)
 
 class Poll(BaseModel):
+    model_config = ConfigDict(populate_by_name=True, ser_json_timedelta='iso8601')
+    
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     question: str
     options: List[str]
@@ -26,6 +65,87 @@ class Poll(BaseModel):
     # Map of user_id to set of peers they have completed PPE with
     ppe_certifications: Dict[str, Set[str]] = Field(default_factory=dict)
     
+    # Change counter, bumped by PollService on every registration, vote,
+    # verification and PPE certification. Edits made directly on the fields
+    # are not tracked.
+    _version: int = PrivateAttr(default=0)
+    # (version, body) of the last serialized verification payload
+    _verification_body: Optional[Tuple[int, bytes]] = PrivateAttr(default=None)
+    # (version, JSON) of the last serialized poll itself
+    _json: Optional[Tuple[int, str]] = PrivateAttr(default=None)
+    # XOR of hash(user_id) over registrants, maintained by add_registrant
+    _registrants_hash: int = PrivateAttr(default=0)
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._registrants_hash = participant_fingerprint(self.registrants)[1]
+    
+    @property
+    def version(self) -> int:
+        """Current change counter of the poll."""
+        return self._version
+    
+    @property
+    def participant_fingerprint(self) -> Tuple[int, int]:
+        """
+        O(1) fingerprint of the registrant set, as graph_utils.participant_fingerprint.
+        
+        Registrants added other than through add_registrant are not tracked.
+        """
+        return len(self.registrants), self._registrants_hash
+    
+    def add_registrant(self, user_id: str, public_key: Any) -> bool:
+        """
+        Register a user's public key.
+        
+        Returns:
+            True if the user was newly registered
+        """
+        if user_id in self.registrants:
+            return False
+        self.registrants[user_id] = public_key
+        self._registrants_hash ^= hash(user_id)
+        return True
+    
+    def bump_version(self) -> None:
+        """Mark the poll as changed, so views cached for older versions are rebuilt."""
+        self._version += 1
+    
+    def cached_verification_body(self) -> Optional[bytes]:
+        """
+        Get the verification payload cached for the current version.
+        
+        Returns:
+            Serialized payload, or None if missing or stale
+        """
+        cached = self._verification_body
+        if cached is None or cached[0] != self._version:
+            return None
+        return cached[1]
+    
+    def cache_verification_body(self, body: bytes) -> None:
+        """
+        Cache the serialized verification payload for the current version.
+        
+        Only one version is kept, so a bump evicts the old payload on the
+        next store.
+        
+        Args:
+            body: Serialized payload
+        """
+        self._verification_body = (self._version, body)
+    
+    def cached_json(self) -> str:
+        """
+        Serialize the poll as a response body, reusing it until the next bump.
+        
+        Returns:
+            JSON of the poll with field aliases, as FastAPI would render it
+        """
+        cached = self._json
+        if cached is None or cached[0] != self._version:
+            cached = self._json = (self._version, self.model_dump_json(by_alias=True, warnings=False))
+        return cached[1]
+    
     def can_vote(self, user_id: str, min_verifications: int = 2) -> bool:
         """Check if a user has enough verifications to vote"""
         if user_id not in self.verifications:
@@ -41,8 +161,8 @@ class Poll(BaseModel):
             self.verifications[verified_id] = UserVerification()
             
         # Record the verification
-        self.verifications[verifier_id].has_verified.add(verified_id)
-        self.verifications[verified_id].verified_by.add(verifier_id)
+        self.verifications[verifier_id].add_has_verified(verified_id)
+        self.verifications[verified_id].add_verified_by(verifier_id)
     
     def add_ppe_certification(self, user1_id: str, user2_id: str) -> None:
         """Record a PPE certification between two users (bidirectional)"""
@@ -6,7 +6,8 @@ Based on Appendix C of PPE paper.
 from sqlalchemy import Column, String, Integer, Float, Boolean, JSON, DateTime
 from sqlalchemy.sql import func
 from typing import Dict, Any, List, Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator
+from functools import lru_cache
 import math
 
 from app.database import Base
@@ -30,6 +31,8 @@ class ParameterConstraints(BaseModel):
     b: Optional[float] = Field(None, description="Expansion parameter")
     
     class Config:
+        # Immutable (and hashable) so validation results can be memoized
+        frozen = True
         json_schema_extra = {
             "example": {
                 "m": 1000,
@@ -40,27 +43,25 @@ class ParameterConstraints(BaseModel):
             }
         }
     
-    @validator('p', always=True)
-    def calculate_p(cls, v, values):
-        """Calculate edge probability if not provided."""
-        if v is None and 'm' in values and 'd' in values:
-            return values['d'] / values['m']
-        return v
-    
-    @validator('b', always=True)
-    def calculate_b(cls, v, values):
-        """Calculate expansion parameter if not provided."""
-        if v is None and 'd' in values and 'm' in values and 'eta_v' in values:
-            d = values['d']
-            m = values['m']
-            eta_v = values['eta_v']
-            
-            if m > 1:
-                numerator = d * (0.5 - eta_v)
-                denominator = 2 * math.log(m) - 2
-                if denominator > 0:
-                    return math.sqrt(numerator / denominator)
-        return v
+    @model_validator(mode='after')
+    def _derive_p_and_b(self):
+        """Derive p and b in one pass if not provided."""
+        # Frozen model: set the derived fields directly
+        if self.p is None:
+            object.__setattr__(self, 'p', self.d / self.m)
+        if self.b is None:
+            object.__setattr__(self, 'b', _expansion_parameter(self.m, self.d, self.eta_v))
+        return self
+
+
+@lru_cache(maxsize=1024)
+def _expansion_parameter(m: int, d: float, eta_v: float) -> Optional[float]:
+    """Expansion parameter b = sqrt(d(1/2 - ηV) / (2 ln m - 2)), or None if undefined."""
+    if m > 1:
+        denominator = 2 * math.log(m) - 2
+        if denominator > 0:
+            return math.sqrt(d * (0.5 - eta_v) / denominator)
+    return None
 
 
 class ParameterValidationResult(BaseModel):
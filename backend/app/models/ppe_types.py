@@ -4,9 +4,9 @@ Based on Appendix B of PPE paper.
 """
 
 from enum import Enum
-from sqlalchemy import Column, String, Integer, Float, Boolean, JSON, DateTime
+from sqlalchemy import Column, String, Integer, BigInteger, Float, Boolean, JSON, DateTime, Index
 from sqlalchemy.sql import func
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional
 
 from app.database import Base
 
@@ -27,6 +27,27 @@ class PPEType(str, Enum):
     COMPUTATIONAL = "computational"                # Proof-of-work style
 
 
+# Bit per PPE type in PPEConfig.allowed_certification_mask. Bits are
+# persisted, so new types must be appended to PPEType, never inserted.
+_PPE_TYPE_BITS: Dict[str, int] = {ppe_type.value: 1 << i for i, ppe_type in enumerate(PPEType)}
+
+
+def ppe_types_to_mask(ppe_types: Iterable[str]) -> int:
+    """
+    Encode PPE types as an allowed-types bitmask.
+    
+    Args:
+        ppe_types: PPEType members or their values (unknown values are ignored)
+        
+    Returns:
+        Bitmask over PPEType
+    """
+    mask = 0
+    for ppe_type in ppe_types:
+        mask |= _PPE_TYPE_BITS.get(ppe_type, 0)
+    return mask
+
+
 class PPEDifficulty(str, Enum):
     """Difficulty levels for PPE challenges."""
     EASY = "easy"          # ~10 seconds
@@ -53,8 +74,10 @@ class PPEConfig(Base):
     registration_ppe_type = Column(String, default=PPEType.REGISTRATION_CAPTCHA)
     registration_difficulty = Column(String, default=PPEDifficulty.MEDIUM)
     
-    # Certification PPE (two-sided) - can allow multiple types
-    allowed_certification_types = Column(JSON, default=list)  # List of PPEType values
+    # Certification PPE (two-sided) - can allow multiple types. Stored as a
+    # bitmask over PPEType so admission checks are a single AND; use
+    # allowed_certification_types for the list form.
+    allowed_certification_mask = Column(BigInteger, nullable=False, default=0)
     default_certification_type = Column(String, default=PPEType.SYMMETRIC_CAPTCHA)
     certification_difficulty = Column(String, default=PPEDifficulty.MEDIUM)
     
@@ -74,6 +97,28 @@ class PPEConfig(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
+    @property
+    def allowed_certification_types(self) -> List[str]:
+        """Allowed certification PPE type values, in PPEType order."""
+        mask = self.allowed_certification_mask or 0
+        return [value for value, bit in _PPE_TYPE_BITS.items() if mask & bit]
+    
+    @allowed_certification_types.setter
+    def allowed_certification_types(self, ppe_types: Iterable[str]):
+        self.allowed_certification_mask = ppe_types_to_mask(ppe_types or ())
+    
+    def is_allowed(self, ppe_type: str) -> bool:
+        """
+        Check whether a PPE type may be used for certification in this poll.
+        
+        Args:
+            ppe_type: PPEType member or value
+            
+        Returns:
+            True if allowed
+        """
+        return bool((self.allowed_certification_mask or 0) & _PPE_TYPE_BITS.get(ppe_type, 0))
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "poll_id": self.poll_id,
@@ -95,9 +140,17 @@ class PPEExecution(Base):
     Stores all data needed for verification and audit.
     """
     __tablename__ = "ppe_executions"
+    __table_args__ = (
+        # Active-PPE lookups filter on prover, poll and status together
+        Index("ix_ppe_exec_prover_poll_status", "prover_id", "poll_id", "status"),
+        # A poll's executions by verifier, and by status (timeout cleanup);
+        # these also cover poll-only lookups, so poll_id has no index of its own
+        Index("ix_ppe_exec_poll_verifier", "poll_id", "verifier_id"),
+        Index("ix_ppe_exec_poll_status", "poll_id", "status"),
+    )
     
     id = Column(String, primary_key=True)
-    poll_id = Column(String, nullable=False, index=True)
+    poll_id = Column(String, nullable=False)
     
     # Participants
     prover_id = Column(String, nullable=False, index=True)
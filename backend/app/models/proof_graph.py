@@ -5,14 +5,126 @@ The proof graph is the complete, verifiable proof of a poll's integrity.
 It includes all participants, certifications, votes, and cryptographic bindings.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from abc import abstractmethod
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
 from datetime import datetime
+from functools import cached_property
+from collections import Counter
 import hashlib
-import json
+import orjson
 
 
-class ParticipantNode(BaseModel):
+# Merkle tree hashing with RFC 6962 domain separation: leaves and inner
+# nodes are prefixed differently so a leaf can never collide with a node.
+# Hashers are pre-fed with their prefix once and copied per hash, which
+# is cheaper than allocating a fresh context and concatenating the prefix.
+# hashlib.sha256 is OpenSSL's, which uses SHA-NI / ARMv8 crypto if present.
+_LEAF_HASHER = hashlib.sha256(b"\x00")
+_NODE_HASHER = hashlib.sha256(b"\x01")
+
+
+def _canonical_json(value: Any) -> bytes:
+    """Compact, key-sorted UTF-8 JSON, encoded in one C call."""
+    return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+
+
+def _leaf_hash(item_dict: Dict[str, Any]) -> bytes:
+    """Hash one canonical item as a Merkle leaf."""
+    hasher = _LEAF_HASHER.copy()
+    hasher.update(_canonical_json(item_dict))
+    return hasher.digest()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    """Hash two child digests into their parent node."""
+    hasher = _NODE_HASHER.copy()
+    hasher.update(left)
+    hasher.update(right)
+    return hasher.digest()
+
+
+def _merkle_root(leaves: Iterable[bytes]) -> bytes:
+    """
+    Merkle root of ordered leaf digests.
+    
+    Pairs digests level by level; an odd digest out is promoted unchanged
+    rather than duplicated, so appending a copy of the last leaf can't
+    produce the same root.
+    
+    Leaves are consumed one at a time: completed subtrees are kept on a
+    stack (at most one per level), so only O(log n) digests are held at
+    once and leaves can come from a generator.
+    
+    Args:
+        leaves: Leaf digests in canonical order
+        
+    Returns:
+        Root digest (SHA-256 of the empty string for no leaves)
+    """
+    # (height, digest) of complete subtrees, heights strictly decreasing
+    stack: List[Tuple[int, bytes]] = []
+    for digest in leaves:
+        height = 0
+        while stack and stack[-1][0] == height:
+            digest = _node_hash(stack.pop()[1], digest)
+            height += 1
+        stack.append((height, digest))
+    
+    if not stack:
+        return hashlib.sha256(b"").digest()
+    
+    # Fold the leftover subtrees right to left; a smaller right-hand subtree
+    # is exactly what level-by-level pairing promotes
+    root = stack.pop()[1]
+    while stack:
+        root = _node_hash(stack.pop()[1], root)
+    return root
+
+
+class _MerkleLeaf(BaseModel):
+    """
+    Base for proof graph items, caching the item's Merkle leaf digest.
+    
+    Items are frozen once built, so the cached digest stays valid; use
+    model_copy(update=...) to derive a changed item. Unknown fields are
+    rejected rather than silently dropped from the hashed data.
+    """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    @abstractmethod
+    def to_dict(self) -> Dict[str, Any]:
+        """Canonical fields of the item, as hashed into its leaf."""
+    
+    # A cached_property lives in the instance __dict__ next to the fields,
+    # which is cheaper per instance than a pydantic private attribute
+    @cached_property
+    def leaf_digest(self) -> bytes:
+        """Merkle leaf digest of to_dict(), computed on first access."""
+        return _leaf_hash(self.to_dict())
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        # The instance __dict__ is copied too; the digest may not match anymore
+        copied.__dict__.pop("leaf_digest", None)
+        return copied
+    
+    def leaf_hash(self, use_cache: bool = True) -> bytes:
+        """
+        Merkle leaf digest of to_dict().
+        
+        Args:
+            use_cache: Reuse the digest from a previous call if present
+            
+        Returns:
+            SHA-256 digest
+        """
+        if not use_cache:
+            self.__dict__.pop("leaf_digest", None)
+        return self.leaf_digest
+
+
+class ParticipantNode(_MerkleLeaf):
     """
     Represents a participant in the proof graph.
     """
@@ -28,7 +140,7 @@ class ParticipantNode(BaseModel):
         }
 
 
-class PPECertificationEdge(BaseModel):
+class PPECertificationEdge(_MerkleLeaf):
     """
     Represents a PPE certification between two participants.
     """
@@ -46,7 +158,7 @@ class PPECertificationEdge(BaseModel):
         }
 
 
-class VoteRecord(BaseModel):
+class VoteRecord(_MerkleLeaf):
     """
     Represents a vote in the proof graph.
     """
@@ -94,49 +206,92 @@ class ProofGraph(BaseModel):
     votes: List[VoteRecord]
     graph_hash: Optional[str] = None
     
-    def compute_hash(self) -> str:
+    # Per collection: (items snapshot, Merkle root over them)
+    _collection_roots: Dict[str, Tuple[tuple, bytes]] = PrivateAttr(default_factory=dict)
+    
+    def _collection_root(self, field: str, key: Callable, use_cache: bool) -> bytes:
+        """
+        Merkle root of a collection's items in sorted order.
+        
+        The collections are plain lists that callers may edit directly, so
+        the cached root is checked against a snapshot of the items. While
+        the items are unchanged (a linear identity check) the root is reused
+        without sorting or touching the items' digests again.
+        
+        Args:
+            field: Collection attribute name
+            key: Sort key giving the hashing order
+            use_cache: Reuse the cached root and item digests
+            
+        Returns:
+            Root digest
+        """
+        items = tuple(getattr(self, field))
+        cached = self._collection_roots.get(field)
+        if use_cache and cached is not None and cached[0] == items:
+            return cached[1]
+        
+        root = _merkle_root(item.leaf_hash(use_cache) for item in sorted(items, key=key))
+        self._collection_roots[field] = (items, root)
+        return root
+    
+    def compute_hash(self, use_cache: bool = True) -> str:
         """
         Compute a cryptographic hash of the entire proof graph.
         
         This hash binds all components together. Any modification to
         participants, certifications, or votes will change the hash.
         
+        Participants, certifications and votes are each Merkle trees over
+        their sorted items; the graph hash combines the metadata digest
+        with the three roots. Item leaf digests are cached on the items and
+        roots on the graph, so rehashing an unchanged graph does no sorting
+        and rehashing after a change only rehashes changed items and the
+        inner nodes.
+        
+        Args:
+            use_cache: Reuse cached roots and item digests. Pass False to
+                       rehash every item from scratch.
+        
         Returns:
             SHA-256 hash of the graph structure
         """
-        # Create canonical representation
-        graph_dict = {
-            "metadata": {
-                "poll_id": self.metadata.poll_id,
-                "question": self.metadata.question,
-                "options": sorted(self.metadata.options),
-                "num_participants": self.metadata.num_participants,
-                "num_certifications": self.metadata.num_certifications,
-                "num_votes": self.metadata.num_votes,
-                "min_certifications_required": self.metadata.min_certifications_required
-            },
-            "participants": sorted([p.to_dict() for p in self.participants], 
-                                  key=lambda x: x["user_id"]),
-            "certifications": sorted([c.to_dict() for c in self.certifications],
-                                    key=lambda x: (x["source"], x["target"])),
-            "votes": sorted([v.to_dict() for v in self.votes],
-                          key=lambda x: x["user_id"])
-        }
+        metadata_digest = _leaf_hash({
+            "poll_id": self.metadata.poll_id,
+            "question": self.metadata.question,
+            "options": sorted(self.metadata.options),
+            "num_participants": self.metadata.num_participants,
+            "num_certifications": self.metadata.num_certifications,
+            "num_votes": self.metadata.num_votes,
+            "min_certifications_required": self.metadata.min_certifications_required
+        })
+        
+        participants_root = self._collection_root(
+            "participants", lambda p: p.user_id, use_cache
+        )
+        certifications_root = self._collection_root(
+            "certifications", lambda c: (c.source_user_id, c.target_user_id), use_cache
+        )
+        votes_root = self._collection_root("votes", lambda v: v.user_id, use_cache)
         
-        # Compute hash
-        canonical_json = json.dumps(graph_dict, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(canonical_json.encode()).hexdigest()
+        return _node_hash(
+            _node_hash(metadata_digest, participants_root),
+            _node_hash(certifications_root, votes_root)
+        ).hex()
     
     def verify_hash(self) -> bool:
         """
         Verify that the stored hash matches the computed hash.
         
+        Every item is rehashed (no cached digests), so in-place edits to
+        nested values are caught too.
+        
         Returns:
             True if hash is valid
         """
         if self.graph_hash is None:
             return False
-        computed = self.compute_hash()
+        computed = self.compute_hash(use_cache=False)
         return computed == self.graph_hash
     
     def get_vote_tally(self) -> Dict[str, int]:
@@ -146,27 +301,22 @@ class ProofGraph(BaseModel):
         Returns:
             Dictionary mapping options to vote counts
         """
-        tally = {option: 0 for option in self.metadata.options}
-        for vote in self.votes:
-            if vote.option in tally:
-                tally[vote.option] += 1
-        return tally
+        counts = Counter(vote.option for vote in self.votes)
+        return {option: counts.get(option, 0) for option in self.metadata.options}
     
     def to_exportable_dict(self) -> Dict[str, Any]:
         """
         Convert proof graph to a dictionary suitable for export/download.
         
+        The whole graph is dumped in one pydantic-core call rather than
+        item by item; the result is JSON-compatible.
+        
         Returns:
             Complete graph as dictionary
         """
-        return {
-            "metadata": self.metadata.model_dump(),
-            "participants": [p.model_dump() for p in self.participants],
-            "certifications": [c.model_dump() for c in self.certifications],
-            "votes": [v.model_dump() for v in self.votes],
-            "graph_hash": self.graph_hash,
-            "vote_tally": self.get_vote_tally()
-        }
+        export = self.model_dump(mode="json")
+        export["vote_tally"] = self.get_vote_tally()
+        return export
 
 
 class ProofGraphSummary(BaseModel):
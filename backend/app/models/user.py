@@ -2,13 +2,20 @@
 SQLAlchemy models for User and Poll entities.
 """
 
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Float, Text
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Float, Text, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
 
 from app.database import Base
 
 
+# Native JSON storage: JSONB on PostgreSQL (parsed once on write and
+# GIN-indexable), SQLAlchemy's JSON elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
 class User(Base):
     """
     User model for SQLAlchemy database.
@@ -18,7 +25,7 @@ class User(Base):
     id = Column(String, primary_key=True)
     poll_id = Column(String, nullable=False, index=True)
     username = Column(String, nullable=True)
-    public_key = Column(Text, nullable=True)  # JSON string of public key
+    public_key = Column(JSONDocument, nullable=True)  # Public key (JWK)
     
     # Registration details
     registration_order = Column(Integer, nullable=True)  # Position in shuffled list
@@ -28,6 +35,18 @@ class User(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
+    # No FK between the tables, so the join is spelled out. lazy="raise"
+    # makes accidental per-row loads fail loudly instead of issuing N queries.
+    certification_state = relationship(
+        "CertificationState",
+        primaryjoin="and_(User.id == foreign(CertificationState.user_id), "
+                    "User.poll_id == foreign(CertificationState.poll_id))",
+        back_populates="user",
+        uselist=False,
+        viewonly=True,
+        lazy="raise"
+    )
+    
     def __repr__(self):
         return f"<User id={self.id} poll={self.poll_id}>"
 
@@ -37,10 +56,18 @@ class Poll(Base):
     Poll model for SQLAlchemy database.
     """
     __tablename__ = "polls"
+    __table_args__ = (
+        # Containment lookups on options (options @> '["..."]'); PostgreSQL only
+        Index(
+            "ix_polls_options_gin", "options",
+            postgresql_using="gin",
+            postgresql_ops={"options": "jsonb_path_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
     
     id = Column(String, primary_key=True)
     question = Column(Text, nullable=False)
-    options = Column(Text, nullable=True)  # JSON string of options
+    options = Column(JSONDocument, nullable=True)  # List of options
     
     # PPE paper parameters
     phase = Column(String, default="setup")  # PollPhase enum
@@ -68,6 +95,9 @@ class Vote(Base):
     Vote model for SQLAlchemy database.
     """
     __tablename__ = "votes"
+    __table_args__ = (
+        Index("ix_vote_user_poll", "user_id", "poll_id"),
+    )
     
     id = Column(String, primary_key=True)
     user_id = Column(String, nullable=False, index=True)
@@ -4,7 +4,7 @@ Factory for creating PPE mechanism instances.
 Handles registration and instantiation of different PPE types.
 """
 
-from typing import Dict, Type, Optional
+from typing import Dict, Type, Optional, Tuple
 from .base import BasePPE, PPEType, PPEDifficulty, PPEMetadata
 from .symmetric_captcha import SymmetricCaptchaPPE
 
@@ -21,6 +21,12 @@ class PPEFactory:
         self._registry: Dict[PPEType, Type[BasePPE]] = {}
         self._metadata: Dict[PPEType, PPEMetadata] = {}
         
+        # get_available_types() result, rebuilt after each register()
+        self._available_types_cache: Optional[Dict[str, Dict]] = None
+        
+        # Shared instances handed out by get_shared(), per (type, difficulty)
+        self._instances: Dict[Tuple[PPEType, PPEDifficulty], BasePPE] = {}
+        
         # Register built-in implementations
         self._register_builtin()
     
@@ -52,6 +58,11 @@ class PPEFactory:
         
         self._registry[metadata.ppe_type] = ppe_class
         self._metadata[metadata.ppe_type] = metadata
+        self._available_types_cache = None
+        self._instances = {
+            key: instance for key, instance in self._instances.items()
+            if key[0] != metadata.ppe_type
+        }
         
         print(f"Registered PPE type: {metadata.name} ({metadata.ppe_type.value})")
     
@@ -76,17 +87,47 @@ class PPEFactory:
         ppe_class = self._registry[ppe_type]
         return ppe_class(difficulty=difficulty)
     
+    def get_shared(self, ppe_type: PPEType,
+                   difficulty: PPEDifficulty = PPEDifficulty.MEDIUM) -> BasePPE:
+        """
+        Get a shared PPE instance, creating it on first use.
+        
+        Implementations hold only their difficulty, so one instance per
+        (type, difficulty) can serve every request instead of constructing
+        a new one each time. Re-registering a type replaces its instances.
+        
+        Args:
+            ppe_type: Type of PPE
+            difficulty: Challenge difficulty
+            
+        Returns:
+            PPE instance (do not mutate)
+            
+        Raises:
+            ValueError: If PPE type not registered
+        """
+        key = (ppe_type, difficulty)
+        instance = self._instances.get(key)
+        if instance is None:
+            instance = self._instances[key] = self.create(ppe_type, difficulty)
+        return instance
+    
     def get_available_types(self) -> Dict[str, Dict]:
         """
         Get all available PPE types with metadata.
         
+        The registry only changes on register(), so the result is built
+        once and shared; callers must not mutate it.
+        
         Returns:
             Dictionary mapping type names to metadata
         """
-        return {
-            ppe_type.value: metadata.to_dict()
-            for ppe_type, metadata in self._metadata.items()
-        }
+        if self._available_types_cache is None:
+            self._available_types_cache = {
+                ppe_type.value: metadata.to_dict()
+                for ppe_type, metadata in self._metadata.items()
+            }
+        return self._available_types_cache
     
     def get_metadata(self, ppe_type: PPEType) -> Optional[PPEMetadata]:
         """
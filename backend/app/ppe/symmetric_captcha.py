@@ -5,9 +5,8 @@ Refactored from the original implementation to use the modular interface.
 """
 
 from .base import BasePPE, PPEType, PPEDifficulty
-from typing import Tuple, Any
-import hashlib
-import random
+from typing import Tuple, Any, ClassVar, Dict
+import hmac
 
 
 class SymmetricCaptchaPPE(BasePPE):
@@ -18,10 +17,43 @@ class SymmetricCaptchaPPE(BasePPE):
     challenges, and verify using the commitment scheme.
     """
     
+    # Solution length and alphabet per difficulty
+    _DIFFICULTY_SETTINGS: ClassVar[Dict[PPEDifficulty, Dict[str, Any]]] = {
+        PPEDifficulty.EASY: {"length": 4, "uppercase": False, "digits": False},
+        PPEDifficulty.MEDIUM: {"length": 6, "uppercase": True, "digits": True},
+        PPEDifficulty.HARD: {"length": 8, "uppercase": True, "digits": True}
+    }
+    
+    # Estimated solving time in seconds per difficulty
+    _DIFFICULTY_TIMES: ClassVar[Dict[PPEDifficulty, float]] = {
+        PPEDifficulty.EASY: 5.0,
+        PPEDifficulty.MEDIUM: 10.0,
+        PPEDifficulty.HARD: 20.0
+    }
+    
     def get_type(self) -> PPEType:
         """Get PPE type identifier."""
         return PPEType.SYMMETRIC_CAPTCHA
     
+    def _derive_solution(self, secret: str, session_id: str) -> str:
+        """Derive the solution for (secret, session_id) at this difficulty."""
+        # Import here to avoid circular dependency
+        from ..utils.captcha_utils import derive_random_string
+        
+        # Deterministic seed, shared by both parties
+        seed_input = f"{secret}:{session_id}".encode('utf-8')
+        
+        settings = self._DIFFICULTY_SETTINGS.get(
+            self.difficulty, self._DIFFICULTY_SETTINGS[PPEDifficulty.MEDIUM]
+        )
+        
+        return derive_random_string(
+            seed_input,
+            length=settings["length"],
+            include_uppercase=settings["uppercase"],
+            include_digits=settings["digits"]
+        )
+    
     def generate_challenge_with_secret(self, secret: str, session_id: str) -> Tuple[str, str]:
         """
         Generate a text CAPTCHA challenge deterministically.
@@ -33,32 +65,7 @@ class SymmetricCaptchaPPE(BasePPE):
         Returns:
             Tuple of (challenge_text, solution)
         """
-        # Import here to avoid circular dependency
-        from ..utils.captcha_utils import generate_random_string
-        
-        # Create deterministic seed
-        seed_input = f"{secret}:{session_id}".encode('utf-8')
-        seed_hash = hashlib.sha256(seed_input).digest()
-        seed = int.from_bytes(seed_hash[:8], byteorder='big')
-        
-        # Use seed for deterministic generation
-        random.seed(seed)
-        
-        # Get difficulty settings
-        difficulty_settings = {
-            PPEDifficulty.EASY: {"length": 4, "uppercase": False, "digits": False},
-            PPEDifficulty.MEDIUM: {"length": 6, "uppercase": True, "digits": True},
-            PPEDifficulty.HARD: {"length": 8, "uppercase": True, "digits": True}
-        }
-        
-        settings = difficulty_settings.get(self.difficulty, difficulty_settings[PPEDifficulty.MEDIUM])
-        
-        # Generate solution
-        solution = generate_random_string(
-            length=settings["length"],
-            include_uppercase=settings["uppercase"],
-            include_digits=settings["digits"]
-        )
+        solution = self._derive_solution(secret, session_id)
         
         # Challenge text with spaces
         challenge_text = ' '.join(solution)
@@ -79,13 +86,13 @@ class SymmetricCaptchaPPE(BasePPE):
         Returns:
             True if valid
         """
-        # Regenerate challenge
-        regenerated_text, regenerated_solution = self.generate_challenge_with_secret(
-            secret, session_id
-        )
+        # Only the solution is compared, so the challenge text isn't rebuilt
+        expected_solution = self._derive_solution(secret, session_id)
         
-        # Verify solution matches
-        return regenerated_solution.lower() == solution.lower()
+        # Verify solution matches; constant-time, as the solution derives from the secret
+        return hmac.compare_digest(
+            expected_solution.lower().encode('utf-8'), solution.lower().encode('utf-8')
+        )
     
     def verify_solution(self, challenge_text: str, solution: str) -> bool:
         """
@@ -102,7 +109,7 @@ class SymmetricCaptchaPPE(BasePPE):
         expected = challenge_text.replace(' ', '').lower().strip()
         provided = solution.lower().strip()
         
-        return expected == provided
+        return hmac.compare_digest(expected.encode('utf-8'), provided.encode('utf-8'))
     
     def estimate_effort(self) -> float:
         """
@@ -111,9 +118,4 @@ class SymmetricCaptchaPPE(BasePPE):
         Returns:
             Estimated time
         """
-        difficulty_times = {
-            PPEDifficulty.EASY: 5.0,
-            PPEDifficulty.MEDIUM: 10.0,
-            PPEDifficulty.HARD: 20.0
-        }
-        return difficulty_times.get(self.difficulty, 10.0)
\ No newline at end of file
+        return self._DIFFICULTY_TIMES.get(self.difficulty, 10.0)
\ No newline at end of file
@@ -3,11 +3,12 @@ API routes for ideal certification graph operations.
 """
 
 from fastapi import APIRouter, HTTPException, status
-from typing import Dict, List, Set
-import json
+from fastapi.responses import ORJSONResponse
+from typing import Dict, List, Literal, Set
 
 from ..services.graph_service import graph_service
 from ..services.poll_service import poll_service
+from ..utils.graph_utils import graph_to_csr
 
 router = APIRouter(prefix="/polls/{poll_id}/graph", tags=["Graph"])
 
@@ -31,16 +32,16 @@ async def generate_graph(poll_id: str, k: int = 3):
     if not poll:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Poll not found")
     
-    participant_ids = list(poll.registrants.keys())
-    
-    if len(participant_ids) < 2:
+    if len(poll.registrants) < 2:
         raise HTTPException(
             status.HTTP_400_BAD_REQUEST,
             "Need at least 2 registered participants to generate graph"
         )
     
     # Generate the graph
-    graph = graph_service.get_or_generate_graph(poll_id, participant_ids, k)
+    graph = graph_service.get_or_generate_graph(
+        poll_id, poll.registrants, k, fingerprint=poll.participant_fingerprint
+    )
     
     # Get properties
     properties = graph_service.get_graph_properties(poll_id)
@@ -48,7 +49,7 @@ async def generate_graph(poll_id: str, k: int = 3):
     
     return {
         "poll_id": poll_id,
-        "num_participants": len(participant_ids),
+        "num_participants": len(poll.registrants),
         "properties": properties,
         "metrics": metrics,
         "message": "Graph generated successfully"
@@ -78,15 +79,17 @@ async def get_neighbors(poll_id: str, user_id: str):
         )
     
     # Ensure graph is generated
-    participant_ids = list(poll.registrants.keys())
-    if len(participant_ids) < 2:
+    if len(poll.registrants) < 2:
         return {
             "user_id": user_id,
             "neighbors": [],
             "message": "Not enough participants for PPE"
         }
     
-    graph = graph_service.get_or_generate_graph(poll_id, participant_ids)
+    # O(1) while the participants are unchanged
+    graph_service.get_or_generate_graph(
+        poll_id, poll.registrants, fingerprint=poll.participant_fingerprint
+    )
     neighbors = graph_service.get_user_neighbors(poll_id, user_id)
     
     return {
@@ -97,14 +100,16 @@ async def get_neighbors(poll_id: str, user_id: str):
 
 
 @router.get("/")
-async def get_full_graph(poll_id: str):
+async def get_full_graph(poll_id: str, layout: Literal["adjacency", "csr"] = "adjacency"):
     """
     Get the complete ideal certification graph for a poll.
     
-    Returns the full adjacency list representation.
+    Returns the full adjacency list representation, or with layout=csr
+    the compact nodes/offsets/neighbors arrays (see graph_to_csr).
     
     Args:
         poll_id: Poll identifier
+        layout: "adjacency" ({user_id: [neighbor IDs]}) or "csr"
         
     Returns:
         Complete graph structure
@@ -117,27 +122,32 @@ async def get_full_graph(poll_id: str):
     
     if graph is None:
         # Graph not generated yet, generate it
-        participant_ids = list(poll.registrants.keys())
-        if len(participant_ids) < 2:
+        if len(poll.registrants) < 2:
             raise HTTPException(
                 status.HTTP_400_BAD_REQUEST,
                 "Not enough participants to generate graph"
             )
-        graph = graph_service.get_or_generate_graph(poll_id, participant_ids)
+        graph = graph_service.get_or_generate_graph(
+            poll_id, poll.registrants, fingerprint=poll.participant_fingerprint
+        )
     
-    # Convert sets to lists for JSON serialization
-    graph_serializable = {
-        user_id: list(neighbors) 
-        for user_id, neighbors in graph.items()
-    }
+    if layout == "csr":
+        graph_serializable = graph_to_csr(graph)
+    else:
+        # Convert sets to lists for JSON serialization
+        graph_serializable = {
+            user_id: list(neighbors) 
+            for user_id, neighbors in graph.items()
+        }
     
     properties = graph_service.get_graph_properties(poll_id)
     
-    return {
+    # Skip jsonable_encoder's pass over every adjacency list
+    return ORJSONResponse({
         "poll_id": poll_id,
         "graph": graph_serializable,
         "properties": properties
-    }
+    })
 
 
 @router.post("/invalidate")
@@ -1,14 +1,34 @@
-from fastapi import APIRouter, HTTPException, status
-from typing import Dict, Any, List
-import json
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from itertools import chain, islice
+from typing import Dict, Any, Iterable, List
+import orjson
+from pydantic import BaseModel, TypeAdapter
 
 from ..models.poll import Poll, PollCreate, Vote
 from ..services.poll_service import poll_service, get_user_id
 from ..services.registration_service import registration_service
+from ..utils.responses import etag_matches
 
 router = APIRouter(prefix="/polls", tags=["Polls"])
 
+_poll_list_adapter = TypeAdapter(List[Poll])
+
+
+def _poll_response(value: Any, status_code: int = 200) -> Response:
+    """
+    utils.responses.model_response for Poll, reusing the JSON cached per version.
+    
+    Args:
+        value: Poll (or data to validate into one)
+        status_code: HTTP status code
+        
+    Returns:
+        JSON Response
+    """
+    if not isinstance(value, Poll):
+        value = Poll.model_validate(value)
+    return Response(content=value.cached_json(), media_type="application/json", status_code=status_code)
+
 
 class RegisterRequest(BaseModel):
     """Request model for poll registration with challenge validation."""
@@ -19,7 +39,7 @@ class RegisterRequest(BaseModel):
 @router.post("/", response_model=Poll, status_code=status.HTTP_201_CREATED)
 async def create_poll(poll_data: PollCreate):
     """Create a new poll"""
-    return poll_service.create_poll(poll_data)
+    return _poll_response(poll_service.create_poll(poll_data), status.HTTP_201_CREATED)
 
 @router.get("/{poll_id}", response_model=Poll)
 async def get_poll(poll_id: str):
@@ -27,7 +47,7 @@ async def get_poll(poll_id: str):
     poll = poll_service.get_poll(poll_id)
     if not poll:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Poll not found")
-    return poll
+    return _poll_response(poll)
 
 @router.post("/{poll_id}/register", response_model=Poll)
 async def register_for_poll(poll_id: str, request: RegisterRequest):
@@ -53,14 +73,14 @@ async def register_for_poll(poll_id: str, request: RegisterRequest):
     poll = await poll_service.add_registrant(poll_id, request.public_key)
     if not poll:
         raise HTTPException(status.HTTP_404_NOT_FOUND, "Poll not found")
-    return poll
+    return _poll_response(poll)
 
 @router.post("/{poll_id}/verify/{user_id}", response_model=Poll)
 async def verify_user(poll_id: str, user_id: str, verifier_key: Dict[str, Any]):
     """Verify a user for a specific poll"""
     try:
         verifier_id = get_user_id(verifier_key)
-        return poll_service.verify_user(poll_id, verifier_id, user_id)
+        return _poll_response(poll_service.verify_user(poll_id, verifier_id, user_id))
     except ValueError as e:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, str(e))
 
@@ -68,14 +88,21 @@ async def verify_user(poll_id: str, user_id: str, verifier_key: Dict[str, Any]):
 async def submit_vote(poll_id: str, vote: Vote):
     """Submit a vote for a poll"""
     try:
-        return poll_service.record_vote(poll_id, vote)
+        return _poll_response(await poll_service.record_vote_async(poll_id, vote))
     except ValueError as e:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, str(e))
 
 @router.get("/", response_model=List[Poll])
 async def get_all_polls():
     """Get all available polls"""
-    return poll_service.get_all_polls()
+    polls = poll_service.get_all_polls()
+    if not all(isinstance(poll, Poll) for poll in polls):
+        polls = _poll_list_adapter.validate_python(polls)
+    # Each poll's JSON is cached per version, so only changed polls are re-serialized
+    return Response(
+        content="[" + ",".join(poll.cached_json() for poll in polls) + "]",
+        media_type="application/json"
+    )
 
 @router.post("/userid", response_model=str)
 async def get_userid(public_key: Dict[str, Any]):
@@ -88,7 +115,7 @@ async def get_user_verifications(
     public_key_str: str
 ):
     """Get verification status for a specific user using their public key"""
-    public_key = json.loads(public_key_str)
+    public_key = orjson.loads(public_key_str)
     user_id = get_user_id(public_key)
     poll = poll_service.get_poll(poll_id)
     if not poll:
@@ -113,6 +140,40 @@ async def get_user_verifications(
         "verification_count": len(verifications.verified_by)
     }
 
+# Bounds on client-supplied JWKs. EC/RSA public keys have a handful of short
+# members (key_ops being the only list), so anything larger is rejected
+# before it is canonicalized and hashed.
+_MAX_JWK_MEMBERS = 16
+_MAX_JWK_VALUE_LENGTH = 1024
+_JWK_SCALAR_TYPES = (str, int, float, bool, type(None))
+# Most certifications accepted by one batch request
+_MAX_PPE_BATCH = 1000
+
+
+def _check_public_key(public_key: Any) -> None:
+    """
+    Reject a JWK that is oversized or not flat.
+    
+    Raises:
+        ValueError: If the key isn't an object of scalars (or short scalar
+            lists) within the size bounds
+    """
+    if not isinstance(public_key, dict) or len(public_key) > _MAX_JWK_MEMBERS:
+        raise ValueError("Invalid public key")
+    for value in public_key.values():
+        if isinstance(value, list):
+            if len(value) > _MAX_JWK_MEMBERS:
+                raise ValueError("Invalid public key")
+            values = value
+        else:
+            values = (value,)
+        for item in values:
+            if not isinstance(item, _JWK_SCALAR_TYPES) or (
+                isinstance(item, str) and len(item) > _MAX_JWK_VALUE_LENGTH
+            ):
+                raise ValueError("Invalid public key")
+
+
 @router.post("/{poll_id}/ppe-certification")
 async def record_ppe_certification(
     poll_id: str, 
@@ -123,6 +184,10 @@ async def record_ppe_certification(
         user1_key = certification_data["user1_public_key"]
         user2_key = certification_data["user2_public_key"]
         
+        # Cheap shape/size checks before any hashing
+        _check_public_key(user1_key)
+        _check_public_key(user2_key)
+        
         user1_id = get_user_id(user1_key)
         user2_id = get_user_id(user2_key)
         
@@ -136,13 +201,49 @@ async def record_ppe_certification(
     except KeyError as e:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, f"Missing required field: {e}")
 
+@router.post("/{poll_id}/ppe-certifications/batch")
+async def record_ppe_certifications(
+    poll_id: str,
+    batch_data: Dict[str, Any]
+):
+    """
+    Record several PPE certifications in one request.
+    
+    Expects {"edges": [{"user1_public_key": ..., "user2_public_key": ...}, ...]}.
+    Either every edge is recorded or, on a 400, none is.
+    """
+    try:
+        edges = batch_data["edges"]
+        if not isinstance(edges, list) or len(edges) > _MAX_PPE_BATCH:
+            raise ValueError(f"edges must be a list of at most {_MAX_PPE_BATCH} certifications")
+        
+        pairs = []
+        for edge in edges:
+            if not isinstance(edge, dict):
+                raise ValueError("Invalid certification")
+            user1_key = edge["user1_public_key"]
+            user2_key = edge["user2_public_key"]
+            _check_public_key(user1_key)
+            _check_public_key(user2_key)
+            pairs.append((get_user_id(user1_key), get_user_id(user2_key)))
+        
+        poll = poll_service.record_ppe_certifications(poll_id, pairs)
+        if not poll:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Poll not found")
+        
+        return {"message": "PPE certifications recorded successfully", "recorded": len(pairs)}
+    except ValueError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, str(e))
+    except KeyError as e:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, f"Missing required field: {e}")
+
 @router.get("/{poll_id}/ppe-certifications")
 async def get_ppe_certifications(
     poll_id: str, 
     public_key_str: str
 ):
     """Get PPE certifications for a specific user"""
-    public_key = json.loads(public_key_str)
+    public_key = orjson.loads(public_key_str)
     user_id = get_user_id(public_key)
     poll = poll_service.get_poll(poll_id)
     if not poll:
@@ -158,71 +259,98 @@ async def get_ppe_certifications(
         "certification_count": len(certifications)
     }
 
-@router.get("/{poll_id}/verify")
-async def get_poll_verification_data(poll_id: str):
-    """
-    Get full poll data with certification graph for public verification.
-    This endpoint allows anyone to verify the poll's integrity without needing to register.
+# Nodes/edges are encoded this many at a time, so only one batch of dicts
+# is alive while the verification payload is built
+_ENCODE_BATCH_SIZE = 1024
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _encode_json_array(items: Iterable[Any]) -> bytes:
+    """Encode an iterable as a JSON array, in batches of _ENCODE_BATCH_SIZE."""
+    iterator = iter(items)
+    parts = []
+    while batch := list(islice(iterator, _ENCODE_BATCH_SIZE)):
+        parts.append(orjson.dumps(batch, option=_ORJSON_OPTIONS)[1:-1])
+    return b"[" + b",".join(parts) + b"]"
+
+
+def _verification_json(poll: Poll) -> bytes:
     """
-    poll = poll_service.get_poll(poll_id)
-    if not poll:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, "Poll not found")
+    Encode the public verification payload (poll data plus certification graph).
     
-    # Create the certification graph for verification
-    certification_graph = {
-        "nodes": [],
-        "edges": []
+    Nodes and edges are generated lazily and encoded batch by batch, so
+    the graph never exists as full lists of dicts next to its JSON.
+    """
+    # Resolve each vote's option once; votes can be Vote objects or dicts
+    vote_options = {
+        user_id: vote.get("option") if isinstance(vote, dict) else getattr(vote, "option", None)
+        for user_id, vote in poll.votes.items()
+        if vote is not None
     }
     
-    # Add all registered users as nodes
-    for user_id, public_key in poll.registrants.items():
-        vote = poll.votes.get(user_id)
-        node_data = {
-            "id": user_id,
-            "publicKey": public_key,
-            "voted": vote is not None,
-        }
-        
-        # Handle vote data - votes can be either Vote objects or dicts
-        if vote is not None:
-            if isinstance(vote, dict) and "option" in vote:
-                node_data["vote"] = vote["option"]
-            elif hasattr(vote, "option"):  # Vote object
-                node_data["vote"] = vote.option
-            else:
-                node_data["vote"] = None  # Fallback for unknown vote format
-                
-        certification_graph["nodes"].append(node_data)
-    
-    # Add all PPE certifications as edges
-    for user_id, certified_peers in poll.ppe_certifications.items():
-        for peer_id in certified_peers:
-            # Add edge only once (we don't need both directions since it's bidirectional)
-            if user_id < peer_id:
-                certification_graph["edges"].append({
-                    "source": user_id,
-                    "target": peer_id,
-                    "type": "ppe_certification"
-                })
-    
-    # Add verifications as edges
-    for user_id, verifications in poll.verifications.items():
-        for verifier_id in verifications.verified_by:
-            certification_graph["edges"].append({
-                "source": verifier_id,
-                "target": user_id,
-                "type": "verification"
-            })
+    # All registered users are nodes
+    nodes = (
+        {"id": user_id, "publicKey": public_key, "voted": True, "vote": vote_options[user_id]}
+        if user_id in vote_options else
+        {"id": user_id, "publicKey": public_key, "voted": False}
+        for user_id, public_key in poll.registrants.items()
+    )
+    
+    # PPE certifications are stored in both directions; emit each edge once
+    ppe_edges = (
+        {"source": user_id, "target": peer_id, "type": "ppe_certification"}
+        for user_id, certified_peers in poll.ppe_certifications.items()
+        for peer_id in certified_peers
+        if user_id < peer_id
+    )
+    verification_edges = (
+        {"source": verifier_id, "target": user_id, "type": "verification"}
+        for user_id, verifications in poll.verifications.items()
+        for verifier_id in verifications.verified_by
+    )
     
     # Calculate graph metrics for verification
     verification_data = poll_service.verify_poll_integrity(poll)
     
-    return {
+    header = orjson.dumps({
         "poll_id": poll.id,
         "question": poll.question,
         "options": poll.options,
         "total_participants": len(poll.registrants),
         "total_votes": len(poll.votes),
-        "certification_graph": certification_graph,
-        "verification": verification_data
-    }
+    }, option=_ORJSON_OPTIONS)
+    
+    return b"".join((
+        header[:-1],
+        b',"certification_graph":{"nodes":', _encode_json_array(nodes),
+        b',"edges":', _encode_json_array(chain(ppe_edges, verification_edges)),
+        b'},"verification":', orjson.dumps(verification_data, option=_ORJSON_OPTIONS),
+        b"}"
+    ))
+
+
+@router.get("/{poll_id}/verify")
+async def get_poll_verification_data(poll_id: str, request: Request):
+    """
+    Get full poll data with certification graph for public verification.
+    This endpoint allows anyone to verify the poll's integrity without needing to register.
+    
+    The serialized payload is cached per poll version and tagged with a
+    weak ETag, so repeat polling gets a 304 until the poll changes.
+    """
+    poll = poll_service.get_poll(poll_id)
+    if not poll:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Poll not found")
+    
+    etag = f'W/"{poll.id}-{poll.version}"'
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    content = poll.cached_verification_body()
+    if content is None:
+        # Everything here is already JSON-native, so it goes straight to orjson
+        # rather than through jsonable_encoder
+        content = _verification_json(poll)
+        poll.cache_verification_body(content)
+    
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
@@ -83,9 +83,12 @@ async def initiate_ppe(poll_id: str, request: InitiatePPERequest):
     
     # Create session
     session_id = create_ppe_session_id(request.user1_id, request.user2_id, poll_id)
-    session = ppe_service.get_or_create_session(
-        request.user1_id, request.user2_id, poll_id, session_id
-    )
+    try:
+        session = ppe_service.get_or_create_session(
+            request.user1_id, request.user2_id, poll_id, session_id
+        )
+    except ValueError as e:
+        raise HTTPException(status.HTTP_429_TOO_MANY_REQUESTS, str(e))
     
     return {
         "session_id": session_id,
@@ -12,6 +12,11 @@ from ..ppe.base import PPEType, PPEDifficulty
 
 router = APIRouter(prefix="/ppe", tags=["PPE Configuration"])
 
+# Request strings resolved by plain dict lookups instead of Enum(value),
+# which raises and formats a ValueError on every invalid value
+_PPE_TYPES = {ppe_type.value: ppe_type for ppe_type in PPEType}
+_PPE_DIFFICULTIES = {difficulty.value: difficulty for difficulty in PPEDifficulty}
+
 
 class PPEConfigRequest(BaseModel):
     """Request to configure PPE for a poll."""
@@ -44,22 +49,22 @@ async def get_ppe_type_info(ppe_type: str):
     Returns:
         Metadata about the PPE type
     """
-    try:
-        ppe_type_enum = PPEType(ppe_type)
-    except ValueError:
-        raise HTTPException(
-            status.HTTP_404_NOT_FOUND,
-            f"PPE type '{ppe_type}' not found"
-        )
+    # Registered types are served from the factory's prebuilt metadata
+    # dicts, keyed by value, so the hit path builds nothing per request
+    metadata = ppe_factory.get_available_types().get(ppe_type)
+    if metadata is not None:
+        return metadata
     
-    metadata = ppe_factory.get_metadata(ppe_type_enum)
-    if not metadata:
+    if ppe_type not in _PPE_TYPES:
         raise HTTPException(
             status.HTTP_404_NOT_FOUND,
-            f"No metadata found for PPE type '{ppe_type}'"
+            f"PPE type '{ppe_type}' not found"
         )
     
-    return metadata.to_dict()
+    raise HTTPException(
+        status.HTTP_404_NOT_FOUND,
+        f"No metadata found for PPE type '{ppe_type}'"
+    )
 
 
 @router.post("/test-challenge")
@@ -75,17 +80,20 @@ async def test_challenge_generation(config: PPEConfigRequest):
     Returns:
         Sample challenge and metadata
     """
-    try:
-        ppe_type = PPEType(config.ppe_type)
-        difficulty = PPEDifficulty(config.difficulty)
-    except ValueError as e:
+    ppe_type = _PPE_TYPES.get(config.ppe_type)
+    difficulty = _PPE_DIFFICULTIES.get(config.difficulty)
+    if ppe_type is None or difficulty is None:
+        invalid = (
+            f"'{config.ppe_type}' is not a valid PPEType" if ppe_type is None
+            else f"'{config.difficulty}' is not a valid PPEDifficulty"
+        )
         raise HTTPException(
             status.HTTP_400_BAD_REQUEST,
-            f"Invalid configuration: {str(e)}"
+            f"Invalid configuration: {invalid}"
         )
     
-    # Create PPE instance
-    ppe = ppe_factory.create(ppe_type, difficulty)
+    # Shared PPE instance
+    ppe = ppe_factory.get_shared(ppe_type, difficulty)
     
     # Generate test challenge
     test_secret = "test_secret_123"
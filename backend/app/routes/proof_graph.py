@@ -2,8 +2,8 @@
 API routes for proof graph operations.
 """
 
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import Dict, Any
 
 from ..services.proof_graph_service import proof_graph_service
@@ -34,14 +34,15 @@ async def get_proof_graph(poll_id: str):
     # Construct or retrieve proof graph
     proof_graph = proof_graph_service.get_or_construct_proof_graph(poll)
     
-    # Verify the hash is valid
-    if not proof_graph.verify_hash():
+    # Verify the hash is valid (once per graph; the verified body is reused)
+    body = proof_graph_service.get_verified_json(proof_graph)
+    if body is None:
         raise HTTPException(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
             "Proof graph hash verification failed"
         )
     
-    return proof_graph.model_dump()
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/summary")
@@ -70,7 +71,7 @@ async def get_proof_summary(poll_id: str):
     # Create summary
     summary = proof_graph_service.create_summary(proof_graph, verification_result)
     
-    return summary.model_dump()
+    return ORJSONResponse(content=summary.model_dump())
 
 
 @router.get("/export")
@@ -94,22 +95,24 @@ async def export_proof_graph(poll_id: str):
     # Get proof graph
     proof_graph = proof_graph_service.get_or_construct_proof_graph(poll)
     
-    # Create exportable format
-    export_data = proof_graph.to_exportable_dict()
-    
-    # Add verification instructions
-    export_data["verification_instructions"] = {
-        "description": "This proof graph can be independently verified",
-        "steps": [
-            "1. Verify the graph hash matches the computed hash",
-            "2. Verify all votes have valid signatures",
-            "3. Verify all voters have sufficient PPE certifications",
-            "4. Verify the certification graph has good expansion properties"
-        ]
+    # Verification instructions follow the graph in the export
+    instructions = {
+        "verification_instructions": {
+            "description": "This proof graph can be independently verified",
+            "steps": [
+                "1. Verify the graph hash matches the computed hash",
+                "2. Verify all votes have valid signatures",
+                "3. Verify all voters have sufficient PPE certifications",
+                "4. Verify the certification graph has good expansion properties"
+            ]
+        }
     }
     
-    return JSONResponse(
-        content=export_data,
+    # Streamed section by section, so large exports aren't built as one
+    # dict and one encoded body at the same time
+    return StreamingResponse(
+        proof_graph_service.iter_export_json(proof_graph, instructions),
+        media_type="application/json",
         headers={
             "Content-Disposition": f"attachment; filename=proof_graph_{poll_id}.json"
         }
@@ -139,13 +142,13 @@ async def reconstruct_proof_graph(poll_id: str):
     # Reconstruct
     proof_graph = proof_graph_service.construct_proof_graph(poll)
     
-    return {
+    return ORJSONResponse(content={
         "message": "Proof graph reconstructed successfully",
         "graph_hash": proof_graph.graph_hash,
         "num_participants": proof_graph.metadata.num_participants,
         "num_certifications": proof_graph.metadata.num_certifications,
         "num_votes": proof_graph.metadata.num_votes
-    }
+    })
 
 
 @router.get("/verify-hash")
@@ -165,13 +168,13 @@ async def verify_proof_hash(poll_id: str):
     
     proof_graph = proof_graph_service.get_or_construct_proof_graph(poll)
     
-    is_valid = proof_graph.verify_hash()
+    # One full rehash (as verify_hash does) serves both fields
     stored_hash = proof_graph.graph_hash
-    computed_hash = proof_graph.compute_hash()
+    computed_hash = proof_graph.compute_hash(use_cache=False)
     
-    return {
-        "is_valid": is_valid,
+    return ORJSONResponse(content={
+        "is_valid": stored_hash is not None and computed_hash == stored_hash,
         "stored_hash": stored_hash,
         "computed_hash": computed_hash,
         "match": stored_hash == computed_hash
-    }
\ No newline at end of file
+    })
\ No newline at end of file
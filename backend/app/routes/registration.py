@@ -3,6 +3,7 @@ API routes for registration with initial PPE challenges.
 """
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any, Optional
 from pydantic import BaseModel
 
@@ -44,10 +45,10 @@ async def create_challenge(request: ChallengeRequest):
             difficulty=request.difficulty
         )
         
-        return {
+        return ORJSONResponse(content={
             "success": True,
             "challenge": challenge_data
-        }
+        })
     except Exception as e:
         raise HTTPException(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -74,10 +75,10 @@ async def validate_challenge(validation: ChallengeValidation):
         solution=validation.solution
     )
     
-    return {
+    return ORJSONResponse(content={
         "valid": is_valid,
         "message": "Challenge validated successfully" if is_valid else "Invalid solution or expired challenge"
-    }
+    })
 
 
 @router.get("/challenge/{challenge_id}")
@@ -101,4 +102,4 @@ async def get_challenge(challenge_id: str):
             "Challenge not found or expired"
         )
     
-    return challenge_info
\ No newline at end of file
+    return ORJSONResponse(content=challenge_info)
\ No newline at end of file
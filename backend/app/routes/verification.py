@@ -2,16 +2,51 @@
 API routes for advanced verification.
 """
 
-from fastapi import APIRouter, HTTPException, status
-from ..services.verification_service import verification_service
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from typing import Any, Callable, Dict
+
+from ..services.verification_service import VerificationResult, verification_service
 from ..services.poll_service import poll_service
+from ..utils.responses import etag_matches
 
 
 router = APIRouter(prefix="/polls/{poll_id}/verification", tags=["Verification"])
 
 
+def _verification_response(
+    poll_id: str,
+    request: Request,
+    render: Callable[[VerificationResult], Dict[str, Any]]
+) -> Response:
+    """
+    Respond with a view of the poll's (cached) verification result.
+    
+    Responses are tagged with the poll's version, so a client revalidating
+    an unchanged poll gets a 304 without the analysis being looked up.
+    
+    Args:
+        poll_id: Poll identifier
+        request: Incoming request (for If-None-Match)
+        render: Builds the endpoint's payload from the result
+        
+    Returns:
+        JSON response, or 304 Not Modified
+    """
+    poll = poll_service.get_poll(poll_id)
+    if not poll:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Poll not found")
+    
+    etag = f'W/"{poll.id}-{poll.version}"'
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    result = verification_service.get_cached_verification(poll)
+    return ORJSONResponse(content=render(result), headers={"ETag": etag})
+
+
 @router.get("/comprehensive")
-async def verify_poll_comprehensive(poll_id: str):
+async def verify_poll_comprehensive(poll_id: str, request: Request):
     """
     Perform comprehensive verification of a poll.
     
@@ -27,17 +62,11 @@ async def verify_poll_comprehensive(poll_id: str):
     Returns:
         Complete verification result with errors, warnings, and analysis
     """
-    poll = poll_service.get_poll(poll_id)
-    if not poll:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, "Poll not found")
-    
-    result = verification_service.verify_poll_comprehensive(poll)
-    
-    return result.to_dict()
+    return _verification_response(poll_id, request, VerificationResult.to_dict)
 
 
 @router.get("/graph-properties")
-async def get_graph_properties(poll_id: str):
+async def get_graph_properties(poll_id: str, request: Request):
     """
     Get detailed graph properties analysis.
     
@@ -47,23 +76,17 @@ async def get_graph_properties(poll_id: str):
     Returns:
         Graph connectivity, expansion, and structural properties
     """
-    poll = poll_service.get_poll(poll_id)
-    if not poll:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, "Poll not found")
-    
-    result = verification_service.verify_poll_comprehensive(poll)
-    
-    return {
+    return _verification_response(poll_id, request, lambda result: {
         "connectivity": result.analysis.get("connectivity", {}),
         "degree_distribution": result.analysis.get("degree_distribution", {}),
         "clustering_coefficient": result.metrics.get("clustering_coefficient", 0),
         "spectral_gap": result.metrics.get("spectral_gap", 0),
         "expansion_ratios": result.analysis.get("expansion_ratios", [])
-    }
+    })
 
 
 @router.get("/sybil-detection")
-async def detect_sybil_attacks(poll_id: str):
+async def detect_sybil_attacks(poll_id: str, request: Request):
     """
     Run Sybil attack detection algorithms.
     
@@ -73,22 +96,16 @@ async def detect_sybil_attacks(poll_id: str):
     Returns:
         Potential Sybil clusters and suspicious patterns
     """
-    poll = poll_service.get_poll(poll_id)
-    if not poll:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, "Poll not found")
-    
-    result = verification_service.verify_poll_comprehensive(poll)
-    
-    return {
+    return _verification_response(poll_id, request, lambda result: {
         "suspicious_clusters": result.analysis.get("suspicious_clusters", []),
         "isolated_components": result.analysis.get("isolated_components", []),
         "vote_certification_correlation": result.analysis.get("vote_certification_correlation", {}),
         "has_suspicious_patterns": len(result.warnings) > 0
-    }
+    })
 
 
 @router.get("/vote-validation")
-async def validate_votes(poll_id: str):
+async def validate_votes(poll_id: str, request: Request):
     """
     Validate all votes in the poll.
     
@@ -100,23 +117,17 @@ async def validate_votes(poll_id: str):
     Returns:
         Vote validation results
     """
-    poll = poll_service.get_poll(poll_id)
-    if not poll:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, "Poll not found")
-    
-    result = verification_service.verify_poll_comprehensive(poll)
-    
-    return {
+    return _verification_response(poll_id, request, lambda result: {
         "total_votes": result.metrics.get("total_votes", 0),
         "valid_votes": result.metrics.get("valid_votes", 0),
         "unauthorized_votes": result.analysis.get("unauthorized_votes", []),
         "invalid_signatures": result.analysis.get("invalid_signatures", []),
         "all_valid": result.is_valid
-    }
+    })
 
 
 @router.get("/statistical-analysis")
-async def get_statistical_analysis(poll_id: str):
+async def get_statistical_analysis(poll_id: str, request: Request):
     """
     Get statistical analysis of the poll.
     
@@ -126,16 +137,10 @@ async def get_statistical_analysis(poll_id: str):
     Returns:
         Statistical metrics and distributions
     """
-    poll = poll_service.get_poll(poll_id)
-    if not poll:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, "Poll not found")
-    
-    result = verification_service.verify_poll_comprehensive(poll)
-    
-    return {
+    return _verification_response(poll_id, request, lambda result: {
         "participation_rate": result.metrics.get("participation_rate", 0),
         "certification_coverage": result.metrics.get("certification_coverage", 0),
         "avg_certifications_per_user": result.metrics.get("avg_certifications_per_user", 0),
         "std_certifications_per_user": result.metrics.get("std_certifications_per_user", 0),
         "degree_distribution": result.analysis.get("degree_distribution", {})
-    }
\ No newline at end of file
+    })
\ No newline at end of file
@@ -1,12 +1,117 @@
-import json
+import logging
+from typing import Optional
+
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from ..services.connection_manager import manager
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/ws",
     tags=["WebSockets"],
 )
 
+
+async def _send(websocket: WebSocket, message: dict):
+    """Send a message as a JSON text frame, encoded with orjson."""
+    await websocket.send_text(orjson.dumps(message).decode())
+
+
+def _connection(poll_id: str, user_id: str) -> Optional[WebSocket]:
+    """Get a user's open socket in a poll, if connected."""
+    return manager.get_connection(poll_id, user_id)
+
+
+async def _relay_ppe(websocket: WebSocket, message: dict, poll_id: str, client_id: str):
+    """Relay a PPE protocol message to its target, tagged with the sender."""
+    target_id = message.get("target")
+    if not target_id:
+        await _send(websocket, {
+            "type": "error",
+            "error": "no_target",
+            "message": "PPE messages must specify a target user."
+        })
+        return
+    
+    target_ws = _connection(poll_id, target_id)
+    if target_ws:
+        message["from"] = client_id
+        await _send(target_ws, message)
+        logger.debug("Relayed %s to %.10s...", message["type"], target_id)
+    else:
+        logger.debug("Target %.10s... not connected", target_id)
+        await _send(websocket, {
+            "type": "error",
+            "error": "target_offline",
+            "message": "Target user is not connected.",
+            "target": target_id
+        })
+
+
+async def _request_verification(websocket: WebSocket, message: dict, poll_id: str, client_id: str):
+    """Ask the target user to verify the sender."""
+    target_ws = _connection(poll_id, message.get("target"))
+    if target_ws:
+        await manager.send_personal_message(
+            orjson.dumps({
+                "type": "verification_requested",
+                "from": client_id
+            }).decode(),
+            target_ws
+        )
+
+
+async def _accept_verification(websocket: WebSocket, message: dict, poll_id: str, client_id: str):
+    """Announce to the poll that the sender verified the target."""
+    await manager.broadcast_to_poll(
+        orjson.dumps({
+            "type": "verification_accepted",
+            "verifier": client_id,
+            "verified": message.get("target")
+        }).decode(),
+        poll_id
+    )
+
+
+async def _relay_generic(websocket: WebSocket, message: dict, poll_id: str, client_id: str):
+    """Relay any other targeted message; untargeted ones are ignored."""
+    target_id = message.get("target")
+    if not target_id:
+        return
+    
+    target_ws = _connection(poll_id, target_id)
+    if target_ws:
+        message["from"] = client_id
+        await _send(target_ws, message)
+    else:
+        await _send(websocket, {
+            "type": "error",
+            "error": "target_offline",
+            "message": "Target user not available."
+        })
+
+
+# Message type -> handler; unlisted types go to _relay_generic
+_HANDLERS = {
+    **dict.fromkeys(
+        ("ppe_challenge", "ppe_commitment", "ppe_reveal", "ppe_signature", "ppe_complete"),
+        _relay_ppe
+    ),
+    "request_verification": _request_verification,
+    "accept_verification": _accept_verification,
+}
+
+
+def _is_valid_message(message) -> bool:
+    """Check a decoded frame is an object with a string type and optional string target."""
+    return (
+        isinstance(message, dict)
+        and isinstance(message.get("type"), str)
+        and isinstance(message.get("target", ""), (str, type(None)))
+    )
+
+
 @router.websocket("/{poll_id}/{client_id}")
 async def websocket_endpoint(websocket: WebSocket, poll_id: str, client_id: str):
     """
@@ -18,91 +123,34 @@ async def websocket_endpoint(websocket: WebSocket, poll_id: str, client_id: str)
     try:
         while True:
             data = await websocket.receive_text()
-            message = json.loads(data)
-            
-            print(f"\n[SERVER LOG] Message from {client_id[:10]}...: {message.get('type')}")
+            message = orjson.loads(data)
             
             # Validate message structure
-            if not isinstance(message, dict) or "type" not in message:
-                await websocket.send_json({
+            if not _is_valid_message(message):
+                await _send(websocket, {
                     "type": "error",
                     "error": "invalid_message",
-                    "message": "Message must be a JSON object with 'type' field."
+                    "message": "Message must be a JSON object with a string 'type' field "
+                               "and, if present, a string 'target' field."
                 })
                 continue
             
-            msg_type = message.get("type")
-            target_id = message.get("target")
+            msg_type = message["type"]
             
-            # Handle PPE-specific messages
-            if msg_type in ["ppe_challenge", "ppe_commitment", "ppe_reveal", "ppe_signature", "ppe_complete"]:
-                if not target_id:
-                    await websocket.send_json({
-                        "type": "error",
-                        "error": "no_target",
-                        "message": "PPE messages must specify a target user."
-                    })
-                    continue
-                
-                # Find target websocket
-                target_ws = manager.active_connections.get(poll_id, {}).get(target_id)
-                
-                if target_ws:
-                    # Relay message to target with sender info
-                    message["from"] = client_id
-                    await target_ws.send_json(message)
-                    print(f"[SERVER LOG] Relayed {msg_type} to {target_id[:10]}...")
-                else:
-                    print(f"[SERVER LOG] Target {target_id[:10]}... not connected")
-                    await websocket.send_json({
-                        "type": "error",
-                        "error": "target_offline",
-                        "message": "Target user is not connected.",
-                        "target": target_id
-                    })
+            # %.10s truncates lazily, only if the record is emitted
+            logger.debug("Message from %.10s...: %s", client_id, msg_type)
             
-            # Handle other message types
-            elif msg_type == "request_verification":
-                if target_id:
-                    await manager.send_personal_message(
-                        json.dumps({
-                            "type": "verification_requested",
-                            "from": client_id
-                        }),
-                        poll_id,
-                        target_id
-                    )
-            
-            elif msg_type == "accept_verification":
-                await manager.broadcast_to_poll(
-                    json.dumps({
-                        "type": "verification_accepted",
-                        "verifier": client_id,
-                        "verified": target_id
-                    }),
-                    poll_id
-                )
-            
-            else:
-                # Generic message relay
-                if target_id:
-                    target_ws = manager.active_connections.get(poll_id, {}).get(target_id)
-                    if target_ws:
-                        message["from"] = client_id
-                        await target_ws.send_json(message)
-                    else:
-                        await websocket.send_json({
-                            "type": "error",
-                            "error": "target_offline",
-                            "message": "Target user not available."
-                        })
+            handler = _HANDLERS.get(msg_type, _relay_generic)
+            await handler(websocket, message, poll_id, client_id)
     except WebSocketDisconnect:
-        manager.disconnect(poll_id, client_id)
-        print(f"[SERVER LOG] Client {client_id[:10]} disconnected.")
-    except json.JSONDecodeError:
-        print(f"[SERVER LOG] Received non-JSON message from {client_id[:10]}")
-        await websocket.send_json({
+        logger.info("Client %.10s disconnected", client_id)
+    except orjson.JSONDecodeError:
+        logger.warning("Received non-JSON message from %.10s", client_id)
+        await _send(websocket, {
             "type": "error",
             "error": "invalid_format",
             "message": "Invalid message format. Messages must be valid JSON."
         })
+    finally:
+        # Also reached on unexpected errors, so no dead socket stays registered
+        manager.disconnect(poll_id, client_id)
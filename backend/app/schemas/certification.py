@@ -0,0 +1,71 @@
+"""
+Pydantic schemas for certification state responses.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
+from typing import List, Optional, Dict, Any, Iterable
+from datetime import datetime
+
+
+class CertificationStateOut(BaseModel):
+    """
+    Serialized CertificationState, same fields as CertificationState.to_dict().
+    
+    Built from ORM rows (from_attributes) so whole lists can be dumped by
+    pydantic-core in one call.
+    """
+    model_config = ConfigDict(from_attributes=True)
+    
+    user_id: str
+    poll_id: str
+    state: str
+    required_ppes: int
+    completed_ppes: int
+    failed_ppes: int
+    max_allowed_failures: int
+    is_certified: Optional[bool] = None
+    is_excluded: Optional[bool] = None
+    exclusion_reason: Optional[str] = None
+    has_voted: Optional[bool] = None
+    updated_at: Optional[datetime] = None
+    assigned_ppe_partners: Optional[List[str]] = Field(default=None, exclude=True)
+    
+    @computed_field
+    @property
+    def completion_percentage(self) -> float:
+        if self.required_ppes == 0:
+            return 0.0
+        return (self.completed_ppes / self.required_ppes) * 100
+    
+    @computed_field
+    @property
+    def remaining_ppes(self) -> int:
+        return max(0, self.required_ppes - self.completed_ppes)
+    
+    @computed_field
+    @property
+    def can_still_certify(self) -> bool:
+        return self.failed_ppes <= self.max_allowed_failures
+    
+    @computed_field
+    @property
+    def assigned_partners(self) -> int:
+        return len(self.assigned_ppe_partners or [])
+
+
+_STATE_LIST_ADAPTER = TypeAdapter(List[CertificationStateOut])
+
+
+def dump_certification_states(states: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Serialize many CertificationState rows at once.
+    
+    Args:
+        states: CertificationState ORM instances
+        
+    Returns:
+        List of dicts, with datetimes left for ORJSONResponse to encode
+    """
+    return _STATE_LIST_ADAPTER.dump_python(
+        _STATE_LIST_ADAPTER.validate_python(list(states), from_attributes=True)
+    )
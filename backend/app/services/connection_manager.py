@@ -1,6 +1,11 @@
-from typing import Dict, List
+import asyncio
+from types import MappingProxyType
+from typing import Dict, List, Optional
 from fastapi import WebSocket
 
+_NO_CONNECTIONS = MappingProxyType({})
+
+
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, Dict[str, WebSocket]] = {}
@@ -17,12 +22,21 @@ class ConnectionManager:
             del self.active_connections[poll_id][user_id]
             print(f"User {user_id[:10]}... disconnected from poll {poll_id}")
 
+    def get_connection(self, poll_id: str, user_id: str) -> Optional[WebSocket]:
+        # The shared empty fallback means an unknown poll allocates nothing
+        return self.active_connections.get(poll_id, _NO_CONNECTIONS).get(user_id)
+
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
     async def broadcast_to_poll(self, message: str, poll_id: str):
-        if poll_id in self.active_connections:
-            for connection in self.active_connections[poll_id].values():
-                await connection.send_text(message)
+        # Send to a snapshot of the poll's sockets concurrently, so a slow
+        # client doesn't hold up the rest and a closed one doesn't abort the
+        # broadcast (its own receive loop handles the disconnect)
+        connections = list(self.active_connections.get(poll_id, _NO_CONNECTIONS).values())
+        await asyncio.gather(
+            *(connection.send_text(message) for connection in connections),
+            return_exceptions=True
+        )
 
 manager = ConnectionManager()
@@ -4,8 +4,11 @@ Orchestrates all expansion metrics computation.
 """
 
 import networkx as nx
+from scipy.sparse import csr_matrix
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
 from app.models.graph_metrics import GraphExpansionMetrics
 from app.services.graph_expansion import (
@@ -14,6 +17,7 @@ from app.services.graph_expansion import (
 )
 from app.services.spectral_analysis import SpectralAnalyzer
 from app.services.sybil_bounds import SybilBoundCalculator
+from app.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,119 @@ class GraphExpansionService:
     Main entry point for expansion verification.
     """
     
+    def __init__(self, cache_ttl_seconds: float = 300.0, max_cached: int = 256):
+        # Computed metrics keyed by (poll_id, attack_edges, graph signature)
+        self._metrics_cache = TTLCache(maxsize=max_cached, ttl=cache_ttl_seconds)
+        
+        # Worker processes for CPU-bound metric computation (see start_worker_pool)
+        self._worker_pool: Optional[ProcessPoolExecutor] = None
+    
+    def start_worker_pool(self, max_workers: Optional[int] = None):
+        """
+        Start worker processes for compute_metrics().
+        
+        Metric computation is CPU-bound and holds the GIL, so running it in
+        separate processes keeps the API responsive and uses every core.
+        
+        Args:
+            max_workers: Number of worker processes (defaults to CPU count)
+        """
+        if self._worker_pool is None:
+            # spawn: don't fork a process holding DB connections and threads
+            self._worker_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+    
+    def shutdown_worker_pool(self):
+        """Stop the worker processes, if started."""
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+            self._worker_pool = None
+    
+    def compute_metrics(
+        self,
+        graph: nx.Graph,
+        poll_id: str,
+        attack_edges: Optional[int] = None,
+        adjacency: Optional[csr_matrix] = None
+    ) -> GraphExpansionMetrics:
+        """
+        Compute all metrics, in a worker process when the pool is running.
+        
+        Blocks the calling thread until the result is ready. Falls back to
+        computing in-process when no worker pool has been started.
+        
+        Args:
+            graph: Certification graph
+            poll_id: Poll identifier
+            attack_edges: Number of attack edges (if known)
+            adjacency: Optional CSR adjacency of graph
+            
+        Returns:
+            Complete GraphExpansionMetrics
+        """
+        if self._worker_pool is None:
+            return self.compute_all_metrics(
+                graph=graph,
+                poll_id=poll_id,
+                attack_edges=attack_edges,
+                adjacency=adjacency
+            )
+        
+        return self._worker_pool.submit(
+            _compute_in_worker, graph, poll_id, attack_edges, adjacency
+        ).result()
+    
+    def get_cached_metrics(
+        self,
+        poll_id: str,
+        attack_edges: Optional[int] = None,
+        signature: Tuple = ()
+    ) -> Optional[GraphExpansionMetrics]:
+        """
+        Get previously computed metrics for a poll, if still fresh.
+        
+        Args:
+            poll_id: Poll identifier
+            attack_edges: Attack edges the metrics were computed with
+            signature: Certification graph signature the metrics were computed for
+            
+        Returns:
+            Cached GraphExpansionMetrics or None
+        """
+        return self._metrics_cache.get((poll_id, attack_edges, signature))
+    
+    def cache_metrics(
+        self,
+        poll_id: str,
+        metrics: GraphExpansionMetrics,
+        attack_edges: Optional[int] = None,
+        signature: Tuple = ()
+    ):
+        """
+        Store computed metrics for a poll.
+        
+        Args:
+            poll_id: Poll identifier
+            metrics: Computed metrics
+            attack_edges: Attack edges the metrics were computed with
+            signature: Certification graph signature the metrics were computed for
+        """
+        self._metrics_cache.set((poll_id, attack_edges, signature), metrics)
+    
+    def invalidate_metrics(self, poll_id: str):
+        """
+        Invalidate cached metrics for a poll.
+        
+        Entries are keyed on the graph signature, so this only frees the
+        memory of superseded metrics early.
+        
+        Args:
+            poll_id: Poll identifier
+        """
+        self._metrics_cache.pop_where(lambda key: key[0] == poll_id)
+    
     def compute_all_metrics(
         self,
         graph: nx.Graph,
@@ -31,7 +148,8 @@ class GraphExpansionService:
         attack_edges: Optional[int] = None,
         security_param: int = 40,
         eta_e: float = 0.125,
-        eta_v: float = 0.025
+        eta_v: float = 0.025,
+        adjacency: Optional[csr_matrix] = None
     ) -> GraphExpansionMetrics:
         """
         Compute all expansion metrics for certification graph.
@@ -43,6 +161,8 @@ class GraphExpansionService:
             security_param: Security parameter κ
             eta_e: Max fraction failed PPEs (ηE)
             eta_v: Max fraction deleted nodes (ηV)
+            adjacency: Optional CSR adjacency of graph for the spectral
+                       computation (rows in graph.nodes() order)
             
         Returns:
             Complete GraphExpansionMetrics
@@ -51,7 +171,7 @@ class GraphExpansionService:
         
         # Initialize analyzers
         expansion_analyzer = GraphExpansionAnalyzer(graph)
-        spectral_analyzer = SpectralAnalyzer(graph)
+        spectral_analyzer = SpectralAnalyzer(graph, adjacency=adjacency)
         
         # Build LSE parameters
         lse_params = build_lse_parameters_from_graph(graph, security_param, eta_v)
@@ -139,4 +259,19 @@ class GraphExpansionService:
 
 
 # Global service instance
-expansion_service = GraphExpansionService()
\ No newline at end of file
+expansion_service = GraphExpansionService()
+
+
+def _compute_in_worker(
+    graph: nx.Graph,
+    poll_id: str,
+    attack_edges: Optional[int],
+    adjacency: Optional[csr_matrix]
+) -> GraphExpansionMetrics:
+    """Worker-process entry point (uses the worker's own service instance)."""
+    return expansion_service.compute_all_metrics(
+        graph=graph,
+        poll_id=poll_id,
+        attack_edges=attack_edges,
+        adjacency=adjacency
+    )
\ No newline at end of file
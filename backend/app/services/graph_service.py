@@ -2,9 +2,10 @@
 Service for managing ideal certification graphs for polls.
 """
 
-from typing import Dict, Set, Optional, List
+from typing import Collection, Dict, Set, Optional, Tuple
 from ..utils.graph_utils import (
     generate_ideal_graph,
+    participant_fingerprint,
     validate_graph_properties,
     get_user_neighbors,
     calculate_graph_metrics
@@ -19,45 +20,57 @@ class GraphService:
     def __init__(self):
         # Cache of generated graphs: {poll_id: graph}
         self._graph_cache: Dict[str, Dict[str, Set[str]]] = {}
+        # Participant fingerprint each cached graph was generated for
+        self._graph_fingerprints: Dict[str, Tuple[int, int]] = {}
         # Graph properties cache: {poll_id: properties}
         self._properties_cache: Dict[str, Dict] = {}
+        # Graph metrics cache: {poll_id: metrics}, filled on first request
+        self._metrics_cache: Dict[str, Dict] = {}
         # Configuration
         self.default_k = 3  # Default degree for regular graph
     
     def get_or_generate_graph(
         self,
         poll_id: str,
-        participant_ids: List[str],
-        k: Optional[int] = None
+        participant_ids: Collection[str],
+        k: Optional[int] = None,
+        fingerprint: Optional[Tuple[int, int]] = None
     ) -> Dict[str, Set[str]]:
         """
         Get the ideal graph for a poll, generating it if not cached.
         
         Args:
             poll_id: Poll identifier
-            participant_ids: List of registered participant IDs
+            participant_ids: Registered participant IDs (e.g. poll.registrants)
             k: Desired degree (None uses default)
+            fingerprint: participant_fingerprint() of participant_ids if
+                already known (Poll.participant_fingerprint), which makes a
+                cache hit O(1)
             
         Returns:
             Adjacency list representation of the ideal graph
         """
-        # Check cache first
-        if poll_id in self._graph_cache:
-            cached_graph = self._graph_cache[poll_id]
-            # Verify cache is still valid (same participants)
-            if set(cached_graph.keys()) == set(participant_ids):
-                return cached_graph
+        if fingerprint is None:
+            fingerprint = participant_fingerprint(participant_ids)
+        
+        # Cached graphs are reused while the participants are the same
+        cached_graph = self._graph_cache.get(poll_id)
+        if cached_graph is not None and self._graph_fingerprints.get(poll_id) == fingerprint:
+            return cached_graph
         
         # Generate new graph
         effective_k = k if k is not None else self.default_k
-        graph = generate_ideal_graph(participant_ids, poll_id, effective_k)
+        graph = generate_ideal_graph(list(participant_ids), poll_id, effective_k)
         
         # Cache it
         self._graph_cache[poll_id] = graph
+        self._graph_fingerprints[poll_id] = fingerprint
         
-        # Calculate and cache properties
+        # Calculate and cache properties; metrics (the costlier NetworkX
+        # walk) are computed on first request
         properties = validate_graph_properties(graph)
         self._properties_cache[poll_id] = properties
+        self._metrics_cache.pop(poll_id, None)
         
         return graph
     
@@ -106,17 +119,25 @@ class GraphService:
         """
         Get detailed metrics about a poll's certification graph.
         
+        Computed once per generated graph and cached until it changes.
+        
         Args:
             poll_id: Poll identifier
             
         Returns:
             Dictionary with graph metrics
         """
+        metrics = self._metrics_cache.get(poll_id)
+        if metrics is not None:
+            return metrics
+        
         graph = self._graph_cache.get(poll_id, {})
         if not graph:
             return {"error": "Graph not generated yet"}
         
-        return calculate_graph_metrics(graph)
+        metrics = calculate_graph_metrics(graph)
+        self._metrics_cache[poll_id] = metrics
+        return metrics
     
     def invalidate_graph(self, poll_id: str):
         """
@@ -129,6 +150,8 @@ class GraphService:
         """
         if poll_id in self._graph_cache:
             del self._graph_cache[poll_id]
+        self._graph_fingerprints.pop(poll_id, None)
+        self._metrics_cache.pop(poll_id, None)
         if poll_id in self._properties_cache:
             del self._properties_cache[poll_id]
     
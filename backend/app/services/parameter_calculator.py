@@ -5,6 +5,7 @@ Given constraints, calculate valid parameters.
 
 import math
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 from app.models.poll_parameters import ParameterConstraints, SecurityLevel
@@ -199,6 +200,7 @@ class ParameterCalculator:
         return min(m / 2, 200)  # Cap at 200 for practicality
 
 
+@lru_cache(maxsize=1)
 def get_calculator() -> ParameterCalculator:
-    """Factory function."""
+    """Factory function (returns a shared instance)."""
     return ParameterCalculator()
\ No newline at end of file
@@ -5,6 +5,7 @@ Implements all 6 constraints from Appendix C.
 
 import math
 import logging
+from functools import lru_cache
 from typing import Tuple, List, Dict, Any
 
 from app.models.poll_parameters import (
@@ -30,9 +31,17 @@ class ParameterValidator:
         """
         Validate all constraints.
         
+        Results are memoized per parameter set, so the returned object is
+        shared between callers and must not be mutated.
+        
         Returns:
             ParameterValidationResult with detailed validation info
         """
+        return self._validate_cached(params)
+    
+    @lru_cache(maxsize=1024)
+    def _validate_cached(self, params: ParameterConstraints) -> ParameterValidationResult:
+        """Run all constraint checks (memoized by validate_all)."""
         result = ParameterValidationResult(
             valid=True,
             calculated_values={}
@@ -357,6 +366,7 @@ class ParameterValidator:
         return max(0, min(100, completion_rate * 100))
 
 
+@lru_cache(maxsize=1)
 def get_validator() -> ParameterValidator:
-    """Factory function."""
+    """Factory function (returns a shared instance)."""
     return ParameterValidator()
\ No newline at end of file
@@ -1,7 +1,9 @@
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, Optional, Any, Set, Tuple
+from functools import lru_cache
 import json
 import hashlib
 import asyncio
+import orjson
 from ..models.poll import Poll, PollCreate, Vote
 from ..services.connection_manager import manager
 from ..utils.crypto_utils import verify_signature
@@ -9,12 +11,30 @@ from ..services.state_machine import get_state_machine
 
 _polls_db: Dict[str, Poll] = {}
 
-def get_user_id(public_key_jwk: Dict[str, Any]) -> str:
+def _hash_public_key(public_key_jwk: Dict[str, Any]) -> str:
     return hashlib.sha256(json.dumps(public_key_jwk, sort_keys=True).encode()).hexdigest()
 
+# Memoized on orjson's key-sorted encoding, which is much cheaper to produce
+# than json.dumps' and decodes back to an equal JWK
+@lru_cache(maxsize=8192)
+def _user_id_for_canonical_key(canonical_key: bytes) -> str:
+    return _hash_public_key(orjson.loads(canonical_key))
+
+def get_user_id(public_key_jwk: Dict[str, Any]) -> str:
+    try:
+        canonical_key = orjson.dumps(public_key_jwk, option=orjson.OPT_SORT_KEYS)
+    except TypeError:  # not plain JSON (e.g. non-string keys)
+        return _hash_public_key(public_key_jwk)
+    return _user_id_for_canonical_key(canonical_key)
+
 class PollService:
     def __init__(self, db_session=None):
         self.db = db_session
+        # Per-poll locks held across the awaits in record_vote_async
+        self._vote_locks: Dict[str, asyncio.Lock] = {}
+        # The event loop only keeps weak references to tasks, so detached
+        # broadcasts are held here until they finish
+        self._broadcast_tasks: Set[asyncio.Task] = set()
     
     def create_poll(self, poll_data: PollCreate) -> Poll:
         # Use model_dump() instead of dict() to avoid Pydantic deprecation warning
@@ -30,13 +50,13 @@ class PollService:
         if not poll: return None
         
         user_id = get_user_id(public_key_jwk)
-        if user_id not in poll.registrants:
-            poll.registrants[user_id] = public_key_jwk
+        if poll.add_registrant(user_id, public_key_jwk):
+            poll.bump_version()
             print(f"User {user_id[:10]}... registered for poll {poll_id}")
             
             # Broadcast that a new user has registered
             await manager.broadcast_to_poll(
-                json.dumps({"type": "user_registered", "userId": user_id}),
+                orjson.dumps({"type": "user_registered", "userId": user_id}).decode(),
                 poll_id
             )
         
@@ -51,6 +71,36 @@ class PollService:
         4. User has enough verifications
         5. Signature is valid
         """
+        poll, user_id = self._check_vote(poll_id, vote)
+
+        # Verify signature
+        if not verify_signature(vote.publicKey, f"{poll.id}:{vote.option}", vote.signature):
+            raise ValueError("Invalid signature")
+
+        return self._store_vote(poll, user_id, vote)
+
+    async def record_vote_async(self, poll_id: str, vote: Vote) -> Optional[Poll]:
+        """
+        record_vote for async callers.
+        
+        The ECDSA signature check runs in a worker thread, so it doesn't
+        block the event loop. The poll's lock is held from the eligibility
+        checks until the vote is stored, so a concurrent duplicate vote
+        can't slip in while the signature is being verified.
+        """
+        lock = self._vote_locks.setdefault(poll_id, asyncio.Lock())
+        async with lock:
+            poll, user_id = self._check_vote(poll_id, vote)
+
+            if not await asyncio.to_thread(
+                verify_signature, vote.publicKey, f"{poll.id}:{vote.option}", vote.signature
+            ):
+                raise ValueError("Invalid signature")
+
+            return self._store_vote(poll, user_id, vote)
+
+    def _check_vote(self, poll_id: str, vote: Vote) -> Tuple[Poll, str]:
+        """Run record_vote's checks except the signature; returns (poll, user_id)."""
         poll = self.get_poll(poll_id)
         if not poll:
             raise ValueError("Poll not found")
@@ -77,30 +127,44 @@ class PollService:
                 verification_count = len(poll.verifications.get(user_id, {}).verified_by)
                 raise ValueError(f"Insufficient verifications. You have {verification_count}/2 required verifications")
 
-        # Verify signature
-        message_to_verify = f"{poll.id}:{vote.option}"
-        if not verify_signature(vote.publicKey, message_to_verify, vote.signature):
-            raise ValueError("Invalid signature")
+        return poll, user_id
 
-        # Record the vote
+    def _store_vote(self, poll: Poll, user_id: str, vote: Vote) -> Poll:
+        """Record a checked vote, then invalidate caches and broadcast it."""
         poll.votes[user_id] = vote
+        poll.bump_version()
         
         # Invalidate caches
-        self.invalidate_caches(poll_id)
+        self.invalidate_caches(poll.id)
         
         # Broadcast vote update to all connected clients
-        asyncio.create_task(manager.broadcast_to_poll(
-            json.dumps({
+        self._broadcast_in_background(
+            orjson.dumps({
                 "type": "vote_cast",
                 "voter_id": user_id,
                 "option": vote.option,
-                "poll_id": poll_id
-            }),
-            poll_id
-        ))
+                "poll_id": poll.id
+            }).decode(),
+            poll.id
+        )
         
         return poll
 
+    def _broadcast_in_background(self, message: str, poll_id: str):
+        """
+        Broadcast to a poll's clients without waiting for delivery.
+        
+        The caller's response goes out once the in-memory state is updated;
+        the broadcast runs as a separate task.
+        
+        Args:
+            message: JSON message to send
+            poll_id: Poll identifier
+        """
+        task = asyncio.create_task(manager.broadcast_to_poll(message, poll_id))
+        self._broadcast_tasks.add(task)
+        task.add_done_callback(self._broadcast_tasks.discard)
+
     def get_all_polls(self) -> list[Poll]:
         """
         Retrieve all polls from storage
@@ -123,17 +187,18 @@ class PollService:
             
         # Add the verification
         poll.add_verification(verifier_id, verified_id)
+        poll.bump_version()
         
         # Broadcast verification update to all connected clients
-        asyncio.create_task(manager.broadcast_to_poll(
-            json.dumps({
+        self._broadcast_in_background(
+            orjson.dumps({
                 "type": "user_verified",
                 "verifier_id": verifier_id,
                 "verified_id": verified_id,
                 "poll_id": poll_id
-            }),
+            }).decode(),
             poll_id
-        ))
+        )
         
         return poll
 
@@ -153,18 +218,65 @@ class PollService:
             
         # Add the PPE certification
         poll.add_ppe_certification(user1_id, user2_id)
+        poll.bump_version()
         print(f"PPE certification recorded between {user1_id[:10]}... and {user2_id[:10]}...")
         
         # Broadcast PPE certification update to all connected clients
-        asyncio.create_task(manager.broadcast_to_poll(
-            json.dumps({
+        self._broadcast_in_background(
+            orjson.dumps({
                 "type": "ppe_certified",
                 "user1_id": user1_id,
                 "user2_id": user2_id,
                 "poll_id": poll_id
-            }),
+            }).decode(),
+            poll_id
+        )
+        
+        return poll
+    
+    def record_ppe_certifications(
+        self,
+        poll_id: str,
+        pairs: Iterable[Tuple[str, str]]
+    ) -> Optional[Poll]:
+        """
+        Record many PPE certifications at once.
+        
+        Every pair is checked as in record_ppe_certification before any is
+        recorded, so a bad pair leaves the poll unchanged. The version is
+        bumped and clients are notified once for the whole batch.
+        
+        Args:
+            poll_id: Poll identifier
+            pairs: (user1_id, user2_id) pairs
+            
+        Returns:
+            Updated poll, or None if the poll doesn't exist
+        """
+        poll = self.get_poll(poll_id)
+        if not poll:
+            return None
+        
+        pairs = list(pairs)
+        for user1_id, user2_id in pairs:
+            if user1_id not in poll.registrants or user2_id not in poll.registrants:
+                raise ValueError("Both users must be registered for this poll")
+            if user1_id == user2_id:
+                raise ValueError("Users cannot certify themselves")
+        
+        for user1_id, user2_id in pairs:
+            poll.add_ppe_certification(user1_id, user2_id)
+        poll.bump_version()
+        print(f"{len(pairs)} PPE certifications recorded for poll {poll_id}")
+        
+        self._broadcast_in_background(
+            orjson.dumps({
+                "type": "ppe_certified_batch",
+                "pairs": pairs,
+                "poll_id": poll_id
+            }).decode(),
             poll_id
-        ))
+        )
         
         return poll
     
@@ -205,10 +317,7 @@ class PollService:
             ppe_coverage = (total_certifications / 2) / total_possible_connections if total_possible_connections > 0 else 0
         
         # Check for unauthorized votes
-        unauthorized_votes = []
-        for voter_id in poll.votes:
-            if not poll.can_vote(voter_id):
-                unauthorized_votes.append(voter_id)
+        unauthorized_votes = [voter_id for voter_id in poll.votes if not poll.can_vote(voter_id)]
         
         # Calculate expansion properties
         # A good expander graph has high connectivity, meaning removal of a small 
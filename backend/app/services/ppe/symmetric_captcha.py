@@ -103,13 +103,16 @@ class SymmetricCaptchaPPE(TwoSidedPPE):
         correct_solution = verification_data["solution"]
         session_id = verification_data["session_id"]
         
-        # Verify MAC first (prevents replay attacks)
+        # Verify MAC first (prevents replay attacks); constant-time comparisons
+        # so response timing doesn't leak how much of the MAC/answer matched
         expected_mac = challenge_data["mac"]
-        if user_mac != expected_mac:
+        if not hmac.compare_digest(str(user_mac).encode(), str(expected_mac).encode()):
             return False, "Invalid MAC - possible replay attack"
         
         # Verify answer (case-insensitive)
-        if user_answer.strip().upper() != correct_solution.strip().upper():
+        if not hmac.compare_digest(
+            user_answer.strip().upper().encode(), correct_solution.strip().upper().encode()
+        ):
             return False, "Incorrect CAPTCHA solution"
         
         return True, None
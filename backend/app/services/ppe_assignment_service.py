@@ -8,7 +8,7 @@ FIXES Issue #2: No more manual "Verify User" button.
 import hashlib
 from typing import List, Dict, Set
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload, undefer_group
 
 from app.models.user import Poll, User
 from app.models.certification_state import CertificationState
@@ -125,8 +125,15 @@ class PPEAssignmentService:
         if not poll:
             raise ValueError(f"Poll {poll_id} not found")
         
-        # Get all registered users (shuffled order from Protocol 2)
-        users = self.db.query(User).filter_by(poll_id=poll_id).order_by(User.registration_order).all()
+        # Get all registered users (shuffled order from Protocol 2), with
+        # their certification states in one extra query rather than one each
+        users = (
+            self.db.query(User)
+            .filter_by(poll_id=poll_id)
+            .options(selectinload(User.certification_state))
+            .order_by(User.registration_order)
+            .all()
+        )
         
         if len(users) == 0:
             logger.warning(f"No users registered for poll {poll_id}")
@@ -159,10 +166,7 @@ class PPEAssignmentService:
             assignments[user.id] = partner_ids
             
             # Store in certification state
-            cert_state = self.db.query(CertificationState).filter_by(
-                user_id=user.id,
-                poll_id=poll_id
-            ).first()
+            cert_state = user.certification_state
             
             if not cert_state:
                 cert_state = CertificationState(
@@ -209,7 +213,7 @@ class PPEAssignmentService:
         cert_state = self.db.query(CertificationState).filter_by(
             user_id=user_id,
             poll_id=poll_id
-        ).first()
+        ).options(undefer_group("ppe_history")).first()
         
         if not cert_state:
             return {
@@ -4,9 +4,11 @@ Manages concurrent PPE executions and state.
 """
 
 import uuid
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 import logging
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.ppe_types import PPEType, PPEExecution, PPEConfig, PPEDifficulty
@@ -18,6 +20,25 @@ from app.services.ppe.social_distance import SocialDistancePPE
 
 logger = logging.getLogger(__name__)
 
+# Registry of available PPE implementations
+PPE_REGISTRY: Dict[PPEType, type] = {
+    PPEType.SYMMETRIC_CAPTCHA: SymmetricCaptchaPPE,
+    PPEType.PROOF_OF_STORAGE: ProofOfStoragePPE,
+    PPEType.COMPUTATIONAL: ComputationalPPE,
+    PPEType.SOCIAL_DISTANCE: SocialDistancePPE,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_ppe_instance(ppe_type: PPEType, difficulty: PPEDifficulty) -> PPEProtocol:
+    """
+    Get the shared PPE implementation for a type and difficulty.
+    
+    Implementations hold only configuration, so one instance per
+    (type, difficulty) is reused across executions.
+    """
+    return PPE_REGISTRY[ppe_type](difficulty=difficulty)
+
 
 class PPEExecutor:
     """
@@ -31,14 +52,7 @@ class PPEExecutor:
     
     def __init__(self, db: Session):
         self.db = db
-        
-        # Registry of available PPE implementations
-        self.ppe_registry: Dict[PPEType, type] = {
-            PPEType.SYMMETRIC_CAPTCHA: SymmetricCaptchaPPE,
-            PPEType.PROOF_OF_STORAGE: ProofOfStoragePPE,
-            PPEType.COMPUTATIONAL: ComputationalPPE,
-            PPEType.SOCIAL_DISTANCE: SocialDistancePPE,
-        }
+        self.ppe_registry = PPE_REGISTRY
     
     def initiate_ppe(
         self,
@@ -69,7 +83,7 @@ class PPEExecutor:
             ppe_type = PPEType(config.default_certification_type)
         
         # Validate PPE type is allowed
-        if ppe_type not in config.allowed_certification_types:
+        if not config.is_allowed(ppe_type):
             raise ValueError(f"PPE type {ppe_type} not allowed for this poll")
         
         # Check concurrent execution limit
@@ -183,6 +197,36 @@ class PPEExecutor:
             PPEExecution.status.in_(["pending", "in_progress"])
         ).all()
     
+    def get_active_ppe_summaries(self, user_id: str, poll_id: str) -> List[Dict[str, Any]]:
+        """
+        Get all active PPEs for a user as plain dicts.
+        
+        Same fields as PPEExecution.to_dict(), but selected as columns so
+        no ORM instances are built.
+        """
+        rows = self.db.execute(
+            select(
+                PPEExecution.id,
+                PPEExecution.poll_id,
+                PPEExecution.prover_id,
+                PPEExecution.verifier_id,
+                PPEExecution.ppe_type,
+                PPEExecution.difficulty,
+                PPEExecution.status,
+                PPEExecution.result,
+                PPEExecution.failure_reason,
+                PPEExecution.started_at,
+                PPEExecution.completed_at,
+                PPEExecution.duration_seconds
+            ).where(
+                PPEExecution.prover_id == user_id,
+                PPEExecution.poll_id == poll_id,
+                PPEExecution.status.in_(["pending", "in_progress"])
+            )
+        ).mappings()
+        
+        return [dict(row) for row in rows]
+    
     def cleanup_expired_ppes(self, poll_id: str):
         """Mark timed-out PPEs as failed."""
         config = self.db.query(PPEConfig).filter_by(poll_id=poll_id).first()
@@ -207,12 +251,11 @@ class PPEExecutor:
         logger.info(f"Cleaned up {len(expired)} expired PPEs for poll {poll_id}")
     
     def _create_ppe_instance(self, ppe_type: PPEType, difficulty: PPEDifficulty) -> PPEProtocol:
-        """Create PPE implementation instance."""
-        ppe_class = self.ppe_registry.get(ppe_type)
-        if not ppe_class:
+        """Get (shared) PPE implementation instance."""
+        if ppe_type not in self.ppe_registry:
             raise ValueError(f"Unknown PPE type: {ppe_type}")
         
-        return ppe_class(difficulty=difficulty)
+        return _get_ppe_instance(PPEType(ppe_type), PPEDifficulty(difficulty))
 
 
 def get_ppe_executor(db: Session) -> PPEExecutor:
@@ -7,6 +7,11 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from app.models.ppe_types import PPEType, PPEConfig, PPEDifficulty
+from app.utils.cache import TTLCache
+
+# PPEConfig.to_dict() by poll_id; configs are read on most PPE requests but
+# only written here, so the writers below invalidate it.
+ppe_config_cache = TTLCache(1024, ttl=60)
 
 
 def create_default_ppe_config(
@@ -67,6 +72,7 @@ def create_default_ppe_config(
     db.add(config)
     db.commit()
     db.refresh(config)
+    ppe_config_cache.pop(poll_id)
     
     return config
 
@@ -97,6 +103,7 @@ def update_poll_ppe_config(
     
     db.commit()
     db.refresh(config)
+    ppe_config_cache.pop(poll_id)
     
     return config
 
@@ -191,10 +198,10 @@ def validate_ppe_config(config: PPEConfig) -> List[str]:
         issues.append("High concurrent PPE limit may impact performance")
     
     # Check PPE type consistency
-    if not config.allowed_certification_types:
+    if not config.allowed_certification_mask:
         issues.append("No certification PPE types allowed")
     
-    if config.default_certification_type not in config.allowed_certification_types:
+    if not config.is_allowed(config.default_certification_type):
         issues.append("Default certification type not in allowed types")
     
     return issues
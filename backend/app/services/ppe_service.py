@@ -2,9 +2,10 @@
 Service for managing PPE protocol state and execution.
 """
 
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
+import heapq
 import json
 
 
@@ -104,15 +105,27 @@ class PPEService:
     Service for managing PPE protocol sessions.
     """
     
+    # Cap on live sessions per poll, so a flood of initiations can't grow
+    # the store without bound
+    MAX_SESSIONS_PER_POLL = 10_000
+    
     def __init__(self):
         # Active sessions: {session_id: PPESession}
         self._sessions: Dict[str, PPESession] = {}
+        # Min-heap of (expires_at, session_id); entries whose session was
+        # removed or replaced are skipped when popped
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        # Live session count per poll: {poll_id: count}
+        self._poll_session_counts: Dict[str, int] = {}
     
     def create_session(self, user1_id: str, user2_id: str, poll_id: str, 
                        session_id: str) -> PPESession:
         """
         Create a new PPE session.
         
+        Expired sessions are evicted first, so the store only holds
+        sessions that are still live.
+        
         Args:
             user1_id: First user's ID
             user2_id: Second user's ID
@@ -121,9 +134,20 @@ class PPEService:
             
         Returns:
             New PPESession object
+            
+        Raises:
+            ValueError: If the poll already has MAX_SESSIONS_PER_POLL sessions
         """
+        self.cleanup_expired_sessions()
+        self._discard(session_id)
+        
+        if self._poll_session_counts.get(poll_id, 0) >= self.MAX_SESSIONS_PER_POLL:
+            raise ValueError("Too many active PPE sessions for this poll")
+        
         session = PPESession(user1_id, user2_id, poll_id, session_id)
         self._sessions[session_id] = session
+        self._poll_session_counts[poll_id] = self._poll_session_counts.get(poll_id, 0) + 1
+        heapq.heappush(self._expiry_heap, (session.expires_at, session_id))
         return session
     
     def get_session(self, session_id: str) -> Optional[PPESession]:
@@ -131,7 +155,7 @@ class PPEService:
         session = self._sessions.get(session_id)
         if session and session.is_expired():
             # Clean up expired session
-            del self._sessions[session_id]
+            self._discard(session_id)
             return None
         return session
     
@@ -145,14 +169,29 @@ class PPEService:
     
     def remove_session(self, session_id: str):
         """Remove a session."""
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        self._discard(session_id)
     
     def cleanup_expired_sessions(self):
-        """Remove all expired sessions."""
-        expired = [sid for sid, session in self._sessions.items() if session.is_expired()]
-        for sid in expired:
-            del self._sessions[sid]
+        """Remove all expired sessions (O(log n) per expired session)."""
+        now = datetime.now()
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, session_id = heapq.heappop(heap)
+            session = self._sessions.get(session_id)
+            # Skip entries for sessions already removed or recreated since
+            if session is not None and session.expires_at == expires_at:
+                self._discard(session_id)
+    
+    def _discard(self, session_id: str):
+        """Drop a session and its per-poll count (its heap entry goes stale)."""
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return
+        remaining = self._poll_session_counts[session.poll_id] - 1
+        if remaining:
+            self._poll_session_counts[session.poll_id] = remaining
+        else:
+            del self._poll_session_counts[session.poll_id]
     
     def get_active_sessions_for_user(self, user_id: str) -> list[PPESession]:
         """Get all active sessions involving a user."""
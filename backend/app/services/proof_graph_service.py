@@ -2,8 +2,10 @@
 Service for constructing and managing proof graphs.
 """
 
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+import orjson
+from pydantic import TypeAdapter
 from ..models.proof_graph import (
     ProofGraph,
     GraphMetadata,
@@ -14,6 +16,16 @@ from ..models.proof_graph import (
 )
 from ..models.poll import Poll
 
+# Items per encoded chunk when streaming an export
+_EXPORT_BATCH_SIZE = 1024
+
+# ProofGraph's list fields in dump order, with adapters to encode slices
+_EXPORT_COLLECTIONS = (
+    ("participants", TypeAdapter(List[ParticipantNode])),
+    ("certifications", TypeAdapter(List[PPECertificationEdge])),
+    ("votes", TypeAdapter(List[VoteRecord])),
+)
+
 
 class ProofGraphService:
     """
@@ -23,6 +35,9 @@ class ProofGraphService:
     def __init__(self):
         # Cache of constructed proof graphs: {poll_id: ProofGraph}
         self._proof_graphs = {}
+        # Serialized graphs that passed verify_hash:
+        # {poll_id: (ProofGraph, graph_hash, JSON body)}
+        self._graph_bodies: Dict[str, Tuple[ProofGraph, Optional[str], bytes]] = {}
     
     def construct_proof_graph(self, poll: Poll) -> ProofGraph:
         """
@@ -140,6 +155,65 @@ class ProofGraphService:
         # Construct new proof graph
         return self.construct_proof_graph(poll)
     
+    def get_verified_json(self, proof_graph: ProofGraph) -> Optional[bytes]:
+        """
+        Serialize a proof graph once its hash has been verified.
+        
+        verify_hash rehashes every item, which costs several times more than
+        the dump itself, so both are done once per graph and hash. The body
+        is a snapshot taken right after verification, so it stays valid
+        even if the graph object is edited later.
+        
+        Args:
+            proof_graph: Proof graph to serialize
+            
+        Returns:
+            JSON body, or None if the hash doesn't verify
+        """
+        poll_id = proof_graph.metadata.poll_id
+        cached = self._graph_bodies.get(poll_id)
+        if cached is not None and cached[0] is proof_graph and cached[1] == proof_graph.graph_hash:
+            return cached[2]
+        
+        if not proof_graph.verify_hash():
+            return None
+        
+        body = orjson.dumps(proof_graph.model_dump())
+        self._graph_bodies[poll_id] = (proof_graph, proof_graph.graph_hash, body)
+        return body
+    
+    def iter_export_json(self, proof_graph: ProofGraph, extra: Dict[str, Any]) -> Iterator[bytes]:
+        """
+        Encode an export of the proof graph as a stream of JSON chunks.
+        
+        The chunks join to the JSON of to_exportable_dict() updated with
+        extra. Items are encoded straight from the models in batches, so
+        the export never exists as one large dict beside its encoding.
+        
+        Args:
+            proof_graph: Proof graph to export
+            extra: Additional top-level members, appended after vote_tally
+            
+        Returns:
+            Iterator of JSON byte chunks
+        """
+        yield b'{"metadata":' + proof_graph.metadata.model_dump_json().encode()
+        
+        for field, adapter in _EXPORT_COLLECTIONS:
+            items = getattr(proof_graph, field)
+            yield f',"{field}":['.encode()
+            for start in range(0, len(items), _EXPORT_BATCH_SIZE):
+                chunk = adapter.dump_json(items[start:start + _EXPORT_BATCH_SIZE])[1:-1]
+                yield b"," + chunk if start else chunk
+            yield b"]"
+        
+        tail = {
+            "graph_hash": proof_graph.graph_hash,
+            "vote_tally": proof_graph.get_vote_tally(),
+            **extra
+        }
+        yield b"," + orjson.dumps(tail)[1:]
+    
     def invalidate_proof_graph(self, poll_id: str):
         """
         Invalidate cached proof graph.
@@ -151,6 +225,7 @@ class ProofGraphService:
         """
         if poll_id in self._proof_graphs:
             del self._proof_graphs[poll_id]
+        self._graph_bodies.pop(poll_id, None)
     
     def create_summary(self, proof_graph: ProofGraph, 
                       verification_result: dict) -> ProofGraphSummary:
@@ -10,6 +10,8 @@ import networkx as nx
 import numpy as np
 from scipy.sparse.linalg import eigsh
 from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import laplacian
+from typing import Optional
 import logging
 import time
 
@@ -26,16 +28,26 @@ class SpectralAnalyzer:
     to expansion properties of the graph.
     """
     
-    def __init__(self, graph: nx.Graph):
+    def __init__(self, graph: nx.Graph, adjacency: Optional[csr_matrix] = None):
         """
         Initialize analyzer with graph.
         
         Args:
             graph: NetworkX graph
+            adjacency: Optional precomputed CSR adjacency matrix (rows in
+                       graph.nodes() order). When given, the Laplacian is
+                       built from it directly instead of through NetworkX.
         """
         self.graph = graph
+        self.adjacency = adjacency
         self.m = graph.number_of_nodes()
     
+    def _laplacian(self) -> csr_matrix:
+        """Get the graph Laplacian as a sparse matrix."""
+        if self.adjacency is not None:
+            return csr_matrix(laplacian(self.adjacency.astype(float)))
+        return nx.laplacian_matrix(self.graph)
+    
     def compute_spectral_gap(
         self,
         threshold: float = 0.1,
@@ -103,7 +115,7 @@ class SpectralAnalyzer:
         Efficient for large graphs.
         """
         # Get Laplacian matrix as sparse matrix
-        L = nx.laplacian_matrix(self.graph)
+        L = self._laplacian()
         
         # Compute smallest 3 eigenvalues
         # λ₀ = 0 always (for connected graph)
@@ -127,7 +139,7 @@ class SpectralAnalyzer:
         Better for small graphs.
         """
         # Get Laplacian matrix as dense numpy array
-        L = nx.laplacian_matrix(self.graph).toarray()
+        L = self._laplacian().toarray()
         
         # Compute all eigenvalues
         eigenvalues = np.linalg.eigvalsh(L)
@@ -154,10 +166,10 @@ class SpectralAnalyzer:
         k = min(k, self.m - 1)
         
         try:
-            L = nx.laplacian_matrix(self.graph)
+            L = self._laplacian()
             eigenvalues = eigsh(L, k=k, which='SM', return_eigenvectors=False)
             return np.sort(eigenvalues)
         except:
-            L = nx.laplacian_matrix(self.graph).toarray()
+            L = self._laplacian().toarray()
             eigenvalues = np.linalg.eigvalsh(L)
             return np.sort(eigenvalues)[:k]
\ No newline at end of file
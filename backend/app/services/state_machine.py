@@ -17,6 +17,8 @@ from enum import Enum
 from typing import Optional, Tuple
 import logging
 from datetime import datetime, timezone
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload
 
 from app.models.user import User, Poll
 from app.models.certification_state import CertificationState
@@ -167,22 +169,21 @@ class StateMachine:
         poll.certification_started_at = datetime.now(timezone.utc)
         
         # Transition all registered users to AWAITING_ASSIGNMENTS
-        users = self.db.query(User).filter_by(poll_id=poll_id).all()
+        users = (
+            self.db.query(User)
+            .filter_by(poll_id=poll_id)
+            .options(selectinload(User.certification_state))
+            .all()
+        )
         
         for user in users:
             # Create certification state if doesn't exist
-            cert_state = self.db.query(CertificationState).filter_by(
-                user_id=user.id,
-                poll_id=poll_id
-            ).first()
-            
-            if not cert_state:
-                cert_state = CertificationState(
+            if not user.certification_state:
+                self.db.add(CertificationState(
                     user_id=user.id,
                     poll_id=poll_id,
                     state=UserState.AWAITING_ASSIGNMENTS
-                )
-                self.db.add(cert_state)
+                ))
         
         self.db.commit()
         
@@ -210,29 +211,30 @@ class StateMachine:
         poll.phase = PollPhase.VOTING
         poll.voting_started_at = datetime.now(timezone.utc)
         
-        # Count certified vs excluded users
-        cert_states = self.db.query(CertificationState).filter_by(
-            poll_id=poll_id
-        ).all()
-        
-        num_certified = 0
-        num_excluded = 0
-        
-        for cert_state in cert_states:
-            if cert_state.is_certified and not cert_state.is_excluded:
-                num_certified += 1
-            else:
-                num_excluded += 1
+        # Count certified vs excluded users in the database
+        num_certified, num_states = self.db.execute(
+            select(
+                func.count().filter(CertificationState.is_eligible),
+                func.count()
+            ).where(CertificationState.poll_id == poll_id)
+        ).one()
+        num_excluded = num_states - num_certified
         
         self.db.commit()
         
         logger.info(f"Transitioned to voting: {num_certified} certified, {num_excluded} excluded")
         return num_certified, num_excluded
     
-    def record_vote(self, user_id: str, poll_id: str) -> bool:
+    def record_vote(self, user_id: str, poll_id: str, commit: bool = True) -> bool:
         """
         Record that user has voted.
         
+        Args:
+            user_id: Voting user
+            poll_id: Poll being voted in
+            commit: Commit immediately. Pass False when the caller owns the
+                    transaction (e.g. to store the vote row in the same commit).
+        
         Returns:
             True if vote recorded, False if user cannot vote
         """
@@ -251,7 +253,8 @@ class StateMachine:
         cert_state.has_voted = True
         cert_state.voted_at = datetime.now(timezone.utc)
         
-        self.db.commit()
+        if commit:
+            self.db.commit()
         
         logger.info(f"User {user_id} voted in poll {poll_id}")
         return True
@@ -21,6 +21,7 @@ from ..utils.graph_analysis import (
     compute_expansion_ratio
 )
 from ..utils.crypto_utils import verify_signature
+from ..utils.cache import TTLCache
 import networkx as nx
 
 
@@ -88,6 +89,9 @@ class VerificationService:
         self.max_clustering_threshold = 0.8
         self.min_expansion_ratio = 0.3
         self.db = db_session
+        # Results keyed by (poll_id, poll version); the TTL bounds staleness
+        # from edits made without bumping the version
+        self._results = TTLCache(maxsize=128, ttl=30)
     
     def verify_poll_comprehensive(self, poll: Poll) -> VerificationResult:
         """
@@ -119,6 +123,27 @@ class VerificationService:
         
         return result
     
+    def get_cached_verification(self, poll: Poll) -> VerificationResult:
+        """
+        verify_poll_comprehensive, reused while the poll's version is unchanged.
+        
+        The verification endpoints each need the full analysis, and clients
+        typically request several of them for the same poll in a row.
+        Callers must not mutate the returned result.
+        
+        Args:
+            poll: Poll to verify
+            
+        Returns:
+            VerificationResult with complete analysis
+        """
+        key = (poll.id, poll.version)
+        result = self._results.get(key)
+        if result is None:
+            result = self.verify_poll_comprehensive(poll)
+            self._results.set(key, result)
+        return result
+    
     def _verify_basic_structure(self, poll: Poll, result: VerificationResult):
         """Verify basic poll structure."""
         # Check participants
@@ -0,0 +1,100 @@
+"""
+Small in-process caching helpers.
+
+Used for rows that are read on nearly every request but change only a
+handful of times per poll lifetime (PPE configs, poll parameters).
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded dict cache whose entries expire after a fixed time-to-live.
+
+    Not shared between worker processes, so writers must invalidate the
+    entries they change and the TTL bounds staleness from other workers.
+    Safe to share between threads (sync handlers run in the threadpool).
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; the oldest is evicted first
+            ttl: Seconds an entry stays valid after being stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The stored value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                # Evict the oldest entry
+                del self._entries[next(iter(self._entries))]
+
+            self._entries[key] = (time.monotonic(), value)
+
+    def pop(self, key: Hashable):
+        """
+        Invalidate a single entry.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Hashable], bool]):
+        """
+        Invalidate every entry whose key matches a predicate.
+
+        Args:
+            predicate: Called with each key; matching entries are removed
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self):
+        """Invalidate all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
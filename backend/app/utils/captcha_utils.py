@@ -9,6 +9,7 @@ import random
 import string
 import hashlib
 import time
+from functools import lru_cache
 from typing import Tuple, Dict, Optional
 from datetime import datetime, timedelta
 
@@ -37,6 +38,20 @@ class CaptchaChallenge:
         return solution_hash == self.solution_hash
 
 
+@lru_cache(maxsize=None)
+def _captcha_alphabet(include_digits: bool, include_uppercase: bool) -> str:
+    """CAPTCHA character set for the given options, without confusing characters."""
+    chars = string.ascii_lowercase
+    if include_uppercase:
+        chars += string.ascii_uppercase
+    if include_digits:
+        chars += string.digits
+    
+    # Avoid confusing characters
+    confusing_chars = 'Il1O0'
+    return ''.join(c for c in chars if c not in confusing_chars)
+
+
 def generate_random_string(length: int = 6, 
                            include_digits: bool = True,
                            include_uppercase: bool = True) -> str:
@@ -51,17 +66,60 @@ def generate_random_string(length: int = 6,
     Returns:
         Random string
     """
-    chars = string.ascii_lowercase
-    if include_uppercase:
-        chars += string.ascii_uppercase
-    if include_digits:
-        chars += string.digits
+    chars = _captcha_alphabet(include_digits, include_uppercase)
+    return ''.join(random.choice(chars) for _ in range(length))
+
+
+@lru_cache(maxsize=None)
+def _keystream_tables(include_digits: bool, include_uppercase: bool) -> Tuple[bytes, bytes]:
+    """
+    bytes.translate() tables mapping keystream bytes onto the alphabet.
     
-    # Avoid confusing characters
-    confusing_chars = 'Il1O0'
-    chars = ''.join(c for c in chars if c not in confusing_chars)
+    Each byte is masked to the alphabet size rounded up to a power of two;
+    masked values past the end of the alphabet are rejected (deleted)
+    rather than wrapped, so every character stays equally likely.
     
-    return ''.join(random.choice(chars) for _ in range(length))
+    Returns:
+        Tuple of (translation table, bytes to delete)
+    """
+    chars = _captcha_alphabet(include_digits, include_uppercase).encode('ascii')
+    mask = (1 << (len(chars) - 1).bit_length()) - 1
+    
+    table = bytes(chars[b & mask] if (b & mask) < len(chars) else 0 for b in range(256))
+    rejected = bytes(b for b in range(256) if (b & mask) >= len(chars))
+    return table, rejected
+
+
+def derive_random_string(seed: bytes,
+                         length: int = 6,
+                         include_digits: bool = True,
+                         include_uppercase: bool = True) -> str:
+    """
+    Derive a CAPTCHA string deterministically from a seed.
+    
+    Characters are drawn from a SHAKE-128 keystream of the seed, so the
+    same seed always yields the same string without touching the shared
+    state of the random module.
+    
+    Args:
+        seed: Seed bytes
+        length: Length of string to generate
+        include_digits: Include numbers in the string
+        include_uppercase: Include uppercase letters
+        
+    Returns:
+        Derived string
+    """
+    table, rejected = _keystream_tables(include_digits, include_uppercase)
+    
+    # At most half the bytes are rejected, so this rarely needs a second pass;
+    # a longer SHAKE output starts with the shorter one, keeping it deterministic
+    size = 2 * length + 16
+    while True:
+        picked = hashlib.shake_128(seed).digest(size).translate(table, rejected)
+        if len(picked) >= length:
+            return picked[:length].decode('ascii')
+        size *= 2
 
 
 def generate_text_captcha(difficulty: str = "medium") -> Tuple[str, str]:
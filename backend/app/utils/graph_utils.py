@@ -7,7 +7,9 @@ This ensures good expansion properties which are critical for Sybil resistance.
 
 import random
 import hashlib
-from typing import List, Dict, Set, Tuple
+from functools import reduce
+from operator import xor
+from typing import Collection, List, Dict, Set, Tuple
 import networkx as nx
 
 
@@ -28,6 +30,23 @@ def generate_seed_from_poll_id(poll_id: str, salt: str = "") -> int:
     return int.from_bytes(hash_digest[:8], byteorder='big')
 
 
+def participant_fingerprint(participant_ids: Collection[str]) -> Tuple[int, int]:
+    """
+    Fingerprint a set of participants, independent of their order.
+    
+    The XOR of the IDs' hashes can be updated in O(1) as participants
+    join or leave (see Poll.participant_fingerprint). Hashes are only
+    stable within a process, so fingerprints must not be persisted.
+    
+    Args:
+        participant_ids: Distinct participant user IDs
+        
+    Returns:
+        Tuple of (participant count, XOR of hash(user_id))
+    """
+    return len(participant_ids), reduce(xor, map(hash, participant_ids), 0)
+
+
 def generate_random_regular_graph(n: int, k: int, seed: int) -> Dict[int, Set[int]]:
     """
     Generate a random k-regular graph (or near-regular if not possible).
@@ -241,6 +260,33 @@ def get_user_neighbors(graph: Dict[str, Set[str]], user_id: str) -> Set[str]:
     return graph.get(user_id, set())
 
 
+def graph_to_csr(graph: Dict[str, Set[str]]) -> Dict[str, List]:
+    """
+    Convert an adjacency list to compressed sparse row (CSR) form.
+    
+    Node i's neighbors are neighbors[offsets[i]:offsets[i + 1]], as indices
+    into nodes. Three flat lists encode far faster (and smaller) than one
+    string-keyed list per node.
+    
+    Args:
+        graph: Adjacency list representation
+        
+    Returns:
+        Dictionary with sorted "nodes", "offsets" (len(nodes) + 1) and
+        "neighbors" (sorted per node)
+    """
+    nodes = sorted(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    offsets = [0]
+    neighbors = []
+    
+    for node in nodes:
+        neighbors.extend(sorted(index[neighbor] for neighbor in graph[node]))
+        offsets.append(len(neighbors))
+    
+    return {"nodes": nodes, "offsets": offsets, "neighbors": neighbors}
+
+
 def calculate_graph_metrics(graph: Dict[str, Set[str]]) -> Dict[str, any]:
     """
     Calculate detailed metrics about the graph structure.
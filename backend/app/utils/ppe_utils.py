@@ -53,8 +53,8 @@ def generate_challenge_with_secret(secret: str, session_id: str,
         ppe_type_enum = PPEType.SYMMETRIC_CAPTCHA
         difficulty_enum = PPEDifficulty.MEDIUM
     
-    # Create PPE instance
-    ppe = ppe_factory.create(ppe_type_enum, difficulty_enum)
+    # Shared PPE instance
+    ppe = ppe_factory.get_shared(ppe_type_enum, difficulty_enum)
     
     # Generate challenge
     return ppe.generate_challenge_with_secret(secret, session_id)
@@ -80,7 +80,7 @@ def verify_challenge_generation(secret: str, session_id: str, challenge_text: st
     except ValueError:
         ppe_type_enum = PPEType.SYMMETRIC_CAPTCHA
     
-    ppe = ppe_factory.create(ppe_type_enum)
+    ppe = ppe_factory.get_shared(ppe_type_enum)
     return ppe.verify_challenge_generation(secret, session_id, challenge_text, expected_solution)
 
 
@@ -162,7 +162,7 @@ def verify_solution_correctness(challenge_text: str, solution: str,
     except ValueError:
         ppe_type_enum = PPEType.SYMMETRIC_CAPTCHA
     
-    ppe = ppe_factory.create(ppe_type_enum)
+    ppe = ppe_factory.get_shared(ppe_type_enum)
     return ppe.verify_solution(challenge_text, solution)
 
 
@@ -0,0 +1,63 @@
+"""
+CORS middleware with a fast path for preflight requests.
+
+With an allow-all-origins/allow-all-headers policy the preflight answer
+only depends on the request's Origin and requested headers, so the rest
+of the response can be encoded once instead of per request.
+"""
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class PreflightCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that answers allowed preflights from prebuilt headers.
+
+    Takes the same options as CORSMiddleware and responds identically.
+    Only preflights that allow-all-origins/headers would accept take the
+    fast path; everything else goes through CORSMiddleware unchanged.
+    """
+
+    def __init__(self, app: ASGIApp, **options):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Inner ASGI app
+            **options: CORSMiddleware options
+        """
+        super().__init__(app, **options)
+        self._fast_preflight = self.allow_all_origins and self.allow_all_headers
+        self._allowed_methods = {method.encode("latin-1") for method in self.allow_methods}
+        self._preflight_raw_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in self.preflight_headers.items()
+        ] + [
+            (b"content-length", b"2"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._fast_preflight and scope["type"] == "http" and scope["method"] == "OPTIONS":
+            request_headers = dict(scope["headers"])
+            origin = request_headers.get(b"origin")
+
+            if (
+                origin is not None
+                and request_headers.get(b"access-control-request-method") in self._allowed_methods
+                and b"access-control-request-private-network" not in request_headers
+            ):
+                headers = list(self._preflight_raw_headers)
+                if self.preflight_explicit_allow_origin:
+                    # With credentials the origin is echoed rather than "*"
+                    headers.append((b"access-control-allow-origin", origin))
+                requested_headers = request_headers.get(b"access-control-request-headers")
+                if requested_headers is not None:
+                    headers.append((b"access-control-allow-headers", requested_headers))
+
+                await send({"type": "http.response.start", "status": 200, "headers": headers})
+                await send({"type": "http.response.body", "body": b"OK"})
+                return
+
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,83 @@
+"""
+JSON response helpers that serialize with pydantic-core.
+
+Returning a model from a route makes FastAPI re-validate it against the
+response_model and walk it through jsonable_encoder before rendering.
+For models we built ourselves that work is redundant, so these helpers
+dump straight to JSON bytes. Anything that isn't already an instance of
+the response model (e.g. a plain dict) is validated first, as FastAPI
+would.
+"""
+
+from typing import Any, List, Optional, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+
+def model_response(value: Any, model_type: Type[BaseModel], status_code: int = 200) -> Response:
+    """
+    Render a value as a JSON response of the given model type.
+
+    Args:
+        value: Model instance (or data to validate into one)
+        model_type: Response model class
+        status_code: HTTP status code
+
+    Returns:
+        JSON Response (field aliases are used, as FastAPI does)
+    """
+    if not isinstance(value, model_type):
+        value = model_type.model_validate(value)
+
+    return Response(
+        content=value.model_dump_json(by_alias=True, warnings=False),
+        media_type="application/json",
+        status_code=status_code
+    )
+
+
+def models_response(
+    values: List[Any],
+    model_type: Type[BaseModel],
+    adapter: TypeAdapter,
+    status_code: int = 200
+) -> Response:
+    """
+    Render a list as a JSON array response of the given model type.
+
+    Args:
+        values: Model instances (or data to validate into them)
+        model_type: Response model class of each item
+        adapter: Module-level TypeAdapter for List[model_type]
+        status_code: HTTP status code
+
+    Returns:
+        JSON Response
+    """
+    if not all(isinstance(value, model_type) for value in values):
+        values = adapter.validate_python(values)
+
+    return Response(
+        content=adapter.dump_json(values, by_alias=True, warnings=False),
+        media_type="application/json",
+        status_code=status_code
+    )
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Request's If-None-Match header, if any
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's copy is current (respond 304)
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip() == etag for tag in if_none_match.split(","))
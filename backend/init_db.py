@@ -3,16 +3,95 @@ Database initialization script.
 Creates all tables for the PPE polling application.
 """
 
+import json
+
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects.postgresql import JSONB
+
 from app.database import Base, engine
 from app.models.user import User, Poll, Vote
 from app.models.certification_state import CertificationState
-from app.models.ppe_types import PPEConfig, PPEExecution
+from app.models.ppe_types import PPEConfig, PPEExecution, ppe_types_to_mask
+
+
+# Columns that used to hold JSON strings in TEXT (now JSONB on PostgreSQL)
+_JSONB_COLUMNS = [("users", "public_key"), ("polls", "options")]
+
+
+def convert_json_columns():
+    """Convert legacy TEXT JSON columns to JSONB in place (PostgreSQL only)."""
+    if engine.dialect.name != "postgresql":
+        return
+    
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table, column in _JSONB_COLUMNS:
+            if not inspector.has_table(table):
+                continue
+            column_type = next(c["type"] for c in inspector.get_columns(table) if c["name"] == column)
+            if not isinstance(column_type, JSONB):
+                conn.execute(text(
+                    f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb"
+                ))
+
+
+def migrate_ppe_config_masks():
+    """Move PPE configs' allowed certification types from a JSON list to a bitmask."""
+    inspector = inspect(engine)
+    if not inspector.has_table("ppe_configs"):
+        return
+    columns = {c["name"] for c in inspector.get_columns("ppe_configs")}
+    if "allowed_certification_mask" in columns:
+        return
+    
+    with engine.begin() as conn:
+        conn.execute(text(
+            "ALTER TABLE ppe_configs "
+            "ADD COLUMN allowed_certification_mask BIGINT NOT NULL DEFAULT 0"
+        ))
+        if "allowed_certification_types" not in columns:
+            return
+        
+        masks = []
+        for poll_id, allowed in conn.execute(
+            text("SELECT poll_id, allowed_certification_types FROM ppe_configs")
+        ):
+            # Drivers without native JSON return the raw text
+            if isinstance(allowed, str):
+                allowed = json.loads(allowed)
+            masks.append({"poll_id": poll_id, "mask": ppe_types_to_mask(allowed or ())})
+        if masks:
+            conn.execute(
+                text("UPDATE ppe_configs SET allowed_certification_mask = :mask WHERE poll_id = :poll_id"),
+                masks
+            )
+
+
+# Indexes superseded by composite indexes
+_OBSOLETE_INDEXES = ["ix_ppe_executions_poll_id"]
+
+
+def drop_obsolete_indexes():
+    """Drop indexes that newer composite indexes make redundant."""
+    with engine.begin() as conn:
+        for index_name in _OBSOLETE_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
 
 
 def create_all_tables():
     """Create all database tables."""
     print("Creating database tables...")
+    convert_json_columns()
+    migrate_ppe_config_masks()
     Base.metadata.create_all(bind=engine)
+    
+    # create_all skips tables that already exist, so add any indexes
+    # introduced since those tables were created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    drop_obsolete_indexes()
+    
     print("Tables created successfully!")
 
 
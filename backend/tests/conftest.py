@@ -1,5 +1,9 @@
 import warnings
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
 
 def pytest_configure(config):
     """
@@ -12,4 +16,15 @@ def pytest_configure(config):
     warnings.filterwarnings("ignore", category=RuntimeWarning, message="coroutine.*never awaited")
     
     # Filter out UserWarnings from Pydantic serializer
-    warnings.filterwarnings("ignore", message="Pydantic serializer warnings")
\ No newline at end of file
+    warnings.filterwarnings("ignore", message="Pydantic serializer warnings")
+
+
+@pytest.fixture
+def test_db():
+    """Create in-memory SQLite database for testing."""
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
@@ -0,0 +1,67 @@
+"""
+Tests for the in-process TTL cache.
+"""
+
+from app.utils import cache as cache_module
+from app.utils.cache import TTLCache
+
+
+def test_get_returns_stored_value():
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("poll_1", {"m": 10})
+
+    assert cache.get("poll_1") == {"m": 10}
+    assert cache.get("missing") is None
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("poll_1", {"m": 10})
+
+    now[0] += 59
+    assert cache.get("poll_1") == {"m": 10}
+
+    now[0] += 2
+    assert cache.get("poll_1") is None
+    assert len(cache) == 0
+
+
+def test_oldest_entry_evicted_when_full():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_pop_and_clear_invalidate():
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.pop("a")
+    cache.pop("never_set")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_pop_where_invalidates_matching_keys():
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set(("poll_1", None), 1)
+    cache.set(("poll_1", 5), 2)
+    cache.set(("poll_2", None), 3)
+
+    cache.pop_where(lambda key: key[0] == "poll_1")
+
+    assert cache.get(("poll_1", None)) is None
+    assert cache.get(("poll_1", 5)) is None
+    assert cache.get(("poll_2", None)) == 3
@@ -7,6 +7,7 @@ import time
 from datetime import datetime, timedelta
 from app.utils.captcha_utils import (
     generate_random_string,
+    derive_random_string,
     generate_text_captcha,
     generate_challenge_id,
     create_registration_challenge,
@@ -38,6 +39,20 @@ def test_generate_random_string_options():
     assert not any(c.isdigit() for c in s)
 
 
+def test_derive_random_string():
+    """Test seeded string derivation."""
+    s = derive_random_string(b"seed", length=32)
+    assert len(s) == 32
+    assert s == derive_random_string(b"seed", length=32)
+    assert s != derive_random_string(b"other seed", length=32)
+    assert all(c not in 'Il1O0' for c in s)
+    
+    # Lowercase-only alphabet has 25 characters, so some bytes are rejected
+    s = derive_random_string(b"seed", length=200, include_digits=False, include_uppercase=False)
+    assert len(s) == 200
+    assert s.isalpha() and s.islower()
+
+
 def test_generate_text_captcha():
     """Test CAPTCHA generation."""
     challenge_text, solution = generate_text_captcha("easy")
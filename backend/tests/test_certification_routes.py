@@ -0,0 +1,115 @@
+"""
+Route tests for the certification API endpoints.
+"""
+
+import json
+import pytest
+from types import SimpleNamespace
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api import certification_endpoints
+from app.database import Base, get_async_db
+from app.models import User
+from app.models.certification_state import CertificationState
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Serve the certification router against an in-memory SQLite database."""
+    # One shared connection, so every session sees the same in-memory tables
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def get_test_db():
+        async with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(certification_endpoints.router)
+    app.dependency_overrides[get_async_db] = get_test_db
+    monkeypatch.setattr(certification_endpoints, "AsyncSessionLocal", session_factory)
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    with TestClient(app) as client:
+        # Run database calls on the client's event loop, which the app uses too
+        def add(*rows):
+            async def insert():
+                async with session_factory() as db:
+                    db.add_all(rows)
+                    await db.commit()
+            client.portal.call(insert)
+
+        client.portal.call(create_tables)
+        yield SimpleNamespace(client=client, add=add)
+        client.portal.call(engine.dispose)
+
+
+def test_get_certification_graph(api):
+    """The graph lists the poll's registered users as nodes."""
+    api.add(
+        User(id="user_0", poll_id="poll_1", registration_order=0),
+        User(id="user_1", poll_id="poll_1", registration_order=1),
+        User(id="other", poll_id="poll_2", registration_order=0)
+    )
+
+    response = api.client.get("/api/polls/poll_1/certification/graph")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    graph = response.json()
+    assert graph["poll_id"] == "poll_1"
+    assert sorted(graph["nodes"]) == ["user_0", "user_1"]
+    assert graph["total_nodes"] == 2
+    assert graph["edges"] == {}
+    assert graph["total_edges"] == 0
+
+
+def test_get_certification_graph_empty_poll(api):
+    """A poll with no participants has an empty graph."""
+    response = api.client.get("/api/polls/empty/certification/graph")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "poll_id": "empty",
+        "nodes": [],
+        "edges": {},
+        "total_edges": 0,
+        "total_nodes": 0
+    }
+
+
+def test_stream_participants(api):
+    """Participants are streamed as one JSON object per line."""
+    api.add(
+        User(id="user_0", poll_id="poll_1", registration_order=0),
+        User(id="user_1", poll_id="poll_1", registration_order=1),
+        CertificationState(user_id="user_0", poll_id="poll_1", required_ppes=4, completed_ppes=1)
+    )
+
+    response = api.client.get("/api/polls/poll_1/certification/participants")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    participants = {
+        participant["user_id"]: participant
+        for participant in map(json.loads, response.text.splitlines())
+    }
+    assert set(participants) == {"user_0", "user_1"}
+    assert participants["user_0"]["certification"]["completion_percentage"] == 25.0
+    assert participants["user_1"]["certification"] is None
+
+
+def test_stream_participants_empty_poll(api):
+    """A poll with no participants streams an empty body."""
+    response = api.client.get("/api/polls/empty/certification/participants")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text == ""
@@ -0,0 +1,241 @@
+"""
+Tests for the single-statement certification state updates.
+"""
+
+import json
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import undefer_group
+
+from app.database import Base
+from app.models import (
+    User,
+    get_certification_graph,
+    get_certification_graph_async,
+    get_certification_graph_json,
+    get_poll_participants,
+    stream_poll_participants_async
+)
+from app.models.certification_state import CertificationState
+from app.schemas.certification import dump_certification_states
+
+
+@pytest.fixture
+def cert_state(test_db):
+    state = CertificationState(
+        user_id="user_1",
+        poll_id="poll_1",
+        state="in_progress",
+        required_ppes=2,
+        max_allowed_failures=1,
+        assigned_ppe_partners=["user_2", "user_3"],
+        completed_ppe_ids=[],
+        failed_ppe_ids=[],
+        collected_signatures={}
+    )
+    test_db.add(state)
+    test_db.commit()
+    return state
+
+
+def test_completed_ppe_update_appends_and_certifies(test_db, cert_state):
+    """Completions are appended in SQL and certify once enough are done."""
+    row = test_db.execute(
+        CertificationState.completed_ppe_update("user_1", "poll_1", "ppe_a", "user_2", "sig_a")
+    ).scalar_one()
+    assert row.completed_ppes == 1
+    assert row.is_certified is False
+
+    row = test_db.execute(
+        CertificationState.completed_ppe_update("user_1", "poll_1", "ppe_b", "user_3", "sig_b")
+    ).scalar_one()
+    test_db.commit()
+
+    assert row.completed_ppes == 2
+    assert row.completed_ppe_ids == ["ppe_a", "ppe_b"]
+    assert row.collected_signatures == {"user_2": "sig_a", "user_3": "sig_b"}
+    assert row.is_certified is True
+    assert row.certified_at is not None
+
+
+def test_completed_ppe_update_is_idempotent(test_db, cert_state):
+    """Recording the same PPE twice returns no row and changes nothing."""
+    statement = CertificationState.completed_ppe_update("user_1", "poll_1", "ppe_a", "user_2", "sig")
+    assert test_db.execute(statement).scalar_one_or_none() is not None
+    assert test_db.execute(statement).scalar_one_or_none() is None
+    test_db.commit()
+
+    test_db.expire_all()
+    assert test_db.get(CertificationState, ("user_1", "poll_1")).completed_ppes == 1
+
+
+def test_completed_ppe_update_missing_state(test_db):
+    """No row is returned when the user has no certification state."""
+    statement = CertificationState.completed_ppe_update("nobody", "poll_1", "ppe_a", "user_2", "sig")
+    assert test_db.execute(statement).scalar_one_or_none() is None
+
+
+def test_failed_ppe_update_excludes_after_too_many_failures(test_db, cert_state):
+    """Failures beyond max_allowed_failures exclude the user, like add_failed_ppe."""
+    test_db.execute(CertificationState.failed_ppe_update("user_1", "poll_1", "ppe_a"))
+    row = test_db.execute(
+        CertificationState.failed_ppe_update("user_1", "poll_1", "ppe_b")
+    ).scalar_one()
+    test_db.commit()
+
+    assert row.failed_ppes == 2
+    assert row.failed_ppe_ids == ["ppe_a", "ppe_b"]
+    assert row.is_excluded is True
+    assert row.is_certified is False
+    assert row.exclusion_reason == "Failed 2/2 PPEs (max allowed: 1)"
+
+
+def test_ppe_history_is_not_loaded_with_state(test_db, cert_state):
+    """The per-PPE JSON history loads on first access, not with the row."""
+    test_db.expunge_all()
+
+    state = test_db.execute(select(CertificationState)).scalar_one()
+    assert "completed_ppe_ids" not in state.__dict__
+    assert "collected_signatures" not in state.__dict__
+
+    state.add_completed_ppe("ppe_a", "user_2", "sig_a")
+    test_db.commit()
+    test_db.expunge_all()
+
+    state = test_db.execute(
+        select(CertificationState).options(undefer_group("ppe_history"))
+    ).scalar_one()
+    assert state.__dict__["completed_ppe_ids"] == ["ppe_a"]
+    assert state.__dict__["collected_signatures"] == {"user_2": "sig_a"}
+
+
+def test_is_eligible_filters_in_sql(test_db, cert_state):
+    """Only certified, non-excluded states are eligible, in SQL and in Python."""
+    test_db.add_all([
+        CertificationState(user_id="user_2", poll_id="poll_1", is_certified=True),
+        CertificationState(user_id="user_3", poll_id="poll_1", is_certified=True, is_excluded=True),
+    ])
+    test_db.commit()
+
+    eligible = test_db.execute(
+        select(CertificationState.user_id).where(CertificationState.is_eligible)
+    ).scalars().all()
+
+    assert eligible == ["user_2"]
+    assert [s.user_id for s in test_db.query(CertificationState) if s.is_eligible] == eligible
+
+
+def test_get_poll_participants_includes_certification(test_db, cert_state):
+    """Participants come back with their certification summary, or None."""
+    test_db.add(User(id="user_1", poll_id="poll_1", registration_order=0))
+    test_db.add(User(id="user_2", poll_id="poll_1", registration_order=1))
+    test_db.commit()
+
+    participants = {p["user_id"]: p for p in get_poll_participants(test_db, "poll_1")}
+
+    assert participants["user_2"]["certification"] is None
+    certification = participants["user_1"]["certification"]
+    assert certification["required_ppes"] == 2
+    assert certification["completion_percentage"] == 0.0
+    assert certification["last_updated"] is not None
+
+
+def test_progress_properties_filter_in_sql(test_db, cert_state):
+    """The progress hybrids evaluate in SQL the same as on instances."""
+    test_db.add(CertificationState(
+        user_id="user_2", poll_id="poll_1", required_ppes=4,
+        completed_ppes=3, failed_ppes=2, max_allowed_failures=1
+    ))
+    test_db.commit()
+
+    halfway = test_db.execute(
+        select(CertificationState.user_id, CertificationState.remaining_ppes)
+        .where(CertificationState.completion_percentage >= 50)
+    ).all()
+    assert halfway == [("user_2", 1)]
+
+    certifiable = test_db.execute(
+        select(CertificationState.user_id).where(CertificationState.can_still_certify)
+    ).scalars().all()
+    assert certifiable == ["user_1"]
+
+
+def test_get_certification_graph_counts_only(test_db):
+    """Without nodes, the graph metadata comes from a count query."""
+    for i in range(3):
+        test_db.add(User(id=f"user_{i}", poll_id="poll_1", registration_order=i))
+    test_db.commit()
+
+    full = get_certification_graph(test_db, "poll_1")
+    counts = get_certification_graph(test_db, "poll_1", include_nodes=False)
+
+    assert full["nodes"] == ("user_0", "user_1", "user_2")
+    assert counts["nodes"] == ()
+    assert counts["total_nodes"] == full["total_nodes"] == 3
+
+
+def test_get_poll_participants_cached_until_commit(test_db, cert_state):
+    """Participant lists are reused until a commit touches the poll."""
+    test_db.add(User(id="user_1", poll_id="poll_1", registration_order=0))
+    test_db.commit()
+
+    first = get_poll_participants(test_db, "poll_1")
+    assert get_poll_participants(test_db, "poll_1") is first
+
+    cert_state.completed_ppes = 1
+    test_db.flush()
+    # Flushed but uncommitted changes don't invalidate yet
+    assert get_poll_participants(test_db, "poll_1") is first
+
+    test_db.commit()
+    refreshed = get_poll_participants(test_db, "poll_1")
+    assert refreshed is not first
+    assert refreshed[0]["certification"]["completed_ppes"] == 1
+
+
+def test_get_certification_graph_json_matches_dict(test_db):
+    """The SQL-built graph JSON carries the same data as get_certification_graph."""
+    for i in range(3):
+        test_db.add(User(id=f"user_{i}", poll_id="poll_1", registration_order=i))
+    test_db.commit()
+
+    graph = json.loads(get_certification_graph_json(test_db, "poll_1"))
+    expected = get_certification_graph(test_db, "poll_1")
+
+    assert graph == dict(expected, nodes=list(expected["nodes"]))
+    assert json.loads(get_certification_graph_json(test_db, "missing"))["nodes"] == []
+
+
+def test_dump_certification_states_matches_to_dict(test_db, cert_state):
+    """Bulk serialization produces the same data as to_dict()."""
+    test_db.refresh(cert_state)
+
+    dumped = dump_certification_states([cert_state])
+
+    assert dumped == [cert_state.to_dict()]
+
+
+async def test_async_participant_helpers():
+    """The AsyncSession variants return the same data as the sync helpers."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        db.add(User(id="user_1", poll_id="poll_1", registration_order=0))
+        db.add(CertificationState(user_id="user_1", poll_id="poll_1", required_ppes=4, completed_ppes=1))
+        await db.commit()
+
+        streamed = [p async for p in stream_poll_participants_async(db, "poll_1")]
+        graph = await get_certification_graph_async(db, "poll_1")
+        counts = await get_certification_graph_async(db, "poll_1", include_nodes=False)
+
+    await engine.dispose()
+
+    assert len(streamed) == 1
+    assert streamed[0]["certification"]["completion_percentage"] == 25.0
+    assert graph["nodes"] == ("user_1",)
+    assert graph["total_nodes"] == 1
+    assert counts["nodes"] == ()
+    assert counts["total_nodes"] == 1
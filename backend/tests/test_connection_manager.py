@@ -149,6 +149,15 @@ def test_disconnect_from_nonexistent_poll(connection_manager):
     connection_manager.disconnect("nonexistent-poll", "user1")
     # No assertion needed - we're just checking it doesn't raise an exception
 
+def test_get_connection(connection_manager):
+    """Test looking up a user's socket in a poll"""
+    websocket = AsyncMock()
+    connection_manager.active_connections["test-poll-id"] = {"user1": websocket}
+    
+    assert connection_manager.get_connection("test-poll-id", "user1") is websocket
+    assert connection_manager.get_connection("test-poll-id", "user2") is None
+    assert connection_manager.get_connection("nonexistent-poll", "user1") is None
+
 @pytest.mark.asyncio
 async def test_broadcast_to_poll(connection_manager):
     """Test broadcasting a message to a poll"""
@@ -172,6 +181,20 @@ async def test_broadcast_to_poll(connection_manager):
     websocket1.send_text.assert_called_once_with(message)
     websocket2.send_text.assert_called_once_with(message)
 
+@pytest.mark.asyncio
+async def test_broadcast_to_poll_survives_failed_connection(connection_manager):
+    """A connection that fails mid-broadcast doesn't stop the others"""
+    poll_id = "test-poll-id"
+    
+    broken = AsyncMock()
+    broken.send_text.side_effect = RuntimeError("socket closed")
+    healthy = AsyncMock()
+    connection_manager.active_connections[poll_id] = {"user1": broken, "user2": healthy}
+    
+    await connection_manager.broadcast_to_poll("update", poll_id)
+    
+    healthy.send_text.assert_called_once_with("update")
+
 @pytest.mark.asyncio
 async def test_broadcast_to_nonexistent_poll(connection_manager):
     """Test broadcasting to a poll that doesn't exist"""
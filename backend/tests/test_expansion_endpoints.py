@@ -0,0 +1,147 @@
+"""
+Tests for expansion endpoint helpers.
+"""
+
+import pytest
+from types import SimpleNamespace
+from fastapi import HTTPException
+
+from app.models.user import User
+from app.models.certification_state import CertificationState
+from app.api.expansion_endpoints import get_poll_graph, _get_metrics, get_expansion_bundle
+from app.services.graph_expansion_service import expansion_service
+
+
+def test_get_poll_graph_builds_nodes_and_edges(test_db):
+    """Nodes come from registered users, edges from collected signatures."""
+    for i in range(4):
+        test_db.add(User(id=f"user_{i}", poll_id="poll_1", registration_order=i))
+    test_db.add(User(id="other", poll_id="poll_2", registration_order=0))
+
+    test_db.add(CertificationState(
+        user_id="user_0", poll_id="poll_1",
+        collected_signatures={"user_1": "sig", "user_2": "sig"}
+    ))
+    test_db.add(CertificationState(
+        user_id="user_1", poll_id="poll_1",
+        collected_signatures={"user_0": "sig", "other": "sig"}
+    ))
+    test_db.commit()
+
+    graph = get_poll_graph(test_db, "poll_1")
+
+    assert set(graph.nodes()) == {"user_0", "user_1", "user_2", "user_3"}
+    assert graph.number_of_edges() == 2
+    assert graph.has_edge("user_0", "user_1")
+    assert graph.has_edge("user_0", "user_2")
+    assert graph.nodes["user_3"] == {"honest": True, "deleted": False}
+
+
+def test_get_poll_graph_unknown_poll(test_db):
+    """A poll with no participants is a 404."""
+    with pytest.raises(HTTPException) as exc_info:
+        get_poll_graph(test_db, "missing")
+
+    assert exc_info.value.status_code == 404
+
+
+def test_get_poll_graph_reused_until_graph_changes(test_db):
+    """The built graph is reused while the poll's signature is unchanged."""
+    for i in range(3):
+        test_db.add(User(id=f"user_{i}", poll_id="poll_sig", registration_order=i))
+    test_db.commit()
+
+    first = get_poll_graph(test_db, "poll_sig")
+    assert get_poll_graph(test_db, "poll_sig") is first
+
+    test_db.add(CertificationState(
+        user_id="user_0", poll_id="poll_sig", completed_ppes=1,
+        collected_signatures={"user_1": "sig"}
+    ))
+    test_db.commit()
+
+    rebuilt = get_poll_graph(test_db, "poll_sig")
+    assert rebuilt is not first
+    assert rebuilt.has_edge("user_0", "user_1")
+
+
+def test_get_metrics_is_cached_until_invalidated(test_db, monkeypatch):
+    """Metrics are computed once per poll until the graph changes."""
+    for i in range(3):
+        test_db.add(User(id=f"user_{i}", poll_id="poll_cache", registration_order=i))
+    test_db.commit()
+
+    calls = []
+
+    def fake_compute(graph, poll_id, attack_edges=None, adjacency=None):
+        calls.append(poll_id)
+        return object()
+
+    monkeypatch.setattr(expansion_service, "compute_all_metrics", fake_compute)
+    expansion_service.invalidate_metrics("poll_cache")
+
+    first = _get_metrics(test_db, "poll_cache")
+    second = _get_metrics(test_db, "poll_cache")
+    assert first is second
+    assert len(calls) == 1
+
+    _get_metrics(test_db, "poll_cache", recalculate=True)
+    assert len(calls) == 2
+
+    expansion_service.invalidate_metrics("poll_cache")
+    _get_metrics(test_db, "poll_cache")
+    assert len(calls) == 3
+
+
+def test_expansion_bundle_uses_one_metrics_computation(test_db, monkeypatch):
+    """The bundle endpoint returns every result from a single computation."""
+    for i in range(3):
+        test_db.add(User(id=f"user_{i}", poll_id="poll_bundle", registration_order=i))
+    test_db.commit()
+
+    calls = []
+
+    def fake_compute(graph, poll_id, attack_edges=None, adjacency=None):
+        calls.append(poll_id)
+        return SimpleNamespace(
+            vertex_expansion="vertex", edge_expansion="edge", spectral_gap="spectral",
+            is_lse=True, lse_parameters="lse", sybil_bound="bound",
+            verification_passed=True
+        )
+
+    monkeypatch.setattr(expansion_service, "compute_all_metrics", fake_compute)
+    expansion_service.invalidate_metrics("poll_bundle")
+
+    bundle = get_expansion_bundle("poll_bundle", db=test_db)
+
+    assert len(calls) == 1
+    assert bundle["vertex_expansion"] == "vertex"
+    assert bundle["spectral_gap"] == "spectral"
+    assert bundle["sybil_bound"] == "bound"
+    assert bundle["verification_passed"] is True
+
+
+def test_metrics_recomputed_when_graph_changes(test_db, monkeypatch):
+    """Cached metrics are keyed on the graph signature, not just the poll."""
+    for i in range(3):
+        test_db.add(User(id=f"user_{i}", poll_id="poll_stale", registration_order=i))
+    test_db.commit()
+
+    calls = []
+
+    def fake_compute(graph, poll_id, attack_edges=None, adjacency=None):
+        calls.append(graph.number_of_nodes())
+        return object()
+
+    monkeypatch.setattr(expansion_service, "compute_all_metrics", fake_compute)
+    expansion_service.invalidate_metrics("poll_stale")
+
+    first = _get_metrics(test_db, "poll_stale")
+    assert _get_metrics(test_db, "poll_stale") is first
+
+    # A new registration, with no invalidate_metrics call
+    test_db.add(User(id="user_3", poll_id="poll_stale", registration_order=3))
+    test_db.commit()
+
+    assert _get_metrics(test_db, "poll_stale") is not first
+    assert calls == [3, 4]
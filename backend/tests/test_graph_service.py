@@ -29,6 +29,32 @@ def test_get_or_generate_graph(graph_service):
     assert graph1 is graph2
 
 
+def test_poll_fingerprint_reuses_graph_until_participants_change(graph_service):
+    """A poll's O(1) fingerprint matches the computed one and keys the cache."""
+    from app.models.poll import Poll
+    
+    poll = Poll(
+        question="Q?", options=["A", "B"],
+        registrants={f"user{i}": {} for i in range(4)}
+    )
+    graph1 = graph_service.get_or_generate_graph(
+        poll.id, poll.registrants, fingerprint=poll.participant_fingerprint
+    )
+    
+    # Same participants in another order hit the same entry
+    assert graph_service.get_or_generate_graph(poll.id, ["user3", "user2", "user1", "user0"]) is graph1
+    
+    assert poll.add_registrant("user4", {})
+    assert not poll.add_registrant("user4", {})
+    graph2 = graph_service.get_or_generate_graph(
+        poll.id, poll.registrants, fingerprint=poll.participant_fingerprint
+    )
+    
+    assert graph2 is not graph1
+    assert set(graph2) == set(poll.registrants)
+    assert graph_service.get_or_generate_graph(poll.id, list(poll.registrants)) is graph2
+
+
 def test_get_user_neighbors(graph_service):
     """Test retrieving user neighbors."""
     poll_id = "test-poll-2"
@@ -84,4 +110,20 @@ def test_get_graph_metrics(graph_service):
     
     assert "num_nodes" in metrics
     assert "num_edges" in metrics
-    assert "density" in metrics
\ No newline at end of file
+    assert "density" in metrics
+
+
+def test_graph_metrics_cached_until_graph_changes(graph_service):
+    """Metrics are computed once per generated graph."""
+    poll_id = "test-poll-6"
+    participants = ["user1", "user2", "user3", "user4"]
+    
+    graph_service.get_or_generate_graph(poll_id, participants, k=2)
+    metrics = graph_service.get_graph_metrics(poll_id)
+    assert graph_service.get_graph_metrics(poll_id) is metrics
+    
+    graph_service.get_or_generate_graph(poll_id, participants + ["user5"], k=2)
+    assert graph_service.get_graph_metrics(poll_id)["num_nodes"] == 5
+    
+    graph_service.invalidate_graph(poll_id)
+    assert "error" in graph_service.get_graph_metrics(poll_id)
@@ -9,6 +9,7 @@ from app.utils.graph_utils import (
     generate_ideal_graph,
     validate_graph_properties,
     get_user_neighbors,
+    graph_to_csr,
     calculate_graph_metrics
 )
 
@@ -170,6 +171,31 @@ def test_get_user_neighbors():
     assert neighbors == set()
 
 
+def test_graph_to_csr():
+    """CSR arrays index sorted nodes and round-trip to the adjacency list."""
+    graph = {
+        "C": {"A", "B"},
+        "A": {"C"},
+        "B": {"C", "D"},
+        "D": {"B"}
+    }
+    
+    csr = graph_to_csr(graph)
+    
+    assert csr == {
+        "nodes": ["A", "B", "C", "D"],
+        "offsets": [0, 1, 3, 5, 6],
+        "neighbors": [2, 2, 3, 0, 1, 1]
+    }
+    nodes, offsets, neighbors = csr["nodes"], csr["offsets"], csr["neighbors"]
+    rebuilt = {
+        node: {nodes[j] for j in neighbors[offsets[i]:offsets[i + 1]]}
+        for i, node in enumerate(nodes)
+    }
+    assert rebuilt == graph
+    assert graph_to_csr({}) == {"nodes": [], "offsets": [0], "neighbors": []}
+
+
 def test_calculate_graph_metrics():
     """Test graph metrics calculation."""
     graph = {
@@ -215,7 +215,7 @@ def test_full_poll_lifecycle():
                 "user2": {"user1"}
             }
         )
-        mock_poll_service.record_vote.return_value = poll_with_vote1
+        mock_poll_service.record_vote_async = AsyncMock(return_value=poll_with_vote1)
         
         vote1_response = client.post(
             "/polls/test-poll-id/vote",
@@ -249,7 +249,7 @@ def test_full_poll_lifecycle():
                 "user2": {"user1"}
             }
         )
-        mock_poll_service.record_vote.return_value = poll_with_vote2
+        mock_poll_service.record_vote_async = AsyncMock(return_value=poll_with_vote2)
         
         vote2_response = client.post(
             "/polls/test-poll-id/vote",
@@ -0,0 +1,35 @@
+"""
+Route tests for the parameter calculation endpoints.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_calculate_applies_custom_constraints():
+    """Custom constraints override the security level's base values."""
+    response = client.post(
+        "/api/parameters/calculate",
+        params={"m": 100, "security_level": "medium"},
+        json={"kappa": 50, "eta_v": 0.02}
+    )
+
+    assert response.status_code == 200
+    parameters = response.json()["parameters"]
+    assert parameters["kappa"] == 50
+    assert parameters["eta_v"] == 0.02
+
+
+def test_calculate_ignores_unhashable_unused_constraints():
+    """Unrelated list or dict values don't break the memoized calculation."""
+    response = client.post(
+        "/api/parameters/calculate",
+        params={"m": 100, "security_level": "medium"},
+        json={"kappa": 50, "notes": ["a", "b"], "meta": {"source": "ui"}}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["parameters"]["kappa"] == 50
@@ -154,6 +154,12 @@ class TestParameterValidator:
         if result.valid:
             assert len(result.warnings) > 0
     
+    def test_validation_memoized_for_equal_params(self, validator, valid_params):
+        """Equal parameter sets reuse the same validation result."""
+        same_params = ParameterConstraints(m=1000, d=60, kappa=40, eta_v=0.025, eta_e=0.125)
+        
+        assert validator.validate_all(valid_params) is validator.validate_all(same_params)
+    
     def test_security_metrics_calculation(self, validator, valid_params):
         """Test that security metrics are calculated."""
         result = validator.validate_all(valid_params)
@@ -101,3 +101,103 @@ async def test_record_vote_with_signature_check(monkeypatch, event_loop):
         assert False, 'Expected ValueError for duplicate vote'
     except ValueError:
         pass
+
+
+@pytest.mark.asyncio
+async def test_record_vote_async_rejects_concurrent_duplicate(monkeypatch):
+    # Both requests pass the eligibility checks before either signature
+    # check finishes; the poll lock must make the second one see the first vote
+    monkeypatch.setattr('app.services.poll_service.verify_signature', lambda pk, m, s: s == 'validsig')
+    monkeypatch.setattr('app.services.connection_manager.ConnectionManager.broadcast_to_poll', AsyncMock())
+
+    ps = PollService()
+    poll = ps.create_poll(PollCreate(question='Q3?', options=['X', 'Y']))
+    pk = {'kty': 'EC', 'x': 'ghi', 'y': 'jkl'}
+    await ps.add_registrant(poll.id, pk)
+    user_id = get_user_id(pk)
+    poll.add_verification('verifier1', user_id)
+    poll.add_verification('verifier2', user_id)
+
+    vote = Vote(publicKey=pk, option='Y', signature='validsig')
+    results = await asyncio.gather(
+        ps.record_vote_async(poll.id, vote),
+        ps.record_vote_async(poll.id, vote),
+        return_exceptions=True
+    )
+
+    assert sum(result is poll for result in results) == 1
+    assert sum(isinstance(result, ValueError) for result in results) == 1
+    assert poll.votes[user_id].option == 'Y'
+
+
+@pytest.mark.asyncio
+async def test_broadcast_task_is_held_until_done(monkeypatch):
+    # Detached broadcasts must stay referenced, or the loop may drop them mid-send
+    sent = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_broadcast(self, message, poll_id):
+        sent.set()
+        await release.wait()
+
+    monkeypatch.setattr('app.services.connection_manager.ConnectionManager.broadcast_to_poll', slow_broadcast)
+
+    ps = PollService()
+    poll = ps.create_poll(PollCreate(question='Q4?', options=['X', 'Y']))
+    poll.registrants = {'alice': {}, 'bob': {}}
+
+    ps.verify_user(poll.id, 'alice', 'bob')
+    assert len(ps._broadcast_tasks) == 1
+
+    await sent.wait()
+    release.set()
+    await asyncio.gather(*ps._broadcast_tasks)
+    assert not ps._broadcast_tasks
+
+
+def test_record_ppe_certifications_is_all_or_nothing():
+    ps = PollService()
+    poll = ps.create_poll(PollCreate(question='Q5?', options=['X', 'Y']))
+    poll.registrants = {'alice': {}, 'bob': {}, 'carol': {}}
+    version = poll.version
+
+    with pytest.raises(ValueError):
+        ps.record_ppe_certifications(poll.id, [('alice', 'bob'), ('carol', 'mallory')])
+    assert poll.ppe_certifications == {}
+    assert poll.version == version
+
+    with patch('asyncio.create_task') as mock_create_task:
+        ps.record_ppe_certifications(poll.id, [('alice', 'bob'), ('bob', 'carol')])
+        assert mock_create_task.call_count == 1
+
+    assert poll.get_ppe_certifications('bob') == {'alice', 'carol'}
+    assert poll.version == version + 1
+    assert ps.record_ppe_certifications('missing', []) is None
+
+
+def test_poll_model_has_single_definition():
+    # Routes and the service must share the one Poll model that tracks PPE certifications
+    from app.models import poll as poll_models
+    from app.routes import polls as poll_routes
+    from app.services import poll_service as poll_service_module
+
+    assert poll_routes.Poll is poll_service_module.Poll is poll_models.Poll
+    assert poll_routes.Vote is poll_service_module.Vote is poll_models.Vote
+    assert hasattr(poll_models.Poll, 'add_ppe_certification')
+    assert 'ppe_certifications' in poll_models.Poll.model_fields
+
+
+def test_get_user_id_matches_sorted_json_hash():
+    # The memoized path must keep producing the original canonical-JSON digest
+    import hashlib
+    jwks = [
+        {"kty": "EC", "crv": "P-256", "x": "abc", "y": "def", "ext": True, "key_ops": ["verify"]},
+        {"y": "def", "x": "abc", "kty": "EC", "crv": "P-256"},
+        {"a": 1},
+        {"a": True},
+        {1: "non-string key"},
+    ]
+    for jwk in jwks:
+        expected = hashlib.sha256(json.dumps(jwk, sort_keys=True).encode()).hexdigest()
+        assert get_user_id(jwk) == expected
+        assert get_user_id(dict(jwk)) == expected
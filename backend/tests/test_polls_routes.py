@@ -50,7 +50,7 @@ def mock_poll_service():
         mock_service.get_poll.return_value = poll
         mock_service.list_polls.return_value = [poll]
         mock_service.add_vote.return_value = poll
-        mock_service.record_vote.return_value = poll
+        mock_service.record_vote_async = AsyncMock(return_value=poll)
         
         # For verify_poll_integrity testing
         verification_result = {
@@ -166,7 +166,7 @@ def test_vote_on_poll(mock_poll_service, mock_connection_manager):
     }
     
     # Configure the mock to properly handle the vote
-    mock_poll_service.record_vote.return_value = Poll(
+    mock_poll_service.record_vote_async.return_value = Poll(
         id="test-poll-id",
         question="Test Question",
         options=["Option 1", "Option 2"],
@@ -179,8 +179,8 @@ def test_vote_on_poll(mock_poll_service, mock_connection_manager):
     )
     assert response.status_code == 200
     
-    # Verify that record_vote was called with correct parameters
-    mock_poll_service.record_vote.assert_called_once_with("test-poll-id", Vote(**vote_data))
+    # Verify that record_vote_async was called with correct parameters
+    mock_poll_service.record_vote_async.assert_called_once_with("test-poll-id", Vote(**vote_data))
 
 def test_verify_poll(mock_poll_service):
     """Test verifying a poll's integrity"""
@@ -214,7 +214,7 @@ async def test_broadcast_after_vote(mock_poll_service, mock_connection_manager):
     }
     
     # Configure the mock to return properly
-    mock_poll_service.record_vote.return_value = Poll(
+    mock_poll_service.record_vote_async.return_value = Poll(
         id="test-poll-id",
         question="Test Question",
         options=["Option 1", "Option 2"],
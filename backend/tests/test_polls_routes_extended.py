@@ -27,7 +27,7 @@ def mock_poll_service():
         mock_service.get_poll.return_value = poll
         mock_service.get_all_polls.return_value = [poll]
         mock_service.verify_user.return_value = poll
-        mock_service.record_vote.return_value = poll
+        mock_service.record_vote_async = AsyncMock(return_value=poll)
         mock_service.add_registrant = AsyncMock(return_value=poll)
         
         # For verify_poll_integrity testing
@@ -192,6 +192,26 @@ def test_record_ppe_certification_missing_field(mock_poll_service):
     assert "detail" in response.json()
     assert "Missing required field" in response.json()["detail"]
 
+def test_record_ppe_certification_rejects_oversized_key(mock_poll_service):
+    """Oversized or nested public keys are rejected before any hashing"""
+    for bad_key in (
+        {"kty": "EC", "x": "a" * 5000},
+        {f"member{i}": "v" for i in range(100)},
+        {"kty": "EC", "nested": {"deep": ["x"]}},
+        "not-an-object",
+    ):
+        certification_data = {
+            "user1_public_key": {"kty": "EC", "crv": "P-256", "key_ops": ["verify"], "ext": True},
+            "user2_public_key": bad_key
+        }
+        
+        response = client.post("/polls/test-poll-id/ppe-certification", json=certification_data)
+        
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid public key"
+    
+    mock_poll_service.record_ppe_certification.assert_not_called()
+
 def test_record_ppe_certification_poll_not_found(mock_poll_service):
     """Test recording a PPE certification for a non-existent poll"""
     # Configure mock to return None for the poll
@@ -208,4 +228,59 @@ def test_record_ppe_certification_poll_not_found(mock_poll_service):
     
     # Check the response - should be 404
     assert response.status_code == 404
-    assert "detail" in response.json()
\ No newline at end of file
+    assert "detail" in response.json()
+
+
+def test_record_ppe_certifications_batch(mock_poll_service):
+    """A batch is checked and hashed up front, then recorded in one service call"""
+    edges = [
+        {"user1_public_key": {"key": f"a{i}"}, "user2_public_key": {"key": f"b{i}"}}
+        for i in range(3)
+    ]
+    
+    response = client.post("/polls/test-poll-id/ppe-certifications/batch", json={"edges": edges})
+    
+    assert response.status_code == 200
+    assert response.json()["recorded"] == 3
+    mock_poll_service.record_ppe_certifications.assert_called_once_with(
+        "test-poll-id", [("mocked-user-id", "mocked-user-id")] * 3
+    )
+
+
+def test_record_ppe_certifications_batch_rejects_bad_edges(mock_poll_service):
+    """Malformed, missing or oversized batches are a 400 and record nothing"""
+    good = {"user1_public_key": {"key": "a"}, "user2_public_key": {"key": "b"}}
+    for body in (
+        {},
+        {"edges": "not-a-list"},
+        {"edges": [good, {"user1_public_key": {"key": "a"}}]},
+        {"edges": [good, {"user1_public_key": {"key": "a"}, "user2_public_key": {"x": "y" * 5000}}]},
+        {"edges": [good] * 1001},
+    ):
+        response = client.post("/polls/test-poll-id/ppe-certifications/batch", json=body)
+        assert response.status_code == 400
+    
+    mock_poll_service.record_ppe_certifications.assert_not_called()
+    
+    mock_poll_service.record_ppe_certifications.return_value = None
+    response = client.post("/polls/missing/ppe-certifications/batch", json={"edges": [good]})
+    assert response.status_code == 404
+
+
+def test_get_poll_body_cached_per_version(mock_poll_service):
+    """The serialized poll is reused until the poll's version is bumped"""
+    poll = mock_poll_service.get_poll.return_value
+    
+    first = client.get(f"/polls/{poll.id}")
+    assert first.status_code == 200
+    assert first.json() == json.loads(poll.model_dump_json(by_alias=True))
+    
+    with patch.object(Poll, "model_dump_json", side_effect=AssertionError("re-serialized")):
+        assert client.get(f"/polls/{poll.id}").content == first.content
+        assert client.get("/polls/").json() == [first.json()]
+    
+    poll.add_registrant("user3", {"key": "public-key-3"})
+    poll.bump_version()
+    
+    response = client.get(f"/polls/{poll.id}")
+    assert "user3" in response.json()["registrants"]
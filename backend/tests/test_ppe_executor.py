@@ -0,0 +1,65 @@
+"""
+Tests for the PPE executor.
+"""
+
+import pytest
+from datetime import datetime
+
+from app.models.ppe_types import PPEExecution, PPEType, PPEDifficulty
+from app.services.ppe_executor import PPEExecutor
+
+
+def test_active_ppe_summaries_match_to_dict(test_db):
+    """Column-projected summaries carry the same data as PPEExecution.to_dict()."""
+    for i, status in enumerate(["pending", "in_progress", "completed"]):
+        test_db.add(PPEExecution(
+            id=f"exec_{i}",
+            poll_id="poll_1",
+            prover_id="user_1",
+            verifier_id=f"user_{i + 2}",
+            ppe_type=PPEType.COMPUTATIONAL,
+            difficulty=PPEDifficulty.EASY,
+            status=status,
+            started_at=datetime(2024, 1, 1, 12, 0, i)
+        ))
+    test_db.commit()
+
+    executor = PPEExecutor(test_db)
+    summaries = executor.get_active_ppe_summaries("user_1", "poll_1")
+    expected = [execution.to_dict() for execution in executor.get_active_ppes("user_1", "poll_1")]
+
+    assert len(summaries) == 2
+    for summary in summaries:
+        summary["started_at"] = summary["started_at"].isoformat()
+    assert sorted(summaries, key=lambda s: s["id"]) == sorted(expected, key=lambda s: s["id"])
+
+
+def test_ppe_instances_are_shared(test_db):
+    """Protocol implementations are reused per (type, difficulty)."""
+    first = PPEExecutor(test_db)._create_ppe_instance(PPEType.COMPUTATIONAL, PPEDifficulty.EASY)
+    second = PPEExecutor(test_db)._create_ppe_instance(PPEType.COMPUTATIONAL, PPEDifficulty.EASY)
+
+    assert first is second
+
+    with pytest.raises(ValueError):
+        PPEExecutor(test_db)._create_ppe_instance("unknown", PPEDifficulty.EASY)
+
+
+def test_allowed_certification_types_round_trip_as_mask(test_db):
+    """Allowed PPE types are stored as a bitmask and read back as a list."""
+    from app.models.ppe_types import PPEConfig
+
+    test_db.add(PPEConfig(
+        poll_id="poll_1",
+        allowed_certification_types=[PPEType.COMPUTATIONAL, PPEType.SYMMETRIC_CAPTCHA]
+    ))
+    test_db.commit()
+    test_db.expire_all()
+
+    config = test_db.query(PPEConfig).filter_by(poll_id="poll_1").one()
+    assert config.allowed_certification_types == ["symmetric_captcha", "computational"]
+    assert config.to_dict()["allowed_certification_types"] == ["symmetric_captcha", "computational"]
+    assert config.is_allowed(PPEType.COMPUTATIONAL)
+    assert config.is_allowed("symmetric_captcha")
+    assert not config.is_allowed(PPEType.PROOF_OF_STORAGE)
+    assert not config.is_allowed("unknown")
@@ -4,7 +4,7 @@ Tests for PPE factory system.
 
 import pytest
 from app.ppe.factory import PPEFactory
-from app.ppe.base import BasePPE, PPEType, PPEDifficulty
+from app.ppe.base import BasePPE, PPEType, PPEDifficulty, PPEMetadata
 from app.ppe.symmetric_captcha import SymmetricCaptchaPPE
 
 
@@ -18,6 +18,56 @@ def test_factory_builtin_registration():
     assert PPEType.SYMMETRIC_CAPTCHA.value in available
 
 
+def test_available_types_cached_until_register():
+    """Test that available types are reused until a new type is registered."""
+    factory = PPEFactory()
+    
+    available = factory.get_available_types()
+    assert factory.get_available_types() is available
+    
+    factory.register(
+        SymmetricCaptchaPPE,
+        PPEMetadata(
+            ppe_type=PPEType.SYMMETRIC_CAPTCHA,
+            name="Renamed CAPTCHA",
+            description="Re-registered",
+            requires_human=True
+        )
+    )
+    refreshed = factory.get_available_types()
+    assert refreshed is not available
+    assert refreshed[PPEType.SYMMETRIC_CAPTCHA.value]["name"] == "Renamed CAPTCHA"
+
+
+def test_shared_instances_reused_until_register():
+    """Test that shared instances are per (type, difficulty) and replaced on register."""
+    factory = PPEFactory()
+    
+    shared = factory.get_shared(PPEType.SYMMETRIC_CAPTCHA, PPEDifficulty.HARD)
+    assert shared.difficulty == PPEDifficulty.HARD
+    assert factory.get_shared(PPEType.SYMMETRIC_CAPTCHA, PPEDifficulty.HARD) is shared
+    assert factory.get_shared(PPEType.SYMMETRIC_CAPTCHA, PPEDifficulty.EASY) is not shared
+    
+    class CustomCaptchaPPE(SymmetricCaptchaPPE):
+        pass
+    
+    factory.register(
+        CustomCaptchaPPE,
+        PPEMetadata(
+            ppe_type=PPEType.SYMMETRIC_CAPTCHA,
+            name="Custom CAPTCHA",
+            description="Re-registered",
+            requires_human=True
+        )
+    )
+    assert isinstance(
+        factory.get_shared(PPEType.SYMMETRIC_CAPTCHA, PPEDifficulty.HARD), CustomCaptchaPPE
+    )
+    
+    with pytest.raises(ValueError):
+        factory.get_shared(PPEType.PROOF_OF_WORK)
+
+
 def test_factory_create_instance():
     """Test creating PPE instances."""
     factory = PPEFactory()
@@ -69,6 +119,19 @@ def test_symmetric_captcha_deterministic():
     assert solution1 == solution2
 
 
+def test_symmetric_captcha_leaves_global_random_alone():
+    """Test that challenge generation doesn't reseed the random module."""
+    import random
+    ppe = SymmetricCaptchaPPE(PPEDifficulty.MEDIUM)
+    
+    random.seed(1234)
+    expected = random.random()
+    
+    random.seed(1234)
+    ppe.generate_challenge_with_secret("secret", "session")
+    assert random.random() == expected
+
+
 def test_symmetric_captcha_different_secrets():
     """Test that different secrets produce different challenges."""
     ppe = SymmetricCaptchaPPE(PPEDifficulty.MEDIUM)
@@ -2,7 +2,9 @@
 Tests for PPE service.
 """
 
+import heapq
 import pytest
+from datetime import datetime, timedelta
 from app.services.ppe_service import PPEService, PPEState
 
 
@@ -63,4 +65,38 @@ def test_both_users_reached_state(service):
     assert not session.both_users_reached_state(PPEState.CHALLENGE_SENT)
     
     session.set_user_state("user2", PPEState.CHALLENGE_SENT)
-    assert session.both_users_reached_state(PPEState.CHALLENGE_SENT)
\ No newline at end of file
+    assert session.both_users_reached_state(PPEState.CHALLENGE_SENT)
+
+
+def test_expired_sessions_evicted_on_create(service):
+    """Creating a session evicts expired ones and frees their poll slots."""
+    stale = service.create_session("user1", "user2", "poll1", "session1")
+    service.create_session("user3", "user4", "poll1", "session2")
+    stale.expires_at = datetime.now() - timedelta(seconds=1)
+    # Re-sort the heap as if session1 had been created with that expiry
+    service._expiry_heap = [(s.expires_at, s.session_id) for s in service._sessions.values()]
+    heapq.heapify(service._expiry_heap)
+    
+    service.create_session("user5", "user6", "poll2", "session3")
+    
+    assert service.get_session("session1") is None
+    assert service.get_session("session2") is not None
+    assert service._poll_session_counts == {"poll1": 1, "poll2": 1}
+
+
+def test_sessions_per_poll_are_capped(service, monkeypatch):
+    """A poll can't hold more than MAX_SESSIONS_PER_POLL live sessions."""
+    monkeypatch.setattr(PPEService, "MAX_SESSIONS_PER_POLL", 2)
+    service.create_session("user1", "user2", "poll1", "session1")
+    service.create_session("user1", "user3", "poll1", "session2")
+    
+    with pytest.raises(ValueError):
+        service.create_session("user1", "user4", "poll1", "session3")
+    
+    # Recreating an existing session and other polls are unaffected
+    service.create_session("user1", "user2", "poll1", "session1")
+    service.create_session("user1", "user4", "poll2", "session3")
+    
+    service.remove_session("session2")
+    service.create_session("user1", "user4", "poll1", "session4")
+    assert service._poll_session_counts == {"poll1": 2, "poll2": 1}
@@ -143,6 +143,24 @@ def test_exportable_dict(sample_poll):
     assert "vote_tally" in export_dict
 
 
+def test_iter_export_json_matches_exportable_dict(sample_poll, monkeypatch):
+    """Streamed export chunks join to the exportable dict plus extras."""
+    import orjson
+    import app.services.proof_graph_service as proof_graph_module
+    
+    # Force several batches per collection
+    monkeypatch.setattr(proof_graph_module, "_EXPORT_BATCH_SIZE", 2)
+    service = ProofGraphService()
+    proof_graph = service.construct_proof_graph(sample_poll)
+    extra = {"verification_instructions": {"steps": ["1. Verify"]}}
+    
+    body = b"".join(service.iter_export_json(proof_graph, extra))
+    
+    expected = {**proof_graph.to_exportable_dict(), **extra}
+    assert body == orjson.dumps(expected)
+    assert len(proof_graph.certifications) > 2
+
+
 def test_proof_graph_caching(sample_poll):
     """Test proof graph caching."""
     service = ProofGraphService()
@@ -319,4 +337,158 @@ def test_canonical_hash_ordering():
     graph2 = service.construct_proof_graph(poll2)
     
     # Should have same hash due to canonical ordering
-    assert graph1.graph_hash == graph2.graph_hash
\ No newline at end of file
+    assert graph1.graph_hash == graph2.graph_hash
+
+
+def test_hash_tracks_item_changes(sample_poll):
+    """Test that cached leaf digests never hide a change to an item."""
+    service = ProofGraphService()
+    proof_graph = service.construct_proof_graph(sample_poll)
+    original_hash = proof_graph.graph_hash
+    
+    # Items are frozen; a changed copy gets its own digest
+    with pytest.raises(Exception):
+        proof_graph.votes[0].option = "Option B"
+    
+    original_vote = proof_graph.votes[0]
+    proof_graph.votes[0] = original_vote.model_copy(update={"option": "Option B"})
+    assert proof_graph.compute_hash() != original_hash
+    assert not proof_graph.verify_hash()
+    
+    proof_graph.votes[0] = original_vote
+    assert proof_graph.compute_hash() == original_hash
+    
+    # In-place edits to nested values are caught by verify_hash's full rehash
+    proof_graph.participants[0].public_key["x"] = "tampered"
+    assert not proof_graph.verify_hash()
+
+
+def test_hash_rejects_duplicated_last_vote(sample_poll):
+    """Test that repeating the last of an odd number of votes changes the hash."""
+    from app.models.poll import Vote
+    sample_poll.votes["user3"] = Vote(
+        publicKey={"kty": "EC", "x": "x3", "y": "y3"},
+        option="Option A",
+        signature="sig3"
+    )
+    service = ProofGraphService()
+    proof_graph = service.construct_proof_graph(sample_poll)
+    
+    # With odd-leaf duplication, [v1, v2, v3, v3] would hash like [v1, v2, v3]
+    proof_graph.votes.append(proof_graph.votes[-1].model_copy())
+    
+    assert not proof_graph.verify_hash()
+
+
+def test_hash_follows_list_edits_after_hashing(sample_poll):
+    """Test that sorted views are rebuilt when the collections are edited."""
+    service = ProofGraphService()
+    proof_graph = service.construct_proof_graph(sample_poll)
+    original_hash = proof_graph.graph_hash
+    
+    # Reordering is not a change
+    proof_graph.participants.reverse()
+    assert proof_graph.compute_hash() == original_hash
+    
+    removed = proof_graph.participants.pop()
+    assert proof_graph.compute_hash() != original_hash
+    
+    proof_graph.participants.insert(0, removed)
+    assert proof_graph.compute_hash() == original_hash
+
+
+def test_streaming_merkle_root_matches_level_pairing():
+    """Test that the streaming Merkle root equals level-by-level pairing."""
+    import hashlib
+    from app.models.proof_graph import _merkle_root, _node_hash
+    
+    def level_root(leaves):
+        level = list(leaves)
+        while len(level) > 1:
+            paired = [_node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                paired.append(level[-1])
+            level = paired
+        return level[0]
+    
+    for n in range(1, 40):
+        leaves = [hashlib.sha256(str(i).encode()).digest() for i in range(n)]
+        assert _merkle_root(iter(leaves)) == level_root(leaves)
+    
+    assert _merkle_root(iter([])) == hashlib.sha256(b"").digest()
+
+
+def test_items_reject_unknown_fields():
+    """Test that proof graph items don't silently drop unhashed fields."""
+    from pydantic import ValidationError
+    
+    with pytest.raises(ValidationError):
+        VoteRecord(
+            user_id="user1", public_key={}, option="Option A",
+            signature="sig1", weight=2
+        )
+
+
+def test_items_require_to_dict():
+    """Test that a proof graph item without to_dict can't be built."""
+    from app.models.proof_graph import _MerkleLeaf
+    
+    class UnhashedItem(_MerkleLeaf):
+        user_id: str
+    
+    with pytest.raises(TypeError):
+        UnhashedItem(user_id="user1")
+
+
+def test_verified_json_reused_until_graph_changes(sample_poll, monkeypatch):
+    """The graph is verified and serialized once until a new graph is built."""
+    service = ProofGraphService()
+    proof_graph = service.construct_proof_graph(sample_poll)
+    
+    body = service.get_verified_json(proof_graph)
+    assert body is not None
+    
+    monkeypatch.setattr(ProofGraph, "verify_hash", lambda self: pytest.fail("re-verified"))
+    assert service.get_verified_json(proof_graph) is body
+    monkeypatch.undo()
+    
+    service.invalidate_proof_graph(sample_poll.id)
+    rebuilt = service.construct_proof_graph(sample_poll)
+    assert service.get_verified_json(rebuilt) is not body
+    
+    rebuilt.graph_hash = "tampered"
+    assert service.get_verified_json(rebuilt) is None
+
+
+def test_verify_hash_endpoint_rehashes_once(sample_poll, monkeypatch):
+    """The endpoint's is_valid and computed_hash come from one full rehash."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.services.poll_service import _polls_db
+    from app.services.proof_graph_service import proof_graph_service
+    
+    _polls_db[sample_poll.id] = sample_poll
+    proof_graph_service.invalidate_proof_graph(sample_poll.id)
+    proof_graph = proof_graph_service.get_or_construct_proof_graph(sample_poll)
+    
+    # A nested in-place edit is invisible to the cached roots
+    proof_graph.participants[0].public_key["x"] = "tampered"
+    
+    calls = []
+    compute_hash = ProofGraph.compute_hash
+    
+    def counting_compute_hash(self, use_cache=True):
+        calls.append(use_cache)
+        return compute_hash(self, use_cache)
+    
+    monkeypatch.setattr(ProofGraph, "compute_hash", counting_compute_hash)
+    
+    result = TestClient(app).get(f"/polls/{sample_poll.id}/proof/verify-hash").json()
+    
+    assert calls == [False]
+    assert result["is_valid"] is False
+    assert result["match"] is False
+    assert result["computed_hash"] != result["stored_hash"]
+    
+    proof_graph_service.invalidate_proof_graph(sample_poll.id)
+    _polls_db.pop(sample_poll.id)
@@ -66,6 +66,19 @@ def test_websocket_endpoint_existence():
     # Just ensure it's not a server error
     assert response.status_code < 500
 
+@pytest.mark.sanity
+def test_routers_registered_once():
+    """Test that no router or route is registered twice on the app"""
+    # Newer FastAPI wraps each included router instead of copying its routes
+    included = [r.original_router for r in app.routes if hasattr(r, "original_router")]
+    assert len({id(router) for router in included}) == len(included)
+    
+    routes = [
+        (r.path, frozenset(getattr(r, "methods", None) or ()))
+        for r in app.routes if hasattr(r, "path")
+    ]
+    assert len(set(routes)) == len(routes)
+
 @pytest.mark.sanity
 def test_basic_poll_creation():
     """
@@ -153,4 +166,32 @@ def test_full_basic_poll_flow():
     
     # As a sanity test, we won't try to vote since that requires real cryptographic signatures
     # Just check that the poll verification endpoint works
-    assert "verification" in verify_response.json()
\ No newline at end of file
+    assert "verification" in verify_response.json()
+
+
+@pytest.mark.sanity
+def test_cors_preflight_matches_cors_middleware():
+    """Test that the fast preflight path answers like CORSMiddleware does"""
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+    
+    reference = FastAPI()
+    reference.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
+    headers = {
+        "Origin": "http://localhost:3000",
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "content-type, x-token",
+    }
+    response = client.options("/polls/", headers=headers)
+    expected = TestClient(reference).options("/polls/", headers=headers)
+    
+    assert response.status_code == expected.status_code == 200
+    assert response.text == expected.text
+    assert dict(response.headers) == dict(expected.headers)
@@ -127,7 +127,7 @@ def test_high_volume_votes():
             poll.votes[user_id] = vote
             return poll
         
-        mock_poll_service.record_vote.side_effect = record_vote_side_effect
+        mock_poll_service.record_vote_async = AsyncMock(side_effect=record_vote_side_effect)
         
         # Add a high volume of votes
         num_votes = 50  # Reduced from 100 to speed up the test
@@ -210,10 +210,10 @@ def test_verification_performance():
                 
                 # Update verifications based on PPE certifications
                 if user_id in poll.verifications:
-                    poll.verifications[user_id].has_verified = certifies
+                    poll.verifications[user_id].has_verified = tuple(certifies)
                 for child_id in certifies:
                     if child_id in poll.verifications:
-                        poll.verifications[child_id].verified_by.add(user_id)
+                        poll.verifications[child_id].add_verified_by(user_id)
             
             mock_poll_service.get_poll.return_value = poll
             
@@ -207,6 +207,17 @@ class TestSpectralAnalysisIntegration:
         assert lambda_2_values["poor_expansion"] < lambda_2_values["medium_expansion"]
         assert lambda_2_values["medium_expansion"] < lambda_2_values["good_expansion"]
 
+    
+    def test_csr_adjacency_matches_networkx(self):
+        """Spectral gap from a precomputed CSR adjacency matches the NetworkX path"""
+        graph = nx.random_regular_graph(d=4, n=150, seed=7)
+        adjacency = nx.to_scipy_sparse_array(graph, nodelist=list(graph.nodes()), format="csr")
+        
+        expected = SpectralAnalyzer(graph).compute_spectral_gap()
+        result = SpectralAnalyzer(graph, adjacency=adjacency).compute_spectral_gap()
+        
+        assert result.lambda_2 == pytest.approx(expected.lambda_2, abs=1e-6)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
@@ -5,27 +5,14 @@ CRITICAL for Issue #7.
 
 import pytest
 from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
 from unittest.mock import Mock
 
-from app.database import Base
 from app.services.state_machine import StateMachine, PollPhase, UserState
 from app.models.user import Poll, User
 from app.models.certification_state import CertificationState
 
 
-@pytest.fixture
-def test_db():
-    """Create in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-    yield session
-    session.close()
-
-
 @pytest.fixture
 def sample_poll(test_db):
     """Create a sample poll in certification phase."""
@@ -210,6 +197,34 @@ class TestStateMachine:
         ).all()
         assert len(cert_states) == 5
     
+    def test_transition_to_certification_query_count(self, test_db, sample_poll):
+        """Existing states are loaded in bulk, not queried per user."""
+        state_machine = StateMachine(test_db)
+        
+        for i in range(20):
+            test_db.add(User(id=f"user_{i}", poll_id=sample_poll.id, registration_order=i))
+        test_db.add(CertificationState(user_id="user_0", poll_id=sample_poll.id, state="certifying"))
+        sample_poll.phase = PollPhase.REGISTRATION
+        test_db.commit()
+        
+        selects = []
+        
+        def count_selects(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+        
+        engine = test_db.get_bind()
+        event.listen(engine, "before_cursor_execute", count_selects)
+        try:
+            assert state_machine.transition_to_certification(sample_poll.id) == 20
+        finally:
+            event.remove(engine, "before_cursor_execute", count_selects)
+        
+        assert len(selects) <= 4
+        states = {s.user_id: s for s in test_db.query(CertificationState).filter_by(poll_id=sample_poll.id)}
+        assert len(states) == 20
+        assert states["user_0"].state == "certifying"
+    
     def test_record_vote_success(self, test_db, sample_poll, certified_user):
         """Test recording a vote works."""
         sample_poll.phase = PollPhase.VOTING
@@ -228,6 +243,23 @@ class TestStateMachine:
         assert cert_state.has_voted is True
         assert cert_state.voted_at is not None
     
+    def test_record_vote_without_commit(self, test_db, sample_poll, certified_user):
+        """Test record_vote(commit=False) leaves the caller's transaction open."""
+        sample_poll.phase = PollPhase.VOTING
+        test_db.commit()
+        
+        state_machine = StateMachine(test_db)
+        success = state_machine.record_vote(certified_user.id, sample_poll.id, commit=False)
+        assert success is True
+        
+        test_db.rollback()
+        
+        cert_state = test_db.query(CertificationState).filter_by(
+            user_id=certified_user.id,
+            poll_id=sample_poll.id
+        ).first()
+        assert cert_state.has_voted is False
+    
     def test_get_user_state_detailed(self, test_db, sample_poll, certified_user):
         """Test getting detailed user state."""
         sample_poll.phase = PollPhase.VOTING
@@ -136,6 +136,20 @@ class TestVerificationFunctionality:
         assert verification_result["is_valid"] == False
         assert "fewer than 2 PPE certifications" in verification_result["verification_message"]
     
+    def test_user_verification_views_follow_reassignment(self):
+        """Reassigning a verifier tuple refreshes its cached set view"""
+        verification = UserVerification()
+        verification.add_verified_by("user1")
+        assert verification.verified_by_set == {"user1"}
+        
+        verification.verified_by = ("user2",)
+        verification.has_verified = ("user3",)
+        
+        assert verification.verified_by_set == {"user2"}
+        assert verification.has_verified_set == {"user3"}
+        verification.add_verified_by("user1")
+        assert verification.verified_by == ("user2", "user1")
+    
     def test_generate_verification_message(self):
         """Test the _generate_verification_message method"""
         # Test successful verification message
@@ -131,4 +131,42 @@ class TestVerificationAPI:
         
         verification = data["verification"]
         assert "user4" in verification["unauthorized_votes"]
-        assert verification["is_valid"] == False
\ No newline at end of file
+        assert verification["is_valid"] == False
+    
+    def test_get_poll_verification_data_etag(self, setup_test_poll):
+        """Repeat requests get a 304 until the poll's version is bumped"""
+        poll = setup_test_poll
+        
+        response = client.get(f"/polls/{poll.id}/verify")
+        etag = response.headers["etag"]
+        assert response.status_code == 200
+        
+        response = client.get(f"/polls/{poll.id}/verify", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        
+        # What PollService does on every mutation
+        poll.add_ppe_certification("user1", "user4")
+        poll.bump_version()
+        
+        response = client.get(f"/polls/{poll.id}/verify", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        edges = response.json()["certification_graph"]["edges"]
+        assert {"source": "user1", "target": "user4", "type": "ppe_certification"} in edges
+    
+    def test_get_poll_verification_data_gzip(self, setup_test_poll):
+        """Large verification payloads are gzip-compressed for clients that accept it"""
+        poll = setup_test_poll
+        for i in range(200):
+            poll.add_ppe_certification("user1", f"peer_{i}")
+        poll.bump_version()
+        
+        response = client.get(f"/polls/{poll.id}/verify", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < len(response.content)
+        assert len(response.json()["certification_graph"]["edges"]) >= 200
+        
+        response = client.get(f"/polls/{poll.id}/verify", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
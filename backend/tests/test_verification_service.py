@@ -64,4 +64,49 @@ def test_verify_connected_graph(verification_service, valid_poll):
     result = verification_service.verify_poll_comprehensive(valid_poll)
     
     assert "connectivity" in result.analysis
-    assert result.analysis["connectivity"]["is_connected"]
\ No newline at end of file
+    assert result.analysis["connectivity"]["is_connected"]
+
+
+def test_cached_verification_follows_poll_version(verification_service, valid_poll):
+    """The analysis is reused until the poll's version is bumped."""
+    first = verification_service.get_cached_verification(valid_poll)
+    assert verification_service.get_cached_verification(valid_poll) is first
+    
+    valid_poll.bump_version()
+    second = verification_service.get_cached_verification(valid_poll)
+    assert second is not first
+    assert second.metrics == first.metrics
+
+
+def test_verification_endpoints_share_result_and_etag(valid_poll, monkeypatch):
+    """One analysis serves every verification endpoint; unchanged polls get a 304."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.services.poll_service import _polls_db
+    
+    service = VerificationService()
+    monkeypatch.setattr("app.routes.verification.verification_service", service)
+    monkeypatch.setitem(_polls_db, valid_poll.id, valid_poll)
+    
+    calls = []
+    verify = service.verify_poll_comprehensive
+    monkeypatch.setattr(service, "verify_poll_comprehensive", lambda poll: calls.append(poll.id) or verify(poll))
+    
+    client = TestClient(app)
+    base = f"/polls/{valid_poll.id}/verification"
+    
+    response = client.get(f"{base}/comprehensive")
+    etag = response.headers["etag"]
+    assert response.json()["metrics"]["total_participants"] == 5
+    assert client.get(f"{base}/graph-properties").json()["connectivity"]["is_connected"]
+    assert client.get(f"{base}/statistical-analysis").status_code == 200
+    assert calls == [valid_poll.id]
+    
+    response = client.get(f"{base}/sybil-detection", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    
+    valid_poll.bump_version()
+    response = client.get(f"{base}/vote-validation", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(calls) == 2
@@ -4,27 +4,13 @@ Tests complete flow: Register → Certify → Vote
 """
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
-from app.database import Base
 from app.services.state_machine import StateMachine, PollPhase
 from app.services.ppe_assignment_service import PPEAssignmentService
 from app.models.user import Poll, User
 from app.models.certification_state import CertificationState
 
 
-@pytest.fixture
-def test_db():
-    """Create in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
-    yield session
-    session.close()
-
-
 @pytest.mark.integration
 class TestVotingFlowIntegration:
     
@@ -108,12 +108,121 @@ async def test_websocket_error_handling():
         
         # Verify error handling
         # The exact error message might differ, but the error type should be there
-        calls = websocket.send_json.call_args_list
+        calls = websocket.send_text.call_args_list
         error_call_found = False
         for call in calls:
-            args = call[0][0]
+            args = json.loads(call[0][0])
             if args.get('type') == 'error' and 'invalid' in args.get('error', ''):
                 error_call_found = True
                 break
         
-        assert error_call_found, "No error message was sent to the WebSocket"
\ No newline at end of file
+        assert error_call_found, "No error message was sent to the WebSocket"
+
+
+@pytest.mark.asyncio
+async def test_websocket_relays_ppe_message_as_text():
+    """PPE messages reach the target as a JSON text frame tagged with the sender."""
+    websocket = AsyncMock()
+    target_ws = AsyncMock()
+    poll_id = "test-poll-id"
+    client_id = "test-client-id"
+    
+    with patch('app.routes.ws.manager') as mock_manager:
+        mock_manager.connect = AsyncMock()
+        mock_manager.disconnect = MagicMock()
+        mock_manager.get_connection = MagicMock(return_value=target_ws)
+        
+        websocket.receive_text = AsyncMock(side_effect=[
+            json.dumps({"type": "ppe_challenge", "target": "target-user", "challenge": "c1"}),
+            WebSocketDisconnect(code=1000)
+        ])
+        
+        await websocket_endpoint(websocket, poll_id, client_id)
+        
+        mock_manager.get_connection.assert_called_once_with(poll_id, "target-user")
+        relayed = json.loads(target_ws.send_text.call_args[0][0])
+        assert relayed == {
+            "type": "ppe_challenge",
+            "target": "target-user",
+            "challenge": "c1",
+            "from": client_id
+        }
+        websocket.send_text.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_websocket_dispatches_verification_messages():
+    """Verification requests go to the target's socket; acceptances are broadcast."""
+    websocket = AsyncMock()
+    target_ws = AsyncMock()
+    poll_id = "test-poll-id"
+    client_id = "test-client-id"
+    
+    with patch('app.routes.ws.manager') as mock_manager:
+        mock_manager.connect = AsyncMock()
+        mock_manager.disconnect = MagicMock()
+        mock_manager.send_personal_message = AsyncMock()
+        mock_manager.broadcast_to_poll = AsyncMock()
+        mock_manager.get_connection = MagicMock(return_value=target_ws)
+        
+        websocket.receive_text = AsyncMock(side_effect=[
+            json.dumps({"type": "request_verification", "target": "target-user"}),
+            json.dumps({"type": "accept_verification", "target": "target-user"}),
+            json.dumps({"type": ["not", "a", "string"]}),
+            WebSocketDisconnect(code=1000)
+        ])
+        
+        await websocket_endpoint(websocket, poll_id, client_id)
+        
+        message, sent_to = mock_manager.send_personal_message.call_args[0]
+        assert json.loads(message) == {"type": "verification_requested", "from": client_id}
+        assert sent_to is target_ws
+        
+        message, sent_poll = mock_manager.broadcast_to_poll.call_args[0]
+        assert json.loads(message)["verified"] == "target-user"
+        assert sent_poll == poll_id
+        
+        error = json.loads(websocket.send_text.call_args[0][0])
+        assert error["error"] == "invalid_message"
+
+
+@pytest.mark.asyncio
+async def test_websocket_rejects_non_string_target():
+    """A non-string target is rejected without ending the receive loop."""
+    websocket = AsyncMock()
+    poll_id = "test-poll-id"
+    client_id = "test-client-id"
+    
+    with patch('app.routes.ws.manager') as mock_manager:
+        mock_manager.connect = AsyncMock()
+        mock_manager.disconnect = MagicMock()
+        
+        websocket.receive_text = AsyncMock(side_effect=[
+            json.dumps({"type": "chat", "target": [1]}),
+            WebSocketDisconnect(code=1000)
+        ])
+        
+        await websocket_endpoint(websocket, poll_id, client_id)
+        
+        error = json.loads(websocket.send_text.call_args[0][0])
+        assert error["error"] == "invalid_message"
+        assert websocket.receive_text.call_count == 2
+        mock_manager.disconnect.assert_called_once_with(poll_id, client_id)
+
+
+@pytest.mark.asyncio
+async def test_websocket_disconnects_on_unexpected_error():
+    """An unexpected error still removes the client from the poll's connections."""
+    websocket = AsyncMock()
+    poll_id = "test-poll-id"
+    client_id = "test-client-id"
+    
+    with patch('app.routes.ws.manager') as mock_manager:
+        mock_manager.connect = AsyncMock()
+        mock_manager.disconnect = MagicMock()
+        websocket.receive_text = AsyncMock(side_effect=RuntimeError("socket broke"))
+        
+        with pytest.raises(RuntimeError):
+            await websocket_endpoint(websocket, poll_id, client_id)
+        
+        mock_manager.disconnect.assert_called_once_with(poll_id, client_id)